@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+import re
 import sys
 import shutil
 import subprocess
@@ -64,6 +65,7 @@ class InstallPkg:
         self._no_pip_remove = self._config.no_pip_remove.copy()  # {"pip", "setuptools", "wheel"}
         install_settings = InstallSettings()
         self._no_pip_install = install_settings.no_install_packages.copy()
+        self._wheel_dir = install_settings.wheel_dir
 
     def _get_logger(self) -> OxtLogger:
         return OxtLogger(log_name=__name__)
@@ -113,22 +115,16 @@ class InstallPkg:
             cmd.append(f"--log={log_file}")
         return cmd
 
-    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+    def _get_target_args(self, pkg: str) -> List[str]:
         """
-        Install a package.
+        Gets the pip arguments that set where a package is installed, such as ``--target`` or ``--user``.
 
         Args:
             pkg (str): The name of the package to install.
-            ver (str): The version of the package to install.
-            force (bool): Force install even if package is already installed.
 
         Returns:
-            bool: True if successful, False otherwise.
+            List[str]: The pip arguments.
         """
-        if pkg in self.no_pip_install:
-            self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
-            return True
-
         auto_target = False
         if self.config.auto_install_in_site_packages:
             if self.config.site_packages:
@@ -140,19 +136,56 @@ class InstallPkg:
                 self._logger.debug(
                     "Ignoring auto_install_in_site_packages and continuing to install in user directory via pip --user"
                 )
+
+        if not auto_target and self.config.is_win and len(self.config.isolate_windows) > 0:
+            auto_target = True
+
+        if auto_target:
+            return [f"--target={self._target_path.get_package_target(pkg)}"]
+        if self.config.is_user_installed:
+            return ["--user"]
+        return []
+
+    def _get_find_links_args(self) -> List[str]:
+        """
+        Gets the pip arguments that install from the local wheel directory, see ``InstallSettings.wheel_dir``.
+
+        Without an internet connection the package index is not used.
+
+        Returns:
+            List[str]: The pip arguments or an empty list if there is no wheel directory.
+        """
+        if not self.wheel_dir:
+            return []
+        args = [f"--find-links={self.wheel_dir}"]
+        if not self.is_internet:
+            args.append("--no-index")
+        return args
+
+    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+        """
+        Install a package.
+
+        Args:
+            pkg (str): The name of the package to install.
+            ver (str): The version of the package to install.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if pkg in self.no_pip_install:
+            self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
+            return True
+
         cmd = ["install"]
         if force:
             cmd.append("--force-reinstall")
         elif self.flag_upgrade:
             cmd.append("--upgrade")
 
-        if not auto_target and self.config.is_win and len(self.config.isolate_windows) > 0:
-            auto_target = True
-
-        if auto_target:
-            cmd.append(f"--target={self._target_path.get_package_target(pkg)}")
-        elif self.config.is_user_installed:
-            cmd.append("--user")
+        cmd.extend(self._get_target_args(pkg))
+        cmd.extend(self._get_find_links_args())
 
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
         cmd = self._cmd_pip(*[*cmd, pkg_cmd])
@@ -457,6 +490,7 @@ class InstallPkg:
             return False
 
         result = True
+        plan: Dict[str, str] = {}
         for name, ver in req.items():
             valid, rules = self._is_valid_version(name, ver, force)
             if force:
@@ -464,7 +498,7 @@ class InstallPkg:
             if valid == 1:
                 continue
 
-            if not self.is_internet:
+            if not self.is_internet and not self.wheel_dir:
                 self._logger.error("No internet connection!")
                 break
 
@@ -498,12 +532,140 @@ class InstallPkg:
                                 e,
                             )
                             return False
-            result = result and self._install_pkg(name, ",".join(ver_lst), force)
+            plan[name] = ",".join(ver_lst)
+
+        if plan:
+            result = self._install_planned(plan, force)
         self._logger.info("Installing packages Done!")
         if is_ext_install:
             self.on_extension_install()
         return result
 
+    def _install_planned(self, plan: Dict[str, str], force: bool) -> bool:
+        """
+        Install the packages that are missing or do not meet their requirements.
+
+        Packages that are installed to the same place are installed by a single pip command,
+        so pip resolves the dependencies of all of them at once.
+        If the single command fails each package is installed on its own.
+
+        Args:
+            plan (Dict[str, str]): Package names and the versions to install such as ``{"verr": ">=1.0.0"}``.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if all packages are installed successful, False otherwise.
+        """
+        groups: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        for name, ver in plan.items():
+            if name in self.no_pip_install:
+                self._logger.debug("_install_planned() %s is in the no install list. Not Installing.", name)
+                continue
+            groups.setdefault(tuple(self._get_target_args(name)), {})[name] = ver
+
+        result = True
+        for target_args, pkgs in groups.items():
+            if len(pkgs) > 1:
+                if self._install_batch(pkgs, list(target_args), force):
+                    continue
+                self._logger.warning("Installing packages one at a time: %s", ", ".join(pkgs))
+            for name, ver in pkgs.items():
+                result = result and self._install_pkg(name, ver, force)
+        return result
+
+    def _install_batch(self, pkgs: Dict[str, str], target_args: List[str], force: bool) -> bool:
+        """
+        Install packages with a single pip command.
+
+        Args:
+            pkgs (Dict[str, str]): Package names and the versions to install.
+            target_args (List[str]): Pip arguments that set where the packages are installed.
+            force (bool): Force install even if packages are already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        cmd = ["install"]
+        if force:
+            cmd.append("--force-reinstall")
+        elif self.flag_upgrade:
+            cmd.append("--upgrade")
+        cmd.extend(target_args)
+        cmd.extend(self._get_find_links_args())
+        pkg_cmds = [f"{name}{ver}" if ver else name for name, ver in pkgs.items()]
+        cmd = self._cmd_pip(*[*cmd, *pkg_cmds])
+        self._logger.debug(f"Running command {cmd}")
+        self._logger.info(f"Installing packages {', '.join(pkgs)}")
+
+        # the packages of a batch share the install location, the changes are split between them after install.
+        tracked = [name for name in pkgs if name not in self.no_pip_remove]
+        site_packages_dir = self._get_site_packages_dir(tracked[0]) if tracked else ""
+        if site_packages_dir:
+            before_dirs = set(self._get_directory_names(site_packages_dir))
+            before_files = set(self._get_file_names(site_packages_dir))
+            before_shared = self._get_pip_shared_files_in_dir(site_packages_dir)
+        else:
+            before_dirs, before_files, before_shared = set(), set(), {}
+
+        progress: Progress | None = None
+        if self._config.show_progress and self.show_progress:
+            self._logger.debug("Starting Progress Window")
+            msg = self.resource_resolver.resolve_string("msg08")
+            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
+            progress = Progress(start_msg=f"{msg}: {', '.join(pkgs)}", title=title)
+            progress.start()
+        else:
+            self._logger.debug("Progress Window is disabled")
+
+        process = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+            text=True,
+            env=self._get_env(),
+            startupinfo=STARTUP_INFO,
+        )
+
+        if progress:
+            self._logger.debug("Ending Progress Window")
+            progress.kill()
+
+        if process.returncode != 0:
+            self._logger.error(f"Pip Install failed for: {' '.join(pkg_cmds)}")
+            try:
+                self._logger.error(process.stderr)
+            except Exception as err:
+                self._logger.error("Error decoding stderr: %s", err)
+            return False
+
+        if site_packages_dir:
+            new_dirs = set(self._get_directory_names(site_packages_dir)) - before_dirs
+            new_files = set(self._get_file_names(site_packages_dir)) - before_files
+            after_shared = self._get_pip_shared_files_in_dir(site_packages_dir)
+            new_shared = {key: after_shared.get(key, set()) - before_shared[key] for key in before_shared}
+            # each package tracks the files of its own distribution. Dependencies are tracked by the first package,
+            # the same as when the packages are installed one at a time.
+            for name in [*tracked[1:], tracked[0]]:
+                if name == tracked[0]:
+                    owned_dirs, owned_files, owned_shared = new_dirs, new_files, new_shared
+                else:
+                    owned_dirs, owned_files, owned_shared = self._get_dist_entries(name, site_packages_dir)
+                changes = {
+                    "after_dirs": list(new_dirs & owned_dirs),
+                    "after_files": list(new_files & owned_files),
+                    "before_shared": {key: set() for key in new_shared},
+                    "after_shared": {key: new_shared[key] & owned_shared.get(key, set()) for key in new_shared},
+                }
+                new_dirs = new_dirs - owned_dirs
+                new_files = new_files - owned_files
+                new_shared = {key: new_shared[key] - owned_shared.get(key, set()) for key in new_shared}
+                self._delete_json_file(site_packages_dir, name)
+                self._save_changed(pkg=name, pth=site_packages_dir, changes=changes)
+        self._logger.info(f"Pip Install success for: {' '.join(pkg_cmds)}")
+        return True
+
     def install_file(self, pth: str | Path, force: bool = False) -> bool:
         """
         Install all the packages in the configuration if they are not already installed and meet requirements.
@@ -652,13 +814,59 @@ class InstallPkg:
                 and the values are lists of file names found in those directories.
         """
 
-        site_packages_dir = self._get_site_packages_dir(pkg)
+        return self._get_pip_shared_files_in_dir(self._get_site_packages_dir(pkg))
+
+    def _get_pip_shared_files_in_dir(self, site_packages_dir: str) -> Dict[str, Set[str]]:
+        """Gets the files in the ``pip_shared_dirs`` of a site-packages directory."""
         results: Dict[str, Set[str]] = {}
         for pip_dir in self.config.pip_shared_dirs:
             files = self._get_file_names(Path(site_packages_dir, pip_dir))
             results[pip_dir] = set(files)
         return results
 
+    def _get_dist_entries(self, pkg: str, site_packages_dir: str) -> Tuple[Set[str], Set[str], Dict[str, Set[str]]]:
+        """
+        Gets the top level directories, files and shared files that the installed distribution of a package owns.
+
+        The entries are read from the ``RECORD`` of the distribution in the site-packages directory.
+
+        Args:
+            pkg (str): The name of the package.
+            site_packages_dir (str): The directory the package is installed in.
+
+        Returns:
+            Tuple[Set[str], Set[str], Dict[str, Set[str]]]: Directory names, file names and shared file names
+                per ``pip_shared_dirs`` entry. Empty if the distribution is not found.
+        """
+        dirs: Set[str] = set()
+        files: Set[str] = set()
+        shared: Dict[str, Set[str]] = {key: set() for key in self.config.pip_shared_dirs}
+
+        def normalize(name: str) -> str:
+            return re.sub(r"[-_.]+", "-", name).lower()
+
+        pkg_name = normalize(re.split(r"[\[<>=!~; ]", pkg, maxsplit=1)[0])
+        try:
+            dists = importlib.metadata.distributions(path=[site_packages_dir])
+            dist = next((d for d in dists if normalize(d.metadata["Name"] or "") == pkg_name), None)
+        except Exception as e:
+            self._logger.error("Error reading distribution of '%s': %s", pkg, e)
+            dist = None
+        if dist is None:
+            return dirs, files, shared
+
+        for entry in dist.files or []:
+            parts = Path(entry).parts
+            if not parts or parts[0] == "..":
+                continue
+            if len(parts) == 1:
+                files.add(parts[0])
+            elif parts[0] in shared and len(parts) == 2:
+                shared[parts[0]].add(parts[1])
+            else:
+                dirs.add(parts[0])
+        return dirs, files, shared
+
     def _save_changed(self, pkg: str, pth: str, changes: dict) -> None:
         """Save the new directory names to a JSON file."""
 
@@ -860,6 +1068,13 @@ class InstallPkg:
     def target_path(self) -> TargetPath:
         return self._target_path
 
+    @property
+    def wheel_dir(self) -> str:
+        """Gets the local wheel directory pip installs from or an empty string if there is none."""
+        if self._wheel_dir and Path(self._wheel_dir).is_dir():
+            return self._wheel_dir
+        return ""
+
     @property
     def saved_json_files(self) -> Set[str]:
         return self._saved_json_files
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Dict, List
 import subprocess
 from pathlib import Path
 
@@ -15,6 +16,16 @@ class InstallPkgFlatpak(InstallPkg):
     def _get_logger(self) -> OxtLogger:
         return OxtLogger(log_name=__name__)
 
+    def _get_target_args(self, pkg: str) -> List[str]:
+        """Flatpak packages are always installed in the site-packages directory."""
+        return [f"--target={self.config.site_packages}"]
+
+    def _install_batch(self, pkgs: Dict[str, str], target_args: List[str], force: bool) -> bool:
+        if not self.config.site_packages:
+            # each package is then installed on its own, which logs the error.
+            return False
+        return super()._install_batch(pkgs, target_args, force)
+
     def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
         """
         Install a package.
@@ -42,7 +53,8 @@ class InstallPkgFlatpak(InstallPkg):
         elif self.flag_upgrade:
             cmd.append("--upgrade")
 
-        cmd.append(f"--target={self.config.site_packages}")
+        cmd.extend(self._get_target_args(pkg))
+        cmd.extend(self._get_find_links_args())
 
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
         cmd = self._cmd_pip(*[*cmd, pkg_cmd])
@@ -0,0 +1,141 @@
+"""
+Cache of requirement checks that passed.
+
+A check is only done again when the Python environment changes.
+The environment is identified by a fingerprint of the ``sys.path`` directories and the configured requirements.
+Installing, upgrading or removing a package adds or removes ``dist-info`` directories,
+which changes the modification time of the site-packages directory and therefore the fingerprint.
+Each check is stored with its own fingerprint, checks that depend on different values do not replace each other.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+import threading
+
+from ..config import Config
+from ..input_output import file_util
+from ..meta.singleton import Singleton
+from ..oxt_logger import OxtLogger
+
+
+class RequirementsCache(metaclass=Singleton):
+    """
+    Singleton Class. Requirement checks that passed, stored in the user profile.
+
+    Only passed checks are stored, a failed check is always done again.
+    """
+
+    def __init__(self) -> None:
+        self._log = OxtLogger(log_name=__name__)
+        self._config = Config()
+        self._lock = threading.Lock()
+        self._file = ""
+        self._is_loaded = False
+        # name of each check that passed and the fingerprint it passed in.
+        self._passed: Dict[str, str] = {}
+        try:
+            self._file = str(
+                Path(file_util.get_user_profile_path(True), f"{self._config.lo_implementation_name}_req_cache.json")
+            )
+        except Exception as e:
+            self._log.warning("Unable to get cache file path, checks are not cached: %s", e)
+
+    def get_fingerprint(self, *extra: Iterable[str]) -> str:
+        """
+        Gets the fingerprint of the current Python environment.
+
+        Args:
+            extra (Iterable[str]): Other values the checks depend on.
+
+        Returns:
+            str: The fingerprint.
+        """
+        h = hashlib.sha1()
+        h.update(f"{sys.version}|{self._config.extension_version}".encode("utf-8"))
+        for name, ver in sorted(self._config.requirements.items()):
+            h.update(f"|{name}{ver}".encode("utf-8"))
+        for values in extra:
+            for value in sorted(values):
+                h.update(f"|{value}".encode("utf-8"))
+        for pth in sys.path:
+            try:
+                mtime = os.stat(pth).st_mtime_ns if pth else 0
+            except OSError:
+                mtime = -1
+            h.update(f"|{pth}:{mtime}".encode("utf-8"))
+        return h.hexdigest()
+
+    def is_passed(self, key: str, fingerprint: str) -> bool:
+        """
+        Gets if a check passed in the environment of the fingerprint.
+
+        Args:
+            key (str): Name of the check.
+            fingerprint (str): Fingerprint of the environment, see ``get_fingerprint()``.
+
+        Returns:
+            bool: ``True`` if the check passed; Otherwise, ``False``.
+        """
+        with self._lock:
+            self._load()
+            return self._passed.get(key, "") == fingerprint
+
+    def set_passed(self, key: str, fingerprint: str) -> None:
+        """
+        Stores that a check passed in the environment of the fingerprint.
+
+        Args:
+            key (str): Name of the check.
+            fingerprint (str): Fingerprint of the environment, see ``get_fingerprint()``.
+        """
+        with self._lock:
+            self._load()
+            if self._passed.get(key, "") == fingerprint:
+                return
+            self._passed[key] = fingerprint
+            self._save()
+
+    def clear(self) -> None:
+        """Removes all stored checks."""
+        with self._lock:
+            self._passed.clear()
+            self._is_loaded = True
+            if self._file and os.path.exists(self._file):
+                try:
+                    os.remove(self._file)
+                except OSError as e:
+                    self._log.warning("Unable to remove cache file %s: %s", self._file, e)
+
+    def _load(self) -> None:
+        if self._is_loaded:
+            return
+        self._is_loaded = True
+        self._passed = {}
+        if not self._file or not os.path.exists(self._file):
+            return
+        try:
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            passed = data.get("passed", {})
+            # a file of an older version holds a list of checks for a single fingerprint, it is replaced.
+            if isinstance(passed, dict):
+                self._passed = {str(k): str(v) for k, v in passed.items()}
+        except Exception as e:
+            self._log.warning("Unable to read cache file %s: %s", self._file, e)
+
+    def _save(self) -> None:
+        if not self._file:
+            return
+        data = {"passed": self._passed}
+        try:
+            tmp = f"{self._file}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._file)
+        except Exception as e:
+            self._log.warning("Unable to write cache file %s: %s", self._file, e)
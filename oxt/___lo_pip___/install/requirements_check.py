@@ -15,6 +15,7 @@ from ..oxt_logger import OxtLogger
 from ..meta.singleton import Singleton
 from .py_packages.packages import Packages
 from .py_packages.py_package import PyPackage
+from .requirements_cache import RequirementsCache
 from ..settings.install_settings import InstallSettings
 
 
@@ -25,14 +26,37 @@ class RequirementsCheck(metaclass=Singleton):
         self._log = OxtLogger(log_name=__name__)
         self._config = Config()
         self._ver_rules = VerRules()
+        self._cache = RequirementsCache()
 
     def run_imports_ready(self, *other_mods: str) -> bool:
         """
         Check if the run imports are ready.
 
+        The imports are only searched for when the Python environment has changed since they were last found.
+
         Returns:
             bool: ``True`` if all run imports are ready; Otherwise, ``False``.
         """
+        key = f"run_imports:{','.join(other_mods)}"
+        try:
+            fingerprint = self._cache.get_fingerprint(
+                self._config.run_imports,
+                self._config.run_imports_linux,
+                self._config.run_imports_macos,
+                self._config.run_imports_win,
+            )
+            if self._cache.is_passed(key, fingerprint):
+                return True
+        except Exception as e:
+            self._log.warning("Unable to read cached run imports check: %s", e)
+            fingerprint = ""
+
+        result = self._find_run_imports(*other_mods)
+        if result and fingerprint:
+            self._cache.set_passed(key, fingerprint)
+        return result
+
+    def _find_run_imports(self, *other_mods: str) -> bool:
         for oth in other_mods:
             spec = importlib.util.find_spec(oth)
             if spec is None:
@@ -75,9 +99,31 @@ class RequirementsCheck(metaclass=Singleton):
         """
         Check requirements that have been set in file ``pyproject.toml`` in the ``tool.oxt.requirements`` section.
 
+        Installed versions are only checked when the Python environment has changed since the requirements were met.
+
         Returns:
             bool: ``True`` if requirements are installed; Otherwise, ``False``.
         """
+        key = "requirements"
+        try:
+            pkgs = Packages()
+            fingerprint = self._cache.get_fingerprint(
+                InstallSettings().no_install_packages,
+                (f"{pkg.name}{pkg.restriction}{pkg.version}" for pkg in pkgs.packages),
+            )
+            if self._cache.is_passed(key, fingerprint):
+                self._log.info("Requirements are met. Python environment unchanged.")
+                return True
+        except Exception as e:
+            self._log.warning("Unable to read cached requirements check: %s", e)
+            fingerprint = ""
+
+        result = self._check_requirements()
+        if result and fingerprint:
+            self._cache.set_passed(key, fingerprint)
+        return result
+
+    def _check_requirements(self) -> bool:
         install_settings = InstallSettings()
         config_req = self._config.requirements.copy()
         for pkg in install_settings.no_install_packages:
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import atexit
+import contextlib
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+from ..meta.singleton import Singleton
+
+
+class HandlerRegistry(metaclass=Singleton):
+    """
+    Singleton Class. Shared log handlers for all ``OxtLogger`` instances.
+
+    Each distinct handler setup (log file, console, level and format) is built once.
+    Loggers get a ``QueueHandler`` that only puts the record on a queue,
+    a ``QueueListener`` thread formats the records and writes them to the file and console.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._handlers: Dict[Tuple[str, bool, int, str], QueueHandler] = {}
+        self._listeners: List[QueueListener] = []
+        atexit.register(self.stop)
+
+    def get_handler(self, log_file: str, add_console: bool, level: int, fmt: str) -> logging.Handler:
+        """
+        Gets the shared handler for a handler setup.
+
+        Args:
+            log_file (str): Log file. If empty no file is written.
+            add_console (bool): Write to ``stdout``.
+            level (int): Log level.
+            fmt (str): Log format.
+
+        Returns:
+            Handler: Shared queue handler or a ``NullHandler`` if there is nothing to write to.
+        """
+        if not log_file and not add_console:
+            return logging.NullHandler()
+        key = (log_file, add_console, level, fmt)
+        with self._lock:
+            handler = self._handlers.get(key)
+            if handler is None:
+                handler = self._create_handler(log_file, add_console, level, fmt)
+                self._handlers[key] = handler
+        return handler
+
+    def _create_handler(self, log_file: str, add_console: bool, level: int, fmt: str) -> QueueHandler:
+        formatter = logging.Formatter(fmt)
+        targets: List[logging.Handler] = []
+        if log_file:
+            file_handler = TimedRotatingFileHandler(
+                log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
+            )
+            targets.append(file_handler)
+        if add_console:
+            targets.append(logging.StreamHandler(sys.stdout))
+        for target in targets:
+            target.setFormatter(formatter)
+            target.setLevel(level)
+
+        log_queue = queue.SimpleQueue()
+        handler = QueueHandler(log_queue)  # type: ignore
+        handler.setLevel(level)
+        listener = QueueListener(log_queue, *targets, respect_handler_level=True)  # type: ignore
+        listener.start()
+        self._listeners.append(listener)
+        return handler
+
+    def stop(self) -> None:
+        """Writes all queued records and stops the writer threads."""
+        with self._lock:
+            listeners = self._listeners
+            self._listeners = []
+            self._handlers.clear()
+        for listener in listeners:
+            with contextlib.suppress(Exception):
+                listener.stop()
+            for target in listener.handlers:
+                target.close()
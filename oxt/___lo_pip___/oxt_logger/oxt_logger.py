@@ -1,12 +1,12 @@
 import logging
-import sys
 import os
+from typing import Any
 import platform
 from logging import Logger
-from logging.handlers import TimedRotatingFileHandler
 from contextlib import contextmanager
 
 # from .. import config
+from .handler_registry import HandlerRegistry
 from .logger_config import LoggerConfig
 from ..basic_config import BasicConfig
 
@@ -44,19 +44,11 @@ class OxtLogger(Logger):
         self._config = LoggerConfig()  # config.Config()
         basic_config = BasicConfig()
         self._indent_amt = basic_config.log_indent
-        self._fn_on_callback = self._on_callback
         # no indent for windows or MacOS
         if os.name == "nt" or platform.system().lower() == "darwin":
             # for unknown reasons, the indent is not working on windows. The log and the extension totally fails.
             self._indent_amt = 0
 
-        if self._indent_amt > 0:
-            # "%(asctime)s %(levelname)s: %(indent_str)s%(message)s"
-            self.formatter = CallbackFormatter(
-                fmt=self._config.log_format, callback=self._fn_on_callback
-            )
-        else:
-            self.formatter = logging.Formatter(self._config.log_format)
         add_console_logger = kwargs.get("add_console_logger", False)
 
         if not log_file:
@@ -74,25 +66,17 @@ class OxtLogger(Logger):
         # Logger.__init__(self, name=log_name, level=cfg.log_level)
         super().__init__(name=log_name, level=self._config.log_level)
 
-        has_handler = False
-        has_console_handler = False
-
-        if self._log_file and self._config.log_level >= 10:  # DEBUG
-            self.addHandler(self._get_file_handler())
-            has_handler = True
-
-        if self._config.log_add_console and self._config.log_level > 0:
-            self.addHandler(self._get_console_handler())
-            has_handler = True
-            has_console_handler = True
-
-        if not has_console_handler and add_console_logger:
-            self.addHandler(self._get_console_handler())
-            has_handler = True
-            has_console_handler = True
-
-        if not has_handler:
-            self.addHandler(self._get_null_handler())
+        # handlers are shared by all loggers with the same setup and write on a background thread.
+        file_name = self._log_file if self._log_file and self._config.log_level >= 10 else ""  # DEBUG
+        add_console = (self._config.log_add_console and self._config.log_level > 0) or bool(add_console_logger)
+        self.addHandler(
+            HandlerRegistry().get_handler(
+                log_file=file_name,
+                add_console=add_console,
+                level=self._config.log_level,
+                fmt=self._config.log_format,
+            )
+        )
 
         # with this pattern, it's rarely necessary to propagate the| error up to parent
         self.propagate = False
@@ -101,24 +85,11 @@ class OxtLogger(Logger):
         if trigger:
             self._config.trigger_log_ready_event()
 
-    def _get_console_handler(self):
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(self.formatter)
-        console_handler.setLevel(self._config.log_level)
-        return console_handler
-
-    def _get_null_handler(self):
-        return logging.NullHandler()
-
-    def _get_file_handler(self):
-        log_file = self._log_file
-        file_handler = TimedRotatingFileHandler(
-            log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
-        )
-        # file_handler = logging.FileHandler(log_file, mode="w", encoding="utf8", delay=True)
-        file_handler.setFormatter(self.formatter)
-        file_handler.setLevel(self._config.log_level)
-        return file_handler
+    def makeRecord(self, *args: Any, **kwargs: Any) -> logging.LogRecord:  # noqa: ANN401, N802
+        # the indent is taken when the record is created, records are formatted later on the writer thread.
+        record = super().makeRecord(*args, **kwargs)
+        record.indent_str = " " * _INDENT if _INDENT > 0 else ""
+        return record
 
     def debugs(self, *messages: str) -> None:
         """
@@ -134,13 +105,6 @@ class OxtLogger(Logger):
         self.debug("\t".join(data))
         return
 
-    def _on_callback(self, record):
-        if self.current_indent > 0:
-            s = " " * self.current_indent
-        else:
-            s = ""
-        record.indent_str = s
-
     # region Indent
     def _core_indent(self, amount: int):
         """Core functionality for indentation."""
@@ -222,6 +186,12 @@ class OxtLogger(Logger):
 
 
 class CallbackFormatter(logging.Formatter):
+    """
+    Formatter that calls a callback with each record before it is formatted.
+
+    ``OxtLogger`` no longer uses this formatter, it sets ``indent_str`` when the record is created.
+    """
+
     # https://stackoverflow.com/questions/17558552/how-do-i-add-custom-field-to-python-log-format-string
     def __init__(
         self,
@@ -18,6 +18,7 @@ class InstallSettings(metaclass=Singleton):
         self._no_install_packages = cast(
             Set[str], set(cast(Tuple, settings.current_settings.get("NoInstallPackages", ())))
         )
+        self._wheel_dir = str(settings.current_settings.get("WheelDir", "") or "")
 
     # region Properties
 
@@ -37,4 +38,20 @@ class InstallSettings(metaclass=Singleton):
         )
         self._no_install_packages = value
 
+    @property
+    def wheel_dir(self) -> str:
+        """
+        Gets/Sets a local directory of wheels.
+
+        When set, pip installs packages from this directory before using the package index.
+        When there is no internet connection packages are installed from this directory only.
+        """
+        return self._wheel_dir
+
+    @wheel_dir.setter
+    def wheel_dir(self, value: str) -> None:
+        settings = self._configuration.convert_dict_to_settings({"WheelDir": value})
+        self._configuration.save_configuration(node_value=self._node_value, settings=settings)
+        self._wheel_dir = value
+
     # endregion Properties
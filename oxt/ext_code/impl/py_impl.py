@@ -38,6 +38,8 @@ if TYPE_CHECKING:
     from ...___lo_pip___.debug.break_mgr import BreakMgr
     from ...pythonpath.libre_pythonista_lib.cell.cell_mgr import CellMgr
     from ...pythonpath.libre_pythonista_lib.code.cell_cache import CellCache
+    from ...pythonpath.libre_pythonista_lib.code.cell_prop_cache import CellPropCache
+    from ...pythonpath.libre_pythonista_lib.code.exec_engine import ExecEngine, PENDING_RESULT
     from ...pythonpath.libre_pythonista_lib.cell.result_action.pyc.rules.pyc_rules import (
         PycRules,
     )
@@ -62,6 +64,8 @@ else:
         from libre_pythonista_lib.cell.result_action.pyc.rules.pyc_rules import PycRules
         from libre_pythonista_lib.event.shared_event import SharedEvent
         from libre_pythonista_lib.code.cell_cache import CellCache
+        from libre_pythonista_lib.code.cell_prop_cache import CellPropCache
+        from libre_pythonista_lib.code.exec_engine import ExecEngine, PENDING_RESULT
         from libre_pythonista_lib.const.event_const import (
             PYC_RULE_MATCH_DONE,
             PYC_FORMULA_ENTER,
@@ -214,6 +218,12 @@ class PyImpl(unohelper.Base, XPy):
             # else:
             #     cm.update_from_cell_obj(cell_obj=cell.cell_obj)
 
+            if ExecEngine(doc).is_busy:
+                # the module is being built on the engine thread.
+                # The document is recalculated to show the results when it is done.
+                self._log.debug("pyc - Execution engine is busy. Returning pending result.")
+                return PENDING_RESULT
+
             py_src = cm.get_py_src(cell_obj=cell.cell_obj)
             # py_src = py_inst[cc.current_cell]
             pyc_rules = PycRules()
@@ -225,6 +235,8 @@ class PyImpl(unohelper.Base, XPy):
                 # set the custom property for the cell that is used by CodeCellListener to raise an event that is then
                 # handled by the CellMgr which uses CtlMgr to assign the control to the cell.
                 break_mgr.check_breakpoint("librepythonista.PyImpl.matched_rule")
+                # cell properties set by the rule are written when the recalculation is done, see CellMgr.
+                CellPropCache(doc).begin_recalc()
                 rule_result = matched_rule.action()
                 cm.add_cell_control_from_pyc_rule(rule=matched_rule)
 
@@ -261,7 +273,7 @@ class PyImpl(unohelper.Base, XPy):
             rng_obj += height - 1
             cfg = Config()
             key = f"{cfg.cell_cp_prefix}modify_trigger_event"
-            cell.set_custom_property(key, "cell_table_data")
+            CellPropCache(doc).set(cell, key, "cell_table_data")
             self._log.debug(f"pyc - Table Range: {rng_obj}")
             # rng = sheet.get_range(range_obj=rng_obj)
             # rng.component.setArrayFormula(cell.component.getFormula())
@@ -5,7 +5,7 @@ Manages adding and removing listeners to cells.
 """
 
 from __future__ import annotations
-from typing import Any, cast, TYPE_CHECKING
+from typing import Any, Callable, cast, TYPE_CHECKING
 from contextlib import contextmanager
 import threading
 from ooodev.calc import CalcDoc, CalcCell, CalcSheet
@@ -16,9 +16,13 @@ from .listen.code_cell_listener import CodeCellListener
 from .listen.code_cell_listeners import CodeCellListeners
 from .state.state_kind import StateKind
 from ..code.cell_cache import CellCache
+from ..code.exec_engine import ExecEngine
+from ..data.range_cache import RangeCache
 from ..code.py_source_mgr import PyInstance, PySourceManager
 from ..code.py_source_mgr import PySource
 from ..cell.ctl.ctl_mgr import CtlMgr
+from ..cell.ctl.ctl_reconciler import CtlReconciler
+from ..code.cell_prop_cache import CellPropCache
 from ..cell.cell_info import CellInfo
 from ..cell.props.key_maker import KeyMaker
 from ..event.shared_event import SharedEvent
@@ -28,9 +32,12 @@ from ..utils.singleton_base import SingletonBase
 from ..sheet.sheet_mgr import SheetMgr
 from ..dispatch.cell_dispatch_state import CellDispatchState
 from ..const import DISPATCH_DF_STATE, DISPATCH_PY_OBJ_STATE
+from ..ex.exceptions import ExecCancelledError
+from ..doc_props.calc_props import CalcProps
 from ..const.event_const import (
     SHEET_MODIFIED,
     CALC_FORMULAS_CALCULATED,
+    DOCUMENT_SAVING,
     PYC_FORMULA_INSERTED,
     PYC_RULE_MATCH_DONE,
 )
@@ -78,6 +85,7 @@ class CellMgr(SingletonBase):
         self._listeners = CodeCellListeners()  # will automatically add listeners to all cells
         self._cell_cache = CellCache(doc)  # singleton
         self._py_inst = None  # PyInstance(doc)  # singleton
+        self._engine = ExecEngine(doc)  # singleton
         self._ctl_mgr = CtlMgr()
         self._key_maker = KeyMaker()
         self._style = DefaultStyle()
@@ -91,6 +99,7 @@ class CellMgr(SingletonBase):
         self._se.subscribe_event(CALC_FORMULAS_CALCULATED, self._fn_on_calc_formulas_calculated)
         self._se.subscribe_event(PYC_FORMULA_INSERTED, self._fn_on_calc_pyc_formula_inserted)
         self._se.subscribe_event(PYC_RULE_MATCH_DONE, self._fn_on_pyc_rule_matched)
+        self._se.subscribe_event(DOCUMENT_SAVING, self._fn_on_document_saving)
         self.add_all_listeners()
 
         # self.remove_all_listeners()
@@ -144,9 +153,37 @@ class CellMgr(SingletonBase):
     def _on_calc_formulas_calculated(self, src: Any, event: EventArgs) -> None:
         with self._log.noindent():
             self._log.debug("_on_calc_formulas_calculated() Entering.")
-            self.reset_py_inst(update_display=True)
+            # write the cell properties and apply the control changes of the recalculation.
+            CellPropCache(self._doc).end_recalc()
+            CtlReconciler(self._doc).end_recalc()
+            if self._engine.consume_push():
+                # recalculation that shows the results of the execution engine.
+                self._log.debug("_on_calc_formulas_calculated() Results pushed. Done.")
+                return
+            # formula results may have changed without a sheet modify event.
+            RangeCache(self._doc).clear()
+            # only cells with changed sheet inputs are executed.
+            # a full rebuild is done with reset_py_inst(), see DispatchPyRebuild.
+            self.update_changed_inputs()
             self._log.debug("_on_calc_formulas_calculated() Done.")
 
+    def _on_document_saving(self, src: Any, event: EventArgs) -> None:
+        with self._log.noindent():
+            self._log.debug("_on_document_saving() Entering.")
+            # cell properties kept in memory during a recalculation are saved with the document.
+            CellPropCache(self._doc).flush()
+            try:
+                if self._engine.is_busy:
+                    # results are not complete, the stored results are checked when the document is opened.
+                    self._log.debug("_on_document_saving() Execution engine busy. Results not stored.")
+                elif CalcProps(self._doc).store_results:
+                    self.py_inst.save_results()
+                elif self.py_inst.has_stored_results:
+                    self.py_inst.delete_results()
+            except Exception:
+                self._log.exception("_on_document_saving() Error storing results.")
+            self._log.debug("_on_document_saving() Done.")
+
     def _on_calc_pyc_formula_inserted(self, src: Any, event: EventArgs) -> None:
         pass
         # SheetMgr subscribes to this event and ensures that the sheet calculate event is set.
@@ -170,6 +207,8 @@ class CellMgr(SingletonBase):
                 self._log.debug("Is Last Cell: %s", dd.is_last_cell)
 
             if dd.is_last_cell:
+                CellPropCache(self._doc).end_recalc()
+                CtlReconciler(self._doc).end_recalc()
                 # it is imperative that the update be called in a new thread.
                 # If not called in a new thread then chances are LibreOffice will totally crash.
                 # Most likely the crash is because a re-calculation of the sheet is taking place,
@@ -235,8 +274,9 @@ class CellMgr(SingletonBase):
                     self._log.debug(f"Updating controls for {len(cells)} cells")
                     for current_cell in cells:
                         self._log.debug(f"Going to update control for cell: {current_cell.cell_obj}")
-                for current_cell in cells:
-                    self._update_lp_cell_control(current_cell)
+                with CtlReconciler(self._doc).batch():
+                    for current_cell in cells:
+                        self._update_lp_cell_control(current_cell)
             except Exception:
                 self._log.error(
                     f"_update_controls_forward() Error updating controls for cell: {cell.cell_obj}",
@@ -307,6 +347,7 @@ class CellMgr(SingletonBase):
         # region Sheet Events
         self._fn_on_sheet_modified = self._on_sheet_modified
         self._fn_on_calc_formulas_calculated = self._on_calc_formulas_calculated
+        self._fn_on_document_saving = self._on_document_saving
         self._fn_on_calc_pyc_formula_inserted = self._on_calc_pyc_formula_inserted
         self._fn_py_inst_after_source_update = self._py_inst_after_source_update
         # endregion Sheet Events
@@ -358,7 +399,7 @@ class CellMgr(SingletonBase):
             calc_cell = cast(CalcCell, dd.calc_cell)
             co = calc_cell.cell_obj
             addr = f"sheet_index={co.sheet_idx}&cell_addr={co}"
-            calc_cell.set_custom_property(self._key_maker.cell_addr_key, addr)
+            CellPropCache(self._doc).set(calc_cell, self._key_maker.cell_addr_key, addr)
             if self._log.is_debug:
                 self._log.debug(f"Cell moved: {dd.absolute_name}")
                 self._log.debug(f"Update Custom Prop: {self._key_maker.cell_addr_key} to {addr}")
@@ -524,6 +565,8 @@ class CellMgr(SingletonBase):
         """
         with self._log.indent(True):
             try:
+                # the control changes of a recalculation are applied together, see _on_pyc_rule_matched().
+                CtlReconciler(self._doc).begin_recalc()
                 self._ctl_mgr.set_ctl_from_pyc_rule(rule)
             except Exception:
                 self._log.error("Error setting custom property control", exc_info=True)
@@ -628,6 +671,8 @@ class CellMgr(SingletonBase):
             try:
                 if absolute_name:
                     prefix = self._cfg.cell_cp_prefix
+                    # queued writes are written before the properties are removed.
+                    CellPropCache(self._doc).invalidate(calc_cell)
                     props = calc_cell.get_custom_properties()
                     for key in props.keys():
                         if key.startswith(prefix):
@@ -857,12 +902,14 @@ class CellMgr(SingletonBase):
                 raise ValueError("Cell cache is None")
             return self._cell_cache.is_last_cell(cell=cell_obj, sheet_idx=cell_obj.sheet_idx)
 
-    def reset_py_inst(self, update_display: bool = False) -> None:
+    def reset_py_inst(self, update_display: bool = False, use_stored: bool = False) -> None:
         """
         Reset the PyInstance.
 
         Args:
             update_display (bool, optional): Update the display after reset. Defaults to False.
+            use_stored (bool, optional): Use the results stored with the document for cells that are unchanged.
+                Defaults to False.
 
         Note:
             Updating display will toggle the sheet python arrays on and off.
@@ -870,16 +917,55 @@ class CellMgr(SingletonBase):
         update_display = False
         with self._log.indent(True):
             self._log.debug("reset_py_inst() Resetting PyInstance")
+            # a full rebuild replaces any update that is running or queued.
+            self._engine.cancel()
             self._py_inst = None
             PyInstance.reset_instance(self._doc)
-            if update_display:
-                self.py_inst.unsubscribe_after_update_source(self._fn_py_inst_after_source_update)
-                self.py_inst.subscribe_after_source_update(self._fn_py_inst_after_source_update)
-            self.py_inst.update_all()
-            if update_display:
-                self.py_inst.unsubscribe_after_update_source(self._fn_py_inst_after_source_update)
+            py_inst = self.py_inst
+
+            def update() -> None:
+                if update_display:
+                    py_inst.unsubscribe_after_update_source(self._fn_py_inst_after_source_update)
+                    py_inst.subscribe_after_source_update(self._fn_py_inst_after_source_update)
+                if use_stored:
+                    py_inst.update_all_from_store()
+                else:
+                    py_inst.update_all()
+                if update_display:
+                    py_inst.unsubscribe_after_update_source(self._fn_py_inst_after_source_update)
+
+            self._submit("reset_py_inst", update)
             self._log.debug("reset_py_inst() Done")
 
+    def update_changed_inputs(self) -> None:
+        """
+        Executes the cells whose sheet inputs have changed since they were last executed and the cells depending on them.
+
+        See ``PySourceManager.update_changed_inputs()``.
+        """
+        with self._log.indent(True):
+            self._log.debug("update_changed_inputs() Entering.")
+            self._submit("update_changed_inputs", self.py_inst.update_changed_inputs)
+            self._log.debug("update_changed_inputs() Done")
+
+    def _submit(self, name: str, job: Callable[[], Any]) -> None:
+        """
+        Runs a module update on the execution engine.
+
+        If the update is cancelled the module is only partly built,
+        so all sources are marked to be executed again on the next update.
+        """
+        py_inst = self.py_inst
+
+        def run() -> Any:  # noqa: ANN401
+            try:
+                return job()
+            except ExecCancelledError:
+                py_inst.reset_executed()
+                raise
+
+        self._engine.submit(name, run)
+
     def _py_inst_after_source_update(self, src: Any, event: EventArgs) -> None:
         # event data is DotDict(
         # source=self,
@@ -957,8 +1043,16 @@ class CellMgr(SingletonBase):
                 self._log.error("Cell does not exist in PyInstance: %s", cell_obj)
                 raise KeyError(f"Cell does not exist in PyInstance: {cell_obj}")
             self._log.debug(f"update_from_cell_obj() - Index: {index}")
-            self.py_inst.update_from_index(index)
-            self._log.debug(f"update_from_cell_obj() - Updated PyInstance from cell object: {cell_obj}")
+            py_inst = self.py_inst
+
+            def update() -> None:
+                # the index is found again when the update runs, cells may be added or removed before then.
+                current = py_inst.get_index(cell_obj)
+                if current >= 0:
+                    py_inst.update_from_index(current)
+
+            self._submit(f"update_from_cell_obj({cell_obj})", update)
+            self._log.debug(f"update_from_cell_obj() - Queued PyInstance update from cell object: {cell_obj}")
 
     def set_global_var(self, name: str, value: Any) -> None:
         """
@@ -1043,6 +1137,7 @@ class CellMgr(SingletonBase):
         if self._py_inst is None:
             self._py_inst = PyInstance(self._doc)
             self._py_inst.subscribe_after_update_source(self._fn_on_py_code_updated)
+            self._py_inst.set_executor(self._submit)
         return self._py_inst
 
     @property
@@ -19,6 +19,7 @@ from ooodev.exceptions import ex as mEx  # noqa: N812
 from ooodev.loader import Lo
 from ooodev.utils.helper.dot_dict import DotDict
 from .ctl_namer import CtlNamer
+from .shape_index import ShapeIndex
 from ...ex import CustomPropertyMissingError
 from ...log.log_inst import LogInst
 
@@ -86,7 +87,7 @@ class CellControl(SheetControlBase):
 
             shape = None
             with contextlib.suppress(mEx.ShapeMissingError):
-                shape = sheet.draw_page.find_shape_by_name(self.namer.ctl_shape_name)
+                shape = ShapeIndex(self.calc_obj.calc_doc).find_shape_by_name(sheet, self.namer.ctl_shape_name)
 
             if shape is None:
                 self.__log.debug(
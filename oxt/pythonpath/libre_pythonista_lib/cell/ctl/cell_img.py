@@ -18,6 +18,7 @@ from ooodev.loader import Lo
 from ooodev.utils.helper.dot_dict import DotDict
 from ooodev.utils.kind.drawing_shape_kind import DrawingShapeKind
 from ooodev.units import UnitMM100
+from .shape_index import ShapeIndex
 from .shape_namer import ShapeNamer
 from ...ex import CustomPropertyMissingError
 from ...log.log_inst import LogInst
@@ -95,7 +96,7 @@ class CellImg(SheetControlBase):
 
             shape = None
             with contextlib.suppress(mEx.ShapeMissingError):
-                shape = sheet.draw_page.find_shape_by_name(self.namer.shape_name)
+                shape = ShapeIndex(self.calc_obj.calc_doc).find_shape_by_name(sheet, self.namer.shape_name)
 
             if shape is None:
                 self.__log.debug(f"CellControl - _find_current_control(): Shape not found: {self.namer.shape_name}")
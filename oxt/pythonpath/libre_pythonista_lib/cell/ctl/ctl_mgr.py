@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Type
+from typing import Dict, TYPE_CHECKING, Type
 from ooodev.calc import CalcCell
 from .simple_ctl import SimpleCtl
 from .float_ctl import FloatCtl
@@ -11,8 +11,10 @@ from .error_ctl import ErrorCtl
 from .data_frame_ctl import DataFrameCtl
 from .data_series_ctl import DataSeriesCtl
 from .data_tbl_ctl import DataTblCtl
+from .ctl_reconciler import CtlReconciler
 from ...log.log_inst import LogInst
 from ..props.key_maker import KeyMaker
+from ...code.cell_prop_cache import CellPropCache
 
 if TYPE_CHECKING:
     from ..result_action.pyc.rules.pyc_rule_t import PycRuleT
@@ -20,6 +22,9 @@ if TYPE_CHECKING:
 
 
 class CtlMgr:
+    _ctl_types: Dict[str, Type[CtlRuleT]] = {}
+    """Control types by rule name, the rule names are the same for all documents."""
+
     def __init__(self) -> None:
         self._log = LogInst()
         self._key_maker = KeyMaker()
@@ -45,31 +50,32 @@ class CtlMgr:
             ctl_type = self._get_rule(rule.data_type_name, rule.cell)
             if ctl_type:
                 ctl = ctl_type(rule.cell)
-                ctl.add_ctl()
+                CtlReconciler(rule.cell.calc_doc).add_ctl(ctl)
         except Exception:
             self._log.error("CtlMgr - set_ctl_from_pyc_rule() Error setting control for cell", exc_info=True)
             raise
 
+    def _get_ctl_types(self) -> Dict[str, Type[CtlRuleT]]:
+        if not CtlMgr._ctl_types:
+            rules = self._key_maker.rule_names
+            CtlMgr._ctl_types = {
+                rules.cell_data_type_float: FloatCtl,
+                rules.cell_data_type_int: FloatCtl,
+                rules.cell_data_type_str: StrCtl,
+                rules.cell_data_type_pd_df: DataFrameCtl,
+                rules.cell_data_type_pd_series: DataSeriesCtl,
+                rules.cell_data_type_error: ErrorCtl,
+                rules.cell_data_type_none: NoneCtl,
+                rules.cell_data_type_empty: EmptyCtl,
+                rules.cell_data_type_tbl_data: DataTblCtl,
+                rules.cell_data_type_mp_figure: MatPlotFigureCtl,
+            }  # type: ignore
+        return CtlMgr._ctl_types
+
     def _get_rule(self, rule_name: str, cell: CalcCell) -> Type[CtlRuleT] | None:
-        rules = self._key_maker.rule_names
-        if rule_name in (rules.cell_data_type_float, rules.cell_data_type_int):
-            return FloatCtl
-        if rule_name == rules.cell_data_type_str:
-            return StrCtl
-        if rule_name == rules.cell_data_type_pd_df:
-            return DataFrameCtl
-        if rule_name == rules.cell_data_type_pd_series:
-            return DataSeriesCtl
-        if rule_name == rules.cell_data_type_error:
-            return ErrorCtl
-        if rule_name == rules.cell_data_type_none:
-            return NoneCtl
-        if rule_name == rules.cell_data_type_empty:
-            return EmptyCtl
-        if rule_name == rules.cell_data_type_tbl_data:
-            return DataTblCtl
-        if rule_name == rules.cell_data_type_mp_figure:
-            return MatPlotFigureCtl
+        ctl_type = self._get_ctl_types().get(rule_name, None)
+        if ctl_type is not None:
+            return ctl_type
         is_deleted = cell.extra_data.get("deleted", False)
         if is_deleted:
             self._log.debug(f"CtlMgr - _get_rule() Cell is deleted: {cell.cell_obj}. Returning SimpleCtl instance.")
@@ -80,6 +86,7 @@ class CtlMgr:
         """Gets the control type for a cell."""
         with self._log.indent(True):
             km = self._key_maker
+            props = CellPropCache(cell.calc_doc)
             try:
                 self._log.debug(
                     "CtlMgr - get_current_ctl_type_from_cell() Getting control type for cell %s", cell.cell_obj
@@ -93,13 +100,13 @@ class CtlMgr:
                     )
                     return None
                 else:
-                    if not cell.has_custom_property(key):
+                    if not props.has(cell, key):
                         self._log.debug(
                             "CtlMgr - get_current_ctl_type_from_cell() No custom property found for cell %s. Returning None.",
                             cell.cell_obj,
                         )
                         return None
-                    rule_name = cell.get_custom_property(key)
+                    rule_name = props.get(cell, key)
 
                 ctl_type = self._get_rule(rule_name, cell)
                 if ctl_type:
@@ -121,6 +128,7 @@ class CtlMgr:
         """Gets the control type for a cell."""
         with self._log.indent(True):
             km = self._key_maker
+            props = CellPropCache(cell.calc_doc)
             try:
                 self._log.debug(
                     f"CtlMgr - get_orig_ctl_type_from_cell() Getting control type for cell {cell.cell_obj}"
@@ -134,12 +142,12 @@ class CtlMgr:
                     )
                     return None
                 else:
-                    if not cell.has_custom_property(key):
+                    if not props.has(cell, key):
                         self._log.debug(
                             f"CtlMgr - get_orig_ctl_type_from_cell() No custom property found for cell {cell.cell_obj}. Returning None."
                         )
                         return None
-                    rule_name = cell.get_custom_property(key)
+                    rule_name = props.get(cell, key)
 
                 ctl_type = self._get_rule(rule_name, cell)
                 if ctl_type:
@@ -199,7 +207,7 @@ class CtlMgr:
                     "CtlMgr - update_ctl() Control type for cell %s has not changed. Updating.", cell.cell_obj
                 )
                 ctl = current_ctl_type(cell)
-                ctl.update_ctl()  # refresh size and pos
+                CtlReconciler(cell.calc_doc).update_ctl(ctl)  # refresh size and pos
                 self._log.debug("CtlMgr - update_ctl() Done.")
                 return
 
@@ -211,7 +219,7 @@ class CtlMgr:
                         cell.cell_obj,
                     )
                     ctl = current_ctl_type(cell)
-                    ctl.add_ctl()
+                    CtlReconciler(cell.calc_doc).add_ctl(ctl)
                     self._log.debug("CtlMgr - update_ctl() Done.")
                     return
                 # both controls exist and they are different
@@ -220,9 +228,10 @@ class CtlMgr:
                 )
                 old_ctl = orig_ctl_type(cell)
                 old_ctl.remove_ctl()
+                CtlReconciler(cell.calc_doc).forget(cell)
                 self._log.debug("CtlMgr - update_ctl() Removed Old Control. Adding new control.")
                 ctl = current_ctl_type(cell)
-                ctl.add_ctl()
+                CtlReconciler(cell.calc_doc).add_ctl(ctl)
                 self._log.debug("CtlMgr - update_ctl() Done.")
                 return
             else:
@@ -233,12 +242,14 @@ class CtlMgr:
                     )
                     ctl = orig_ctl_type(cell)
                     ctl.remove_ctl()
+                    CtlReconciler(cell.calc_doc).forget(cell)
             self._log.debug("CtlMgr - update_ctl() Done.")
         return
 
     def remove_ctl(self, cell: CalcCell) -> None:
         """Removes the control for a cell if it exists."""
         km = self._key_maker
+        props = CellPropCache(cell.calc_doc)
         with self._log.indent(True):
             try:
                 self._log.debug(f"CtlMgr - remove_ctl() Removing control for cell {cell.cell_obj}")
@@ -248,17 +259,18 @@ class CtlMgr:
                 if is_deleted:
                     rule_name = ""
                 else:
-                    if not cell.has_custom_property(key):
+                    if not props.has(cell, key):
                         self._log.debug(
                             f"CtlMgr - remove_ctl() No custom property found for cell {cell.cell_obj}. Returning."
                         )
                         return
-                    rule_name = cell.get_custom_property(key)
+                    rule_name = props.get(cell, key)
 
                 ctl_type = self._get_rule(rule_name, cell)
                 if ctl_type:
                     ctl = ctl_type(cell)
                     ctl.remove_ctl()
+                    CtlReconciler(cell.calc_doc).forget(cell)
                     self._log.debug(f"CtlMgr - remove_ctl() Removed control for cell {cell.cell_obj}")
                 else:
                     self._log.debug(f"CtlMgr - remove_ctl() No control to remove for cell {cell.cell_obj}")
@@ -0,0 +1,219 @@
+"""
+Reconciles the controls of the cells of a document with the controls last rendered.
+
+Each ``PY.C`` evaluation asks for the control of its cell to be added and each code change asks for the controls
+of the cells after it to be updated. The reconciler keeps the kind, label, position and size of the control that was
+last rendered for a cell, a control is only added or updated when one of them differs or its shape is missing.
+
+During a recalculation the changes are queued, one change per cell, and applied together when the last code cell
+has been evaluated or Calc has calculated the formulas. Other changes are applied at once,
+``batch()`` keeps the document from updating its display until all changes of the batch are applied.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterator, Tuple, TYPE_CHECKING
+import contextlib
+import threading
+from dataclasses import dataclass
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+
+from .shape_index import ShapeIndex
+from .simple_ctl import SimpleCtl
+from ..state.ctl_state import CtlState
+from ...const.event_const import GBL_DOC_CLOSING
+from ...log.log_inst import LogInst
+from ...utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcCell
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from .ctl_rule_t import CtlRuleT
+
+_ADD = "add"
+_UPDATE = "update"
+
+
+@dataclass(frozen=True)
+class CtlRender:
+    """
+    Control as it was rendered for a cell.
+
+    Attributes:
+        kind (str): Rule name of the control such as ``cell_data_type_pd_df``.
+        label (str): Label of the control.
+        pos_size (Tuple[int, int, int, int]): Position and size of the cell, ``(x, y, width, height)``.
+        state (int): Control state of the cell, see ``StateKind``.
+    """
+
+    kind: str
+    label: str
+    pos_size: Tuple[int, int, int, int]
+    state: int
+
+
+class CtlReconciler(SingletonBase):
+    """Adds and updates the controls of the cells of a document that have changed."""
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = LogInst()
+        self._lock = threading.RLock()
+        self._rendered: Dict[CellObj, CtlRender] = {}
+        self._pending: Dict[CellObj, Tuple[str, CtlRuleT, CtlRender | None]] = {}
+        self._in_recalc = False
+        self._is_init = True
+
+    # region Batch
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Locks the display of the document while the control changes made in the context are applied."""
+        self._doc.lock_controllers()
+        try:
+            yield
+        finally:
+            self._doc.unlock_controllers()
+
+    def begin_recalc(self) -> None:
+        """Starts queueing the control changes of a recalculation. Does nothing if already started."""
+        with self._lock:
+            self._in_recalc = True
+
+    def end_recalc(self) -> None:
+        """Applies the queued control changes of a recalculation."""
+        with self._lock:
+            if not self._in_recalc:
+                return
+            self._in_recalc = False
+        self.flush()
+
+    @property
+    def in_recalc(self) -> bool:
+        """Gets if the control changes of a recalculation are being queued."""
+        return self._in_recalc
+
+    def flush(self) -> None:
+        """Applies the queued control changes unless a recalculation is still queueing."""
+        with self._lock:
+            if self._in_recalc or not self._pending:
+                return
+            pending = self._pending
+            self._pending = {}
+        self._log.debug("CtlReconciler: flush(): Applying %i control changes.", len(pending))
+        with self.batch():
+            for cell_obj, (action, ctl, render) in pending.items():
+                self._apply(cell_obj, action, ctl, render)
+
+    # endregion Batch
+
+    def _apply(self, cell_obj: CellObj, action: str, ctl: CtlRuleT, render: CtlRender | None) -> None:
+        try:
+            if action == _ADD:
+                ctl.add_ctl()
+            else:
+                ctl.update_ctl()
+        except Exception:
+            self._rendered.pop(cell_obj, None)
+            self._log.exception("CtlReconciler: _apply(): Error applying %s for cell %s", action, cell_obj)
+            return
+        if render is None:
+            self._rendered.pop(cell_obj, None)
+        else:
+            self._rendered[cell_obj] = render
+
+    def _submit(self, action: str, ctl: CtlRuleT, render: CtlRender | None) -> None:
+        cell_obj = ctl.calc_cell.cell_obj  # type: ignore
+        with self._lock:
+            if self._in_recalc:
+                queued = self._pending.get(cell_obj, None)
+                if queued is not None and queued[0] == _ADD:
+                    # an add also sizes the control.
+                    action = _ADD
+                self._pending[cell_obj] = (action, ctl, render)
+                return
+        self._apply(cell_obj, action, ctl, render)
+
+    def _get_render(self, ctl: CtlRuleT) -> CtlRender | None:
+        if not isinstance(ctl, SimpleCtl) or ctl.is_deleted_cell:
+            # figure controls compare the image they show, see FigureCache.
+            return None
+        return CtlRender(
+            kind=ctl.get_rule_name(),
+            label=ctl.get_label(),
+            pos_size=ctl.get_cell_pos_size(),
+            state=int(CtlState(ctl.calc_cell).get_state()),
+        )
+
+    def _has_shape(self, ctl: CtlRuleT) -> bool:
+        cell = ctl.calc_cell  # type: ignore
+        return ShapeIndex(self._doc).has_shape(cell.calc_sheet, ctl.namer.ctl_shape_name)  # type: ignore
+
+    def add_ctl(self, ctl: CtlRuleT) -> None:
+        """
+        Adds the control of a cell if it differs from the control last rendered for the cell.
+
+        A control that only moved or changed size is updated.
+
+        Args:
+            ctl (CtlRuleT): Control of the cell.
+        """
+        render = self._get_render(ctl)
+        if render is None:
+            self._submit(_ADD, ctl, None)
+            return
+        cell_obj = ctl.calc_cell.cell_obj  # type: ignore
+        prev = self._rendered.get(cell_obj, None)
+        if prev is None or prev.kind != render.kind or prev.label != render.label or not self._has_shape(ctl):
+            self._submit(_ADD, ctl, render)
+        elif prev != render:
+            self._submit(_UPDATE, ctl, render)
+        else:
+            self._log.debug("CtlReconciler: add_ctl(): Control unchanged for cell %s", cell_obj)
+
+    def update_ctl(self, ctl: CtlRuleT) -> None:
+        """
+        Updates the control of a cell if its position, size or state differs from the control last rendered.
+
+        Args:
+            ctl (CtlRuleT): Control of the cell.
+        """
+        cell_obj = ctl.calc_cell.cell_obj  # type: ignore
+        render = self._get_render(ctl)
+        if render is not None and render == self._rendered.get(cell_obj, None) and self._has_shape(ctl):
+            self._log.debug("CtlReconciler: update_ctl(): Control unchanged for cell %s", cell_obj)
+            return
+        self._submit(_UPDATE, ctl, render)
+
+    def forget(self, cell: CalcCell) -> None:
+        """
+        Drops the rendered and queued control of a cell, used when the control of the cell is removed.
+
+        Args:
+            cell (CalcCell): Cell.
+        """
+        with self._lock:
+            self._rendered.pop(cell.cell_obj, None)
+            self._pending.pop(cell.cell_obj, None)
+
+    def clear(self) -> None:
+        """Drops all rendered and queued controls."""
+        with self._lock:
+            self._rendered.clear()
+            self._pending.clear()
+            self._in_recalc = False
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{CtlReconciler.__name__}"
+    inst = CtlReconciler._instances.get(key, None)
+    if inst is not None:
+        inst.clear()
+        CtlReconciler.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
@@ -78,7 +78,6 @@ class DataFrameCtl(SimpleCtl):
             self.log.debug("%s: update_ctl(): Entered", self.__class__.__name__)
             try:
                 sheet = self.calc_cell.calc_sheet
-                dp = sheet.draw_page
                 shape_name = self.namer.ctl_shape_name
 
                 cargs = CancelEventArgs(self)
@@ -90,7 +89,7 @@ class DataFrameCtl(SimpleCtl):
                     return
 
                 try:
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = self.shapes.find_shape_by_name(sheet, shape_name)
                     self.log.debug(
                         "%s: update_ctl(): Found Shape: %s",
                         self.__class__.__name__,
@@ -81,7 +81,6 @@ class DataTblCtl(SimpleCtl):
             self.log.debug(f"{self.__class__.__name__}: update_ctl(): Entered")
             try:
                 sheet = self.calc_cell.calc_sheet
-                dp = sheet.draw_page
                 shape_name = self.namer.ctl_shape_name
 
                 cargs = CancelEventArgs(self)
@@ -93,7 +92,7 @@ class DataTblCtl(SimpleCtl):
                     return
 
                 try:
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = self.shapes.find_shape_by_name(sheet, shape_name)
                     self.log.debug(
                         "%s: update_ctl(): Found Shape: %s",
                         self.__class__.__name__,
@@ -17,7 +17,10 @@ from ...event.shared_event import SharedEvent
 
 # from ..lpl_cell import LplCell
 from ...code.py_source_mgr import PyInstance
+from ...code.cell_prop_cache import CellPropCache
+from ...code.figure_cache import FigureCache
 from .cell_img import CellImg
+from .shape_index import ShapeIndex
 from .shape_namer import ShapeNamer
 from ...const.event_const import (
     CONTROL_ADDED,
@@ -39,7 +42,9 @@ class MatPlotFigureCtl:
         self.log = LogInst()
         self._py_src = PyInstance(self.calc_cell.calc_doc)
         self.namer = ShapeNamer(self.calc_cell)
-        self._prev_img = ""
+        self._figures = FigureCache(self.calc_cell.calc_doc)
+        self.props = CellPropCache(self.calc_cell.calc_doc)
+        self._shapes = ShapeIndex(self.calc_cell.calc_doc)
         self._supported_features = None
         self.shared_event = SharedEvent(self.calc_cell.calc_doc)
         with self.log.indent(True):
@@ -85,7 +90,7 @@ class MatPlotFigureCtl:
         2. Checks if the event was cancelled.
         3. Retrieves the source data for the cell.
         4. Checks if the cell is marked as deleted and raises an error if so.
-        5. Compares the current image with the previous image to determine if an update is necessary.
+        5. Compares the current image with the image the shape shows to determine if an update is necessary.
         6. Removes the existing control if an update is required.
         7. Inserts a new image linked to the cell.
         8. Sets the name of the shape.
@@ -120,7 +125,10 @@ class MatPlotFigureCtl:
                 # if self.log.is_debug:
                 #     for k, v in dd.items():
                 #         self.log.debug(f"src DotDict: {k}: {v}")
-                if self._prev_img == dot_dict.data:
+                shape_name = self.namer.shape_name
+                sheet = self.calc_cell.calc_sheet
+                is_inserted = self._figures.get_inserted(shape_name) == dot_dict.data
+                if is_inserted and self._shapes.has_shape(sheet, shape_name):
                     self.log.debug("MatPlotFigureCtl: add_ctl(): No change in image. Not adding again.")
                     return
                 self.remove_ctl()
@@ -130,7 +138,9 @@ class MatPlotFigureCtl:
                     return
                 ci = CellImg(self.calc_cell, self.calc_cell.lo_inst)
                 shp = ci.insert_cell_image_linked(svg_path)
-                shp.name = self.namer.shape_name  # type: ignore
+                shp.name = shape_name  # type: ignore
+                self._shapes.add(sheet, shp)
+                self._figures.set_inserted(shape_name, str(dot_dict.data))
 
                 # self._set_ctl_script(ctl)
                 self.log.debug("MatPlotFigureCtl: set_ctl_script(): Script set")
@@ -180,13 +190,15 @@ class MatPlotFigureCtl:
                     self.log.debug("%s: update_ctl(): Cancelled", self.__class__.__name__)
                     return
                 try:
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = self._shapes.find_shape_by_name(sheet, shape_name)
                     self.log.debug(
                         "%s: remove_ctl(): Found Shape: %s",
                         self.__class__.__name__,
                         shape_name,
                     )
                     dp.remove(shape.component)  # type: ignore
+                    self._shapes.remove(sheet, shape_name)
+                    self._figures.set_inserted(shape_name, "")
                     self.log.debug(
                         "%s: remove_ctl(): Removed Shape: %s",
                         self.__class__.__name__,
@@ -203,20 +215,20 @@ class MatPlotFigureCtl:
                     self.log.debug("%s: remove_ctl(): Leaving", self.__class__.__name__)
                     return None
 
-                if self.calc_cell.has_custom_property(self.key_maker.ctl_shape_key):
+                if self.props.has(self.calc_cell, self.key_maker.ctl_shape_key):
                     self.log.debug(
                         "%s: remove_ctl(): Removing custom %s",
                         self.__class__.__name__,
                         self.key_maker.ctl_shape_key,
                     )
-                    self.calc_cell.remove_custom_property(self.key_maker.ctl_shape_key)
-                if self.calc_cell.has_custom_property(self.key_maker.ctl_orig_ctl_key):
+                    self.props.remove(self.calc_cell, self.key_maker.ctl_shape_key)
+                if self.props.has(self.calc_cell, self.key_maker.ctl_orig_ctl_key):
                     self.log.debug(
                         "%s: remove_ctl(): Removing custom %s",
                         self.__class__.__name__,
                         self.key_maker.ctl_orig_ctl_key,
                     )
-                    self.calc_cell.remove_custom_property(self.key_maker.ctl_orig_ctl_key)
+                    self.props.remove(self.calc_cell, self.key_maker.ctl_orig_ctl_key)
 
                 self.shared_event.trigger_event(CONTROL_REMOVED, EventArgs.from_args(cargs))
             except Exception as e:
@@ -0,0 +1,198 @@
+"""
+Shapes of the sheets of a document indexed by name.
+
+``SpreadsheetDrawPage.find_shape_by_name()`` reads the name of every shape on the draw page,
+a control refresh of a sheet with many Python cells would read all the shapes once for each cell.
+The index reads the shapes of a sheet once and is kept current as controls insert and remove shapes.
+
+The index of a sheet is checked when it is used, a found shape must still have the name it is indexed by
+and a shape that is not found is only missing if the draw page has the number of shapes the index expects.
+When a check fails the index of the sheet is read again from the draw page.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, TYPE_CHECKING
+
+from ooodev.calc import CalcDoc
+from ooodev.draw.shapes.draw_shape import DrawShape
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+from ooodev.exceptions import ex as mEx  # noqa: N812
+
+from ...const.event_const import GBL_DOC_CLOSING
+from ...log.log_inst import LogInst
+from ...utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    from com.sun.star.drawing import XDrawPage
+    from com.sun.star.drawing import XShape
+    from ooodev.calc import CalcSheet
+    from ooodev.calc import SpreadsheetDrawPage
+
+
+class _SheetShapes:
+    def __init__(self, shapes: Dict[str, XShape], count: int) -> None:
+        self.shapes = shapes
+        self.count = count
+
+
+class ShapeIndex(SingletonBase):
+    """Shapes of the sheets of a document indexed by name."""
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._log = LogInst()
+        self._sheets: Dict[str, _SheetShapes] = {}
+        self._is_init = True
+
+    def find_shape_by_name(self, sheet: CalcSheet, shape_name: str) -> DrawShape[SpreadsheetDrawPage[CalcSheet]]:
+        """
+        Finds a shape of a sheet by name.
+
+        Args:
+            sheet (CalcSheet): Sheet of the shape.
+            shape_name (str): Name of the shape, not case sensitive.
+
+        Raises:
+            ShapeMissingError: If the shape is not found.
+
+        Returns:
+            DrawShape[SpreadsheetDrawPage[CalcSheet]]: Shape.
+        """
+        dp = sheet.draw_page
+        x_shape = self.get_x_shape(sheet.unique_id, dp.component, shape_name)
+        return DrawShape(owner=dp, component=x_shape, lo_inst=dp.lo_inst)
+
+    def has_shape(self, sheet: CalcSheet, shape_name: str) -> bool:
+        """
+        Gets if a sheet has a shape.
+
+        Args:
+            sheet (CalcSheet): Sheet of the shape.
+            shape_name (str): Name of the shape, not case sensitive.
+
+        Returns:
+            bool: ``True`` if the shape is found; Otherwise, ``False``.
+        """
+        try:
+            self.get_x_shape(sheet.unique_id, sheet.draw_page.component, shape_name)
+            return True
+        except mEx.ShapeMissingError:
+            return False
+
+    def get_x_shape(self, sheet_id: str, draw_page: XDrawPage, shape_name: str) -> XShape:
+        """
+        Finds a shape of a draw page by name.
+
+        Args:
+            sheet_id (str): Unique id of the sheet of the draw page.
+            draw_page (XDrawPage): Draw page.
+            shape_name (str): Name of the shape, not case sensitive.
+
+        Raises:
+            ShapeMissingError: If the shape is not found.
+
+        Returns:
+            XShape: Shape.
+        """
+        key = shape_name.casefold()
+        entry = self._sheets.get(sheet_id, None)
+        if entry is None:
+            entry = self._read(sheet_id, draw_page)
+
+        x_shape = entry.shapes.get(key, None)
+        if x_shape is not None:
+            if self._is_named(x_shape, key):
+                return x_shape
+            self._log.debug("ShapeIndex: get_x_shape(): Shape %s renamed or removed. Reading shapes.", shape_name)
+            entry = self._read(sheet_id, draw_page)
+        elif draw_page.getCount() != entry.count:
+            self._log.debug("ShapeIndex: get_x_shape(): Shape count changed. Reading sheet shapes.")
+            entry = self._read(sheet_id, draw_page)
+        else:
+            raise mEx.ShapeMissingError(f'No shape named "{shape_name}"')
+
+        x_shape = entry.shapes.get(key, None)
+        if x_shape is None:
+            raise mEx.ShapeMissingError(f'No shape named "{shape_name}"')
+        return x_shape
+
+    def _is_named(self, x_shape: XShape, key: str) -> bool:
+        try:
+            return str(x_shape.Name).casefold() == key  # type: ignore
+        except Exception:
+            # the shape has been disposed.
+            return False
+
+    def _read(self, sheet_id: str, draw_page: XDrawPage) -> _SheetShapes:
+        shapes: Dict[str, XShape] = {}
+        count = draw_page.getCount()
+        for i in range(count):
+            x_shape = draw_page.getByIndex(i)
+            key = str(x_shape.Name).casefold()  # type: ignore
+            # same as find_shape_by_name(), the first shape with the name is found.
+            if key and key not in shapes:
+                shapes[key] = x_shape
+        entry = _SheetShapes(shapes, count)
+        self._sheets[sheet_id] = entry
+        self._log.debug("ShapeIndex: _read(): Indexed %i shapes of sheet %s", count, sheet_id)
+        return entry
+
+    def add(self, sheet: CalcSheet, shape: Any) -> None:  # noqa: ANN401
+        """
+        Adds a shape that has been inserted into a sheet.
+
+        Args:
+            sheet (CalcSheet): Sheet of the shape.
+            shape (XShape, DrawShape): Inserted shape. The shape must be named.
+        """
+        entry = self._sheets.get(sheet.unique_id, None)
+        if entry is None:
+            # not indexed yet, the shape is read with the other shapes of the sheet.
+            return
+        x_shape = getattr(shape, "component", shape)
+        key = str(x_shape.Name).casefold()
+        if not key or key in entry.shapes:
+            self.invalidate(sheet)
+            return
+        entry.shapes[key] = x_shape
+        entry.count += 1
+
+    def remove(self, sheet: CalcSheet, shape_name: str) -> None:
+        """
+        Removes a shape that has been removed from a sheet.
+
+        Args:
+            sheet (CalcSheet): Sheet of the shape.
+            shape_name (str): Name of the removed shape.
+        """
+        entry = self._sheets.get(sheet.unique_id, None)
+        if entry is None:
+            return
+        if entry.shapes.pop(shape_name.casefold(), None) is None:
+            self.invalidate(sheet)
+            return
+        entry.count -= 1
+
+    def invalidate(self, sheet: CalcSheet | None = None) -> None:
+        """
+        Drops the index of a sheet so it is read again when next used.
+
+        Args:
+            sheet (CalcSheet, optional): Sheet. Defaults to all sheets.
+        """
+        if sheet is None:
+            self._sheets.clear()
+        else:
+            self._sheets.pop(sheet.unique_id, None)
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{ShapeIndex.__name__}"
+    if key in ShapeIndex._instances:
+        ShapeIndex.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
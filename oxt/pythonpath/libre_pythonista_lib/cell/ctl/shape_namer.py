@@ -4,6 +4,7 @@ import uno
 from ooodev.calc import CalcCell
 from ...log.log_inst import LogInst
 from ...ex import CustomPropertyMissingError
+from ...code.cell_prop_cache import CellPropCache
 
 if TYPE_CHECKING:
     from .....___lo_pip___.config import Config
@@ -33,8 +34,9 @@ class ShapeNamer:
         if self.is_deleted_cell:
             self._code_name = calc_cell.extra_data.code_name
         else:
-            if calc_cell.has_custom_property(self._cfg.cell_cp_codename):
-                self._code_name = calc_cell.get_custom_property(self._cfg.cell_cp_codename)
+            props = CellPropCache(calc_cell.calc_doc)
+            if props.has(calc_cell, self._cfg.cell_cp_codename):
+                self._code_name = props.get(calc_cell, self._cfg.cell_cp_codename)
             else:
                 with self.log.indent(True):
                     self.log.error(f"CtlNamer: __init__(): Custom Property not found: {self._cfg.cell_cp_codename}")
@@ -17,10 +17,12 @@ from ooodev.utils.helper.dot_dict import DotDict
 
 from .ctl_namer import CtlNamer
 from .cell_control import CellControl
+from .shape_index import ShapeIndex
 from ...ex import CellDeletedError
 from ...log.log_inst import LogInst
 from ...res.res_resolver import ResResolver
 from ..props.key_maker import KeyMaker
+from ...code.cell_prop_cache import CellPropCache
 from ...event.shared_event import SharedEvent
 
 from ...const.event_const import (
@@ -65,6 +67,8 @@ class SimpleCtl:
         self.res = ResResolver()
         self.key_maker = KeyMaker()
         self.shared_event = SharedEvent(self.calc_cell.calc_doc)
+        self.shapes = ShapeIndex(self.calc_cell.calc_doc)
+        self.props = CellPropCache(self.calc_cell.calc_doc)
 
     def _get_features(self) -> Set[str]:
         if self._supported_features is None:
@@ -215,11 +219,10 @@ class SimpleCtl:
                 # check for the shape on the draw page.
                 # If for some reason the control in not found it is possible a shape was there.
                 # In this case we need to remove the shape.
+                sheet = self.calc_cell.calc_sheet
                 with contextlib.suppress(mEx.ShapeMissingError):
-                    sheet = self.calc_cell.calc_sheet
-                    dp = sheet.draw_page
                     shape_name = self.namer.ctl_shape_name
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = self.shapes.find_shape_by_name(sheet, shape_name)
                     self.log.debug(
                         "%s: add_ctl(): Found Shape: %s. Assuming control is in tact.",
                         self.__class__.__name__,
@@ -240,6 +243,7 @@ class SimpleCtl:
                 btn = cell_ctl.insert_control_button(label=self._get_label(), name=name)
                 self.log.debug("%s: add_ctl(): Inserted Button: %s", self.__class__.__name__, name)
                 shape = btn.control_shape
+                self.shapes.add(sheet, shape)
 
                 self._set_size(shape)
                 btn.printable = False
@@ -252,8 +256,13 @@ class SimpleCtl:
                 # Optionally the sheet can store the extension location on save. Then can be use to update controls on load if needed.
                 self._set_ctl_script(btn)
                 self.log.debug("%s: add_ctl(): Leaving", self.__class__.__name__)
-                self.calc_cell.set_custom_property(self.key_maker.ctl_shape_key, self.namer.ctl_shape_name)
-                self.calc_cell.set_custom_property(self.key_maker.ctl_orig_ctl_key, self.get_rule_name())
+                self.props.set_many(
+                    self.calc_cell,
+                    {
+                        self.key_maker.ctl_shape_key: self.namer.ctl_shape_name,
+                        self.key_maker.ctl_orig_ctl_key: self.get_rule_name(),
+                    },
+                )
                 self.shared_event.trigger_event(CONTROL_ADDED, EventArgs.from_args(cargs))
                 return shape
             except Exception as e:
@@ -291,7 +300,6 @@ class SimpleCtl:
             self.log.debug(f"{self.__class__.__name__}: update_ctl(): Entered")
             try:
                 sheet = self.calc_cell.calc_sheet
-                dp = sheet.draw_page
                 shape_name = self.namer.ctl_shape_name
                 cargs = CancelEventArgs(self)
                 dd = DotDict(cell=self.calc_cell, shape_name=shape_name, control=self)
@@ -301,7 +309,7 @@ class SimpleCtl:
                     self.log.debug("%s: update_ctl(): Cancelled", self.__class__.__name__)
                     return
                 try:
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = self.shapes.find_shape_by_name(sheet, shape_name)
                     self.log.debug(f"{self.__class__.__name__}: update_ctl(): Found Shape: {shape_name}")
                     self._set_size(shape.component)  # type: ignore
                     self.log.debug("%s: update_ctl(): Leaving", self.__class__.__name__)
@@ -344,6 +352,10 @@ class SimpleCtl:
         size = self.calc_cell.component.Size
         return (ps.X, ps.Y, size.Width, size.Height)
 
+    def get_label(self) -> str:
+        """Gets the label of the control."""
+        return self._get_label()
+
     def _get_label(self) -> str:
         return "<>"
 
@@ -392,13 +404,14 @@ class SimpleCtl:
                     self.log.debug("%s: update_ctl(): Cancelled", self.__class__.__name__)
                     return
                 try:
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = self.shapes.find_shape_by_name(sheet, shape_name)
                     self.log.debug(
                         "%s: remove_ctl(): Found Shape: %s",
                         self.__class__.__name__,
                         shape_name,
                     )
                     dp.remove(shape.component)  # type: ignore
+                    self.shapes.remove(sheet, shape_name)
                     self.log.debug(
                         "%s: remove_ctl(): Removed Shape: %s",
                         self.__class__.__name__,
@@ -414,20 +427,20 @@ class SimpleCtl:
                     )
                     self.log.debug("%s: remove_ctl(): Leaving", self.__class__.__name__)
 
-                if self.calc_cell.has_custom_property(self.key_maker.ctl_shape_key):
+                if self.props.has(self.calc_cell, self.key_maker.ctl_shape_key):
                     self.log.debug(
                         "%s: remove_ctl(): Removing custom %s",
                         self.__class__.__name__,
                         self.key_maker.ctl_shape_key,
                     )
-                    self.calc_cell.remove_custom_property(self.key_maker.ctl_shape_key)
-                if self.calc_cell.has_custom_property(self.key_maker.ctl_orig_ctl_key):
+                    self.props.remove(self.calc_cell, self.key_maker.ctl_shape_key)
+                if self.props.has(self.calc_cell, self.key_maker.ctl_orig_ctl_key):
                     self.log.debug(
                         "%s: remove_ctl(): Removing custom %s",
                         self.__class__.__name__,
                         self.key_maker.ctl_orig_ctl_key,
                     )
-                    self.calc_cell.remove_custom_property(self.key_maker.ctl_orig_ctl_key)
+                    self.props.remove(self.calc_cell, self.key_maker.ctl_orig_ctl_key)
                 self.shared_event.trigger_event(CONTROL_REMOVED, EventArgs.from_args(cargs))
             except Exception as e:
                 self.log.error(f"{self.__class__.__name__}: remove_ctl error: {e}", exc_info=True)
@@ -17,6 +17,7 @@ from ooodev.events.args.event_args import EventArgs
 from ooodev.utils.helper.dot_dict import DotDict
 from ..cell_info import CellInfo
 from ...code.cell_cache import CellCache
+from ...code.cell_prop_cache import CellPropCache
 
 
 if TYPE_CHECKING:
@@ -131,8 +132,7 @@ class CodeCellListener(unohelper.Base, XModifyListener, EventsPartial):
                         self._log.debug(f"modified: Triggering event: {trigger_name}")
                         self.trigger_event("cell_custom_prop_modify", eargs)
                         if eargs.event_data.remove_custom_property:
-                            if calc_cell.has_custom_property(key):
-                                calc_cell.remove_custom_property(key)
+                            CellPropCache(calc_cell.calc_doc).remove(calc_cell, key)
                     else:
                         self.trigger_event("cell_modified", eargs)
                 except Exception as e:
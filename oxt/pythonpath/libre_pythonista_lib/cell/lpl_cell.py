@@ -7,12 +7,14 @@ from ooodev.exceptions import ex as mEx  # noqa: N812
 from ooodev.calc import CellObj
 from ..dispatch.cell_dispatch_state import CellDispatchState
 from .ctl.ctl_mgr import CtlMgr
+from .ctl.shape_index import ShapeIndex
 from .props.key_maker import KeyMaker
 from .state.ctl_state import CtlState
 from .state.state_kind import StateKind
 from ..const import DISPATCH_PY_OBJ_STATE, DISPATCH_DF_STATE
 from ..cell.result_action.pyc.rules.pyc_rules import PycRules
 from ..code.py_source_mgr import PySource, PyInstance
+from ..code.cell_prop_cache import CellPropCache
 from ..utils.pandas_util import PandasUtil
 from ..menus import menu_util as mu
 
@@ -92,7 +94,7 @@ class LplCell:
             # matched_rule.name is a cell.props.rule_names.RuleNames value.
             # set the pyc rule key custom property for the cell.
             # let update handle removing and adding new control
-            self.cell.set_custom_property(self._key_maker.pyc_rule_key, matched_rule.name)
+            CellPropCache(self.cell.calc_doc).set(self.cell, self._key_maker.pyc_rule_key, matched_rule.name)
             self._ctl_mgr.update_ctl(self.cell)
             self.refresh()
             self._log.debug("update_control() Done")
@@ -156,9 +158,8 @@ class LplCell:
                 shape_name = self.ctl_shape_name
                 if not shape_name:
                     return None
-                dp = self.cell.calc_sheet.draw_page
                 try:
-                    shape = dp.find_shape_by_name(shape_name)
+                    shape = ShapeIndex(self.cell.calc_doc).find_shape_by_name(self.cell.calc_sheet, shape_name)
                 except mEx.ShapeMissingError:
                     shape = None
                 return shape  # type: ignore
@@ -341,7 +342,7 @@ class LplCell:
     @pyc_rule_name.setter
     def pyc_rule_name(self, value: str) -> None:
         key = self._key_maker.pyc_rule_key
-        self.cell.set_custom_property(key, value)
+        CellPropCache(self.cell.calc_doc).set(self.cell, key, value)
         if "custom_properties" in self._cache:
             del self._cache["custom_properties"]
 
@@ -460,7 +461,7 @@ class LplCell:
     def cell_prop_addr(self, value: CellObj) -> None:
         key = self._key_maker.cell_addr_key
         addr = f"sheet_index={value.sheet_idx}&cell_addr={value}"
-        self.cell.set_custom_property(key, addr)
+        CellPropCache(self.cell.calc_doc).set(self.cell, key, addr)
         if "custom_properties" in self._cache:
             del self._cache["custom_properties"]
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, List, TYPE_CHECKING, Type
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING, Type
+import sys
 from ooodev.calc import CalcCell
 from ooodev.utils.helper.dot_dict import DotDict
 
@@ -27,7 +28,12 @@ else:
 
 
 class PycRules(SingletonBase):
-    """Singleton Class. Manages rules for Versions"""
+    """
+    Singleton Class. Manages rules for Versions
+
+    Rules are indexed by the result types they can match, see ``RuleBase.match_types``.
+    A result is only tried against the rules of its type, in the order the rules are registered.
+    """
 
     # _instance = None
 
@@ -47,6 +53,8 @@ class PycRules(SingletonBase):
         with self._log.indent(True):
             self._log.debug("%s.__init__() Initializing.", self.__class__.__name__)
         self._rules: List[Type[PycRuleT]] = []
+        self._type_index: Dict[type, Tuple[Type[PycRuleT], ...]] = {}
+        self._name_index: Dict[str, Type[PycRuleT]] | None = None
         self._register_known_rules()
         self._default_rule = RuleNone
         with self._log.indent(True):
@@ -101,6 +109,7 @@ class PycRules(SingletonBase):
                 return
             self._log.debug("add_rule_at() Rule %s registered at index %i.", rule, index)
             self._rules.insert(index, rule)
+            self._clear_index()
 
     def remove_rule(self, rule: Type[PycRuleT]) -> None:
         """
@@ -115,6 +124,7 @@ class PycRules(SingletonBase):
         with self._log.indent(True):
             try:
                 self._rules.remove(rule)
+                self._clear_index()
                 self._log.debug("remove_rule_at() Rule %s removed.", rule)
             except ValueError as e:
                 msg = f"{self.__class__.__name__}.unregister_rule() Unable to unregister rule."
@@ -133,6 +143,7 @@ class PycRules(SingletonBase):
         with self._log.indent(True):
             try:
                 del self._rules[index]
+                self._clear_index()
                 self._log.debug("remove_rule_at() Rule at index %i removed.", index)
             except IndexError as e:
                 msg = f"{self.__class__.__name__}.unregister_rule() Unable to unregister rule."
@@ -141,6 +152,54 @@ class PycRules(SingletonBase):
 
     def _reg_rule(self, rule: Type[PycRuleT]) -> None:
         self._rules.append(rule)
+        self._clear_index()
+
+    def _clear_index(self) -> None:
+        self._type_index.clear()
+        self._name_index = None
+
+    def _get_type_rules(self, data_type: type) -> Tuple[Type[PycRuleT], ...]:
+        """
+        Gets the rules that can match a result type.
+
+        The rules of a type are found once from the ``match_types`` of the rules, subclasses match by their MRO.
+        """
+        rules = self._type_index.get(data_type, None)
+        if rules is None:
+            rules = tuple(
+                rule
+                for rule in self._rules
+                if getattr(rule, "match_types", None) is None
+                or issubclass(data_type, self._get_match_types(rule.match_types))  # type: ignore
+            )
+            self._type_index[data_type] = rules
+        return rules
+
+    def _get_match_types(self, match_types: Tuple[type | str, ...]) -> Tuple[type, ...]:
+        """
+        Gets the types of ``match_types``, types given by name are looked up in the imported modules.
+
+        A type of a module that is not imported is left out, a result can not be an instance of it.
+        """
+        result: List[type] = []
+        for match_type in match_types:
+            if isinstance(match_type, str):
+                mod_name, _, type_name = match_type.rpartition(".")
+                mod = sys.modules.get(mod_name, None)
+                match_type = getattr(mod, type_name, None) if mod is not None else None
+                if match_type is None:
+                    continue
+            result.append(match_type)
+        return tuple(result)
+
+    def _get_name_index(self, cell: CalcCell) -> Dict[str, Type[PycRuleT]]:
+        if self._name_index is None:
+            index: Dict[str, Type[PycRuleT]] = {}
+            for rule in self._rules:
+                # same as the search this replaces, the first rule with the name is found.
+                index.setdefault(rule(cell, None).name, rule)  # type: ignore
+            self._name_index = index
+        return self._name_index
 
     def _register_known_rules(self) -> None:
         # re.compile(r"^(\w+)\s*=")
@@ -174,7 +233,7 @@ class PycRules(SingletonBase):
             if is_db:
                 self._log.debug("get_matched_rule() cell: %s. Data Type %s", cell.cell_obj, type(data).__name__)
             result = None
-            for rule in self._rules:
+            for rule in self._get_type_rules(type(data.get("data", None))):
                 inst = rule(cell, data)
                 if inst.get_is_match():
                     if is_db:
@@ -206,11 +265,11 @@ class PycRules(SingletonBase):
                 return None
             rule_name = cell.get_custom_property(key)
 
-            for rule in self._rules:
+            rule = self._get_name_index(cell).get(rule_name, None)
+            if rule is not None:
                 inst = rule(cell, None)
-                if inst.name == rule_name:
-                    self._log.debug("find_rule() Rule %s found.", inst)
-                    return inst
+                self._log.debug("find_rule() Rule %s found.", inst)
+                return inst
             # this should never happen LastDict is always a match
             self._log.warning("find_rule() No rule found.")
             return None
@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Tuple, TYPE_CHECKING
 from ooodev.calc import CalcCell
 from ooodev.utils.helper.dot_dict import DotDict
 from ....props.key_maker import KeyMaker
+from .....code.cell_prop_cache import CellPropCache
 
 if TYPE_CHECKING:
     from .......___lo_pip___.config import Config
@@ -11,6 +12,14 @@ else:
 
 
 class RuleBase:
+    match_types: Tuple[type | str, ...] | None = None
+    """
+    Result types the rule can match, ``None`` for any type. ``PycRules`` only tries the rule for these types.
+
+    A type can be given by its module and name such as ``pandas.DataFrame``,
+    so the rule module does not need to import the module of the type.
+    """
+
     def __init__(self, cell: CalcCell, data: DotDict) -> None:
         self._cell = cell
         self._dd_data = data
@@ -34,8 +43,8 @@ class RuleBase:
         return self.data
 
     def _update_properties(self, **kwargs: Any) -> None:  # noqa: ANN401
-        dd = DotDict(**kwargs)
-        self.cell.set_custom_properties(dd)
+        # only values that changed are written.
+        CellPropCache(self.cell.calc_doc).set_many(self.cell, kwargs)
 
     def _get_data_type_name(self) -> str:
         raise NotImplementedError
@@ -45,10 +54,9 @@ class RuleBase:
 
     def remove_custom_properties(self) -> None:
         """Removes the custom properties that were added for this rule"""
-        if self._cell.has_custom_property(self.cell_prop_key):
-            self.cell.remove_custom_property(self.cell_prop_key)
-        if self._cell.has_custom_property(self.cell_pyc_rule_key):
-            self.cell.remove_custom_property(self.cell_pyc_rule_key)
+        props = CellPropCache(self.cell.calc_doc)
+        props.remove(self.cell, self.cell_prop_key)
+        props.remove(self.cell, self.cell_pyc_rule_key)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}({self.cell.cell_obj}, {self.data})>"
@@ -4,6 +4,8 @@ from .rule_base import RuleBase
 
 
 class RuleFloat(RuleBase):
+    match_types = (float, str)
+
     def _get_data_type_name(self) -> str:
         return self.key_maker.rule_names.cell_data_type_float
 
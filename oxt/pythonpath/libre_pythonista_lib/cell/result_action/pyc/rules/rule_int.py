@@ -5,6 +5,8 @@ from .rule_base import RuleBase
 
 
 class RuleInt(RuleBase):
+    match_types = (int, str)
+
     def _get_data_type_name(self) -> str:
         return self.key_maker.rule_names.cell_data_type_int
 
@@ -1,15 +1,19 @@
 from __future__ import annotations
-from typing import Any, cast
+from typing import Any, cast, TYPE_CHECKING
 from ooodev.calc import CalcCell
-import pandas as pd
 from .rule_base import RuleBase
 from .....cell.state.ctl_state import CtlState
 from .....cell.state.state_kind import StateKind
 from .....const import DISPATCH_DF_STATE
 from .....utils.pandas_util import PandasUtil
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class RulePdDf(RuleBase):
+    match_types = ("pandas.DataFrame",)
+
     def __init__(self, cell: CalcCell, data: Any) -> None:  # noqa: ANN401
         super().__init__(cell, data)
         self.state_key = self.key_maker.ctl_state_key
@@ -27,7 +31,7 @@ class RulePdDf(RuleBase):
         result = self.data.get("data", None)
         if result is None:
             return False
-        is_df = isinstance(result, pd.DataFrame)
+        is_df = PandasUtil.is_dataframe(result)
         if not is_df:
             return False
         headers = self.data.get("headers", False)
@@ -41,35 +45,9 @@ class RulePdDf(RuleBase):
         CtlState(self.cell).set_state(state)
 
     def _pandas_to_array(self) -> Any:  # noqa: ANN401
-        df = cast(pd.DataFrame, self.data.data)
-        if PandasUtil.is_describe_output(df):
-            arr = PandasUtil.pandas_to_array(df, convert=False)
-            PandasUtil.convert_array_to_lo(arr)
-            return arr
-        return PandasUtil.pandas_to_array(df)
-        has_headers = PandasUtil.has_headers(df)
-        if not has_headers:
-            df.values.tolist()
-
-        # data_tuple = tuple(df.itertuples(index=False, name=None))
-        # return data_tuple
-        headers = [df.columns.tolist()]
-        # Append the DataFrame values to the list
-        list_values = df.values.tolist()
-        if not list_values:
-            return headers
-
-        has_index_names = PandasUtil.has_index_names(df)
-        if has_index_names:
-            index_names = PandasUtil.get_index_names(df)
-            # insert an index name into each row
-            for i, index_name in enumerate(index_names):
-                list_values[i].insert(0, index_name)
-            # insert an empty value into the start of the headers
-            headers[0].insert(0, "")
-
-        result = headers + list_values
-        return result
+        df = cast("pd.DataFrame", self.data.data)
+        # describe() output has dates in mixed columns, they are shown as strings.
+        return PandasUtil.pandas_to_calc_array(df, date_str=PandasUtil.is_describe_output(df))
 
     def action(self) -> Any:  # noqa: ANN401
         state = self._get_state()
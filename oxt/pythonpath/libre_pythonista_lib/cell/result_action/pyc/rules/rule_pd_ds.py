@@ -1,18 +1,21 @@
 from __future__ import annotations
-from typing import Any, cast
-from collections import OrderedDict
+from typing import Any, cast, TYPE_CHECKING
 from ooodev.calc import CalcCell
-import pandas as pd
 from .rule_base import RuleBase
 from .....cell.state.ctl_state import CtlState
 from .....cell.state.state_kind import StateKind
 from .....const import DISPATCH_DS_STATE
 from .....utils.pandas_util import PandasUtil
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class RulePdDs(RuleBase):
     """Rule for handling pandas DataSeries."""
 
+    match_types = ("pandas.Series",)
+
     def __init__(self, cell: CalcCell, data: Any) -> None:  # noqa: ANN401
         super().__init__(cell, data)
         self.state_key = self.key_maker.ctl_state_key
@@ -30,7 +33,7 @@ class RulePdDs(RuleBase):
         result = self.data.get("data", None)
         if result is None:
             return False
-        return isinstance(result, pd.Series)
+        return PandasUtil.is_series(result)
 
     def _get_state(self) -> StateKind:
         state = CtlState(self.cell).get_state()
@@ -40,20 +43,8 @@ class RulePdDs(RuleBase):
         CtlState(self.cell).set_state(state)
 
     def _pandas_to_array(self) -> Any:  # noqa: ANN401
-        ds = cast(pd.Series, self.data.data)
-        if PandasUtil.is_date_series(ds):
-            ds_copy = ds.copy()
-            PandasUtil.pandas_series_to_lo_calc(ds_copy)
-            d = ds_copy.to_dict(into=OrderedDict)
-        else:
-            d = ds.to_dict(into=OrderedDict)
-
-        d = PandasUtil.convert_dict_keys_to_lo_date(d)
-
-        list_2d = [[k, v] for k, v in d.items()]
-        if ds.name:
-            list_2d.insert(0, ["", ds.name])
-        return list_2d
+        ds = cast("pd.Series", self.data.data)
+        return PandasUtil.pandas_series_to_calc_array(ds)
 
     def action(self) -> Any:  # noqa: ANN401
         state = self._get_state()
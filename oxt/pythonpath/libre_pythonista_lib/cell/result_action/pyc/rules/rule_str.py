@@ -5,6 +5,8 @@ from .rule_base import RuleBase
 
 
 class RuleStr(RuleBase):
+    match_types = (str,)
+
     def _get_data_type_name(self) -> str:
         return self.key_maker.rule_names.cell_data_type_str
 
@@ -10,6 +10,7 @@ except ImportError:
 from ooodev.calc import CalcCell
 from .state_base import StateBase
 from .state_kind import StateKind
+from ...code.cell_prop_cache import CellPropCache
 
 
 class CtlState(StateBase):
@@ -32,8 +33,9 @@ class CtlState(StateBase):
         Returns:
             StateKind: The state.
         """
-        if self.cell.has_custom_property(self.key_maker.ctl_state_key):
-            state = self.cell.get_custom_property(self.key_maker.ctl_state_key, StateKind.PY_OBJ.value)
+        props = CellPropCache(self.cell.calc_doc)
+        if props.has(self.cell, self.key_maker.ctl_state_key):
+            state = props.get(self.cell, self.key_maker.ctl_state_key, StateKind.PY_OBJ.value)
             with contextlib.suppress(Exception):
                 return StateKind(state)
 
@@ -49,8 +51,8 @@ class CtlState(StateBase):
         Args:
             value (StateKind): The state.
         """
+        props = CellPropCache(self.cell.calc_doc)
         if value == StateKind.UNKNOWN:
-            if self.cell.has_custom_property(self.key_maker.ctl_state_key):
-                self.cell.remove_custom_property(self.key_maker.ctl_state_key)
+            props.remove(self.cell, self.key_maker.ctl_state_key)
             return
-        self.cell.set_custom_property(self.key_maker.ctl_state_key, int(value))
+        props.set(self.cell, self.key_maker.ctl_state_key, int(value))
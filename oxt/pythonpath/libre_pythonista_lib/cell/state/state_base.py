@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Any
 from ooodev.calc import CalcCell
 from ..props.key_maker import KeyMaker
+from ...code.cell_prop_cache import CellPropCache
 
 
 class StateBase:
@@ -16,7 +17,7 @@ class StateBase:
         raise NotImplementedError
 
     def set_state(self, value: Any) -> None:
-        self.cell.set_custom_property(self.key_maker.ctl_state_key, value)
+        CellPropCache(self.cell.calc_doc).set(self.cell, self.key_maker.ctl_state_key, value)
 
     # region properties
     @property
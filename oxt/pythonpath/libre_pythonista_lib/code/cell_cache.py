@@ -14,6 +14,7 @@ from ooodev.events.events import Events
 from ooodev.events.args.event_args import EventArgs
 from ooodev.utils.helper.dot_dict import DotDict
 from ..cell.props.key_maker import KeyMaker
+from .cell_prop_cache import CellPropCache
 from ..utils.singleton_base import SingletonBase
 from ..log.log_inst import LogInst
 from ..utils.gen_util import GenUtil
@@ -94,6 +95,7 @@ class CellCache(SingletonBase):
                 raise ValueError("Sheet index not set")
 
             km = KeyMaker()
+            props = CellPropCache(self._doc)
             sheet = self._doc.sheets[sheet_idx]
             for cell, icp in self._code[sheet_idx].items():
                 calc_cell = sheet[cell]
@@ -102,9 +104,9 @@ class CellCache(SingletonBase):
                 addr = GenUtil.create_cell_addr_query_str(
                     sheet_idx, str(calc_cell.cell_obj)
                 )
-                current = calc_cell.get_custom_property(km.cell_addr_key, addr)
+                current = props.get(calc_cell, km.cell_addr_key, addr)
                 if current != addr:
-                    calc_cell.set_custom_property(km.cell_addr_key, addr)
+                    props.set(calc_cell, km.cell_addr_key, addr)
                     args = EventArgs(self)
                     args.event_data = DotDict(
                         calc_cell=calc_cell,
@@ -764,3 +766,5 @@ class CellCache(SingletonBase):
             log.debug(
                 f"CellCache.reset_instance() - No instance to reset for doc: {doc.runtime_uid}"
             )
+        # cell properties are kept by cell address, cells may have moved.
+        CellPropCache(doc).clear()
@@ -0,0 +1,158 @@
+"""
+Dependency graph of code cells.
+
+Cells are nodes in document order. A cell depends on the last cell before it that wrote a name it reads.
+Because edges always point to an earlier cell the graph is a DAG.
+
+A cell that uses a function or class defined by an earlier cell reads and writes the names of its body.
+"""
+
+from __future__ import annotations
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, TYPE_CHECKING
+from dataclasses import dataclass, field
+
+if TYPE_CHECKING:
+    from .code_names import CodeNames
+
+
+@dataclass(frozen=True)
+class CellNode:
+    """
+    Node of a ``CellDepGraph``.
+
+    Attributes:
+        reads (FrozenSet[str]): Names read by the cell.
+        writes (FrozenSet[str]): Names written by the cell.
+        is_opaque (bool): ``True`` if the cell may read or write any name.
+        defs (Mapping[str, CodeNames]): Names of the bodies of the functions and classes defined by the cell.
+    """
+
+    reads: FrozenSet[str] = field(default_factory=frozenset)
+    writes: FrozenSet[str] = field(default_factory=frozenset)
+    is_opaque: bool = False
+    defs: Mapping[str, CodeNames] = field(default_factory=dict, hash=False)
+
+    def resolve_calls(self, defs: Mapping[str, CodeNames]) -> CellNode:
+        """
+        Gets the node with the names of the bodies of the functions and classes the cell uses.
+
+        A function is used when its name is read, calling it or passing it on. Functions used by a body are followed.
+
+        Args:
+            defs (Mapping[str, CodeNames]): Functions and classes defined before the cell, see ``update_defs()``.
+                The functions and classes of the cell itself are added.
+
+        Returns:
+            CellNode: Node with the names of the bodies added, or this node if it uses none.
+        """
+        scope = {**defs, **self.defs} if self.defs else defs
+        pending = [name for name in self.reads if name in scope]
+        if not pending:
+            return self
+        reads = set(self.reads)
+        writes = set(self.writes)
+        is_opaque = self.is_opaque
+        seen: Set[str] = set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            names = scope[name]
+            reads.update(names.reads)
+            writes.update(names.writes)
+            is_opaque = is_opaque or names.is_opaque
+            pending.extend(read for read in names.reads if read in scope and read not in seen)
+        return CellNode(reads=frozenset(reads), writes=frozenset(writes), is_opaque=is_opaque, defs=self.defs)
+
+    def update_defs(self, defs: Dict[str, CodeNames]) -> None:
+        """
+        Updates the functions and classes defined so far with the ones the cell defines or rebinds.
+
+        Args:
+            defs (Dict[str, CodeNames]): Functions and classes defined before the cell.
+        """
+        for name in self.writes:
+            if name in self.defs:
+                defs[name] = self.defs[name]
+            else:
+                defs.pop(name, None)
+
+
+class CellDepGraph:
+    """
+    Dependency DAG for code cells.
+
+    A node of ``None`` means the names of the cell are not known and the cell is treated as opaque.
+    """
+
+    def __init__(self, nodes: Sequence[Optional[CellNode]], defs: Optional[Mapping[str, CodeNames]] = None) -> None:
+        """
+        Constructor
+
+        Args:
+            nodes (Sequence[CellNode | None]): Nodes in document order.
+            defs (Mapping[str, CodeNames], optional): Functions and classes defined by the cells before the first node,
+                see ``CellNode.update_defs()``.
+        """
+        self._nodes = [CellNode(is_opaque=True) if node is None else node for node in nodes]
+        self._deps = self._build({} if defs is None else dict(defs))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _build(self, defs: Dict[str, CodeNames]) -> List[Set[int]]:
+        deps: List[Set[int]] = []
+        last_writer: Dict[str, int] = {}
+        last_opaque = -1
+        for i, cell_node in enumerate(self._nodes):
+            node = cell_node.resolve_calls(defs)
+            cell_node.update_defs(defs)
+            node_deps: Set[int] = set()
+            if node.is_opaque:
+                # depends on everything before it.
+                node_deps.update(range(i))
+            else:
+                for name in node.reads:
+                    writer = max(last_writer.get(name, -1), last_opaque)
+                    if writer >= 0:
+                        node_deps.add(writer)
+            deps.append(node_deps)
+            if node.is_opaque:
+                last_opaque = i
+            for name in node.writes:
+                last_writer[name] = i
+        return deps
+
+    def get_dependencies(self, index: int) -> Set[int]:
+        """
+        Gets the indexes of the cells the cell at ``index`` directly depends on.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            Set[int]: Indexes of earlier cells.
+        """
+        return set(self._deps[index])
+
+    def get_dependents(self, indexes: Iterable[int]) -> List[int]:
+        """
+        Gets the cells that transitively depend on any of the given cells.
+
+        Args:
+            indexes (Iterable[int]): Indexes of changed cells.
+
+        Returns:
+            List[int]: Sorted indexes of the changed cells and all cells that depend on them.
+        """
+        affected = set(indexes)
+        if not affected:
+            return []
+        start = min(affected)
+        for i in range(start + 1, len(self._nodes)):
+            if i in affected:
+                continue
+            if not self._deps[i].isdisjoint(affected):
+                affected.add(i)
+        return sorted(affected)
@@ -0,0 +1,278 @@
+"""
+Per cell execution profile.
+
+Each execution of a code cell records its wall time, CPU time, result size and optionally its peak memory.
+The records are kept in a ring buffer per document and can be shown sorted by cost in the log window.
+Unlike ``VizTracerMgr`` the profile is cheap enough to always be on.
+"""
+
+from __future__ import annotations
+from typing import Any, Deque, Dict, List, Tuple, TYPE_CHECKING
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+from ooodev.utils.data_type.cell_obj import CellObj
+from ooodev.utils.string.str_list import StrList
+
+from ..const.event_const import GBL_DOC_CLOSING
+from ..doc_props.calc_props import CalcProps
+from ..utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    from .py_source_mgr import PySource
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+
+def get_result_size(value: Any) -> int:  # noqa: ANN401
+    """
+    Gets the approximate size in bytes of a cell result.
+
+    Arrays and DataFrames report the size of their data, other objects their shallow size.
+    """
+    if value is None:
+        return 0
+    try:
+        memory_usage = getattr(value, "memory_usage", None)
+        if callable(memory_usage):
+            # DataFrame returns a Series, Series returns an int.
+            usage = memory_usage(index=True, deep=False)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        nbytes = getattr(value, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes
+        return sys.getsizeof(value)
+    except Exception:
+        return 0
+
+
+@dataclass(frozen=True)
+class CellProfile:
+    """
+    Profile of a single execution of a code cell.
+
+    Attributes:
+        key (Tuple[int, int, int]): Key of the cell, ``(sheet, row, col)``.
+        unique_id (str): Unique id of the cell source.
+        wall_time (float): Elapsed seconds.
+        cpu_time (float): CPU seconds used by the process.
+        peak_memory (int): Peak bytes allocated by Python. ``-1`` when memory is not traced.
+        result_size (int): Approximate size in bytes of the result.
+        timestamp (float): Time the execution finished, see ``time.time()``.
+    """
+
+    key: Tuple[int, int, int]
+    unique_id: str
+    wall_time: float
+    cpu_time: float
+    peak_memory: int
+    result_size: int
+    timestamp: float
+
+    @property
+    def cell_name(self) -> str:
+        """Gets the cell name such as ``A1``."""
+        sheet_idx, row, col = self.key
+        return str(CellObj.from_idx(col_idx=col, row_idx=row, sheet_idx=sheet_idx))
+
+
+@dataclass
+class CellProfileSummary:
+    """
+    Executions of a cell that are in the ring buffer, added together.
+
+    Attributes:
+        key (Tuple[int, int, int]): Key of the cell, ``(sheet, row, col)``.
+        cell_name (str): Cell name such as ``A1``.
+        runs (int): Number of executions.
+        total_wall_time (float): Total elapsed seconds.
+        max_wall_time (float): Longest execution in seconds.
+        total_cpu_time (float): Total CPU seconds.
+        peak_memory (int): Largest peak memory. ``-1`` when memory is not traced.
+        result_size (int): Result size of the last execution.
+    """
+
+    key: Tuple[int, int, int]
+    cell_name: str
+    runs: int = 0
+    total_wall_time: float = 0.0
+    max_wall_time: float = 0.0
+    total_cpu_time: float = 0.0
+    peak_memory: int = -1
+    result_size: int = 0
+
+
+class CellProfiler(SingletonBase):
+    """
+    Records the execution of code cells for a document.
+
+    ``PySourceManager`` calls ``start()`` before a cell is executed and ``stop()`` after.
+    """
+
+    MAX_ENTRIES = 1000
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._entries: Deque[CellProfile] = deque(maxlen=CellProfiler.MAX_ENTRIES)
+        self._owns_tracing = False
+        self._trace_memory = False
+        try:
+            self._trace_memory = bool(CalcProps(doc).profile_memory)
+        except Exception:
+            self._log.warning("Unable to read profile_memory property.", exc_info=True)
+        if self._trace_memory:
+            self._start_tracing()
+        self._is_init = True
+
+    def _start_tracing(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def _stop_tracing(self) -> None:
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._owns_tracing = False
+
+    def start(self) -> Tuple[float, float, int]:
+        """
+        Starts measuring an execution.
+
+        Returns:
+            Tuple[float, float, int]: Start state to pass to ``stop()``.
+        """
+        mem_start = -1
+        if self._trace_memory and tracemalloc.is_tracing():
+            reset_peak = getattr(tracemalloc, "reset_peak", None)  # python 3.9+
+            if reset_peak is not None:
+                reset_peak()
+                mem_start = 0
+            else:
+                mem_start = tracemalloc.get_traced_memory()[0]
+        return time.perf_counter(), time.process_time(), mem_start
+
+    def stop(self, start: Tuple[float, float, int], py_src: PySource, result: Any) -> CellProfile:  # noqa: ANN401
+        """
+        Records an execution.
+
+        Args:
+            start (Tuple[float, float, int]): Value returned by ``start()``.
+            py_src (PySource): Source that was executed.
+            result (Any): Result of the execution.
+
+        Returns:
+            CellProfile: The recorded profile.
+        """
+        wall = time.perf_counter() - start[0]
+        cpu = time.process_time() - start[1]
+        peak = -1
+        if start[2] >= 0 and tracemalloc.is_tracing():
+            peak = max(0, tracemalloc.get_traced_memory()[1] - start[2])
+        entry = CellProfile(
+            key=(py_src.sheet_idx, py_src.row, py_src.col),
+            unique_id=py_src.unique_id,
+            wall_time=wall,
+            cpu_time=cpu,
+            peak_memory=peak,
+            result_size=get_result_size(result),
+            timestamp=time.time(),
+        )
+        with self._lock:
+            self._entries.append(entry)
+        return entry
+
+    def get_entries(self) -> List[CellProfile]:
+        """Gets the recorded executions, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def get_summary(self) -> List[CellProfileSummary]:
+        """Gets the recorded executions added together per cell, most expensive cell first."""
+        summaries: Dict[Tuple[int, int, int], CellProfileSummary] = {}
+        for entry in self.get_entries():
+            summary = summaries.get(entry.key)
+            if summary is None:
+                summary = CellProfileSummary(key=entry.key, cell_name=entry.cell_name)
+                summaries[entry.key] = summary
+            summary.runs += 1
+            summary.total_wall_time += entry.wall_time
+            summary.max_wall_time = max(summary.max_wall_time, entry.wall_time)
+            summary.total_cpu_time += entry.cpu_time
+            summary.peak_memory = max(summary.peak_memory, entry.peak_memory)
+            summary.result_size = entry.result_size
+        return sorted(summaries.values(), key=lambda s: s.total_wall_time, reverse=True)
+
+    def get_report(self) -> str:
+        """Gets the summary as a text table, most expensive cell first."""
+        sb = StrList(sep="\n")
+        sb.append(
+            f"{'Sheet':>5} {'Cell':<8} {'Runs':>5} {'Total (s)':>10} {'Max (s)':>10} {'CPU (s)':>10} "
+            f"{'Peak Mem':>10} {'Result':>10}"
+        )
+        for s in self.get_summary():
+            peak = "-" if s.peak_memory < 0 else _format_bytes(s.peak_memory)
+            sb.append(
+                f"{s.key[0]:>5} {s.cell_name:<8} {s.runs:>5} {s.total_wall_time:>10.4f} {s.max_wall_time:>10.4f} "
+                f"{s.total_cpu_time:>10.4f} {peak:>10} {_format_bytes(s.result_size):>10}"
+            )
+        return str(sb)
+
+    def clear(self) -> None:
+        """Removes all recorded executions."""
+        with self._lock:
+            self._entries.clear()
+
+    def dispose(self) -> None:
+        """Stops memory tracing if it was started by the profiler."""
+        self._stop_tracing()
+
+    @property
+    def trace_memory(self) -> bool:
+        """
+        Gets/Sets if the peak memory of each execution is traced.
+
+        Tracing memory slows down the execution of all Python code. The setting is saved with the document.
+        """
+        return self._trace_memory
+
+    @trace_memory.setter
+    def trace_memory(self, value: bool) -> None:
+        self._trace_memory = value
+        CalcProps(self._doc).profile_memory = value
+        if value:
+            self._start_tracing()
+        else:
+            self._stop_tracing()
+
+
+def _format_bytes(value: int) -> str:
+    size = float(value)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{CellProfiler.__name__}"
+    inst = CellProfiler._instances.get(key, None)
+    if inst is not None:
+        inst.dispose()
+        CellProfiler.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
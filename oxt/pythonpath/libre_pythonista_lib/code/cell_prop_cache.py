@@ -0,0 +1,203 @@
+"""
+Custom properties of the code cells of a document, kept in memory.
+
+A cell custom property is stored in a hidden form control, each write removes and adds the property and marks the
+document as modified. Every ``PY.C`` evaluation sets the same properties of its cell again,
+the cache compares a write with the value last read or written and only writes a value that differs.
+
+Writes made while a recalculation is evaluating the code cells are kept in memory and written together when the last
+code cell has been evaluated or Calc has calculated the formulas. Reads are served from memory.
+
+The cache is keyed by cell address, it is cleared when ``CellCache`` is reset because cells have moved.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Mapping, Tuple, TYPE_CHECKING
+import threading
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+from ooodev.utils.helper.dot_dict import DotDict
+
+from ..const.event_const import GBL_DOC_CLOSING
+from ..utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcCell
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+_MISSING = object()
+
+
+class CellPropCache(SingletonBase):
+    """Custom properties of the code cells of a document, kept in memory."""
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.RLock()
+        self._values: Dict[CellObj, Dict[str, Any]] = {}
+        self._pending: Dict[CellObj, Tuple[CalcCell, Dict[str, Any]]] = {}
+        self._in_recalc = False
+        self._is_init = True
+
+    def _get_value(self, cell: CalcCell, name: str) -> Any:  # noqa: ANN401
+        values = self._values.setdefault(cell.cell_obj, {})
+        value = values.get(name, _MISSING)
+        if value is _MISSING and name not in values:
+            value = cell.get_custom_property(name) if cell.has_custom_property(name) else _MISSING
+            values[name] = value
+        return value
+
+    def get(self, cell: CalcCell, name: str, default: Any = None) -> Any:  # noqa: ANN401
+        """
+        Gets a custom property of a cell.
+
+        Args:
+            cell (CalcCell): Cell.
+            name (str): Property name.
+            default (Any, optional): Value returned when the cell does not have the property. Defaults to ``None``.
+
+        Returns:
+            Any: Property value.
+        """
+        with self._lock:
+            value = self._get_value(cell, name)
+        return default if value is _MISSING else value
+
+    def has(self, cell: CalcCell, name: str) -> bool:
+        """
+        Gets if a cell has a custom property.
+
+        Args:
+            cell (CalcCell): Cell.
+            name (str): Property name.
+
+        Returns:
+            bool: ``True`` if the cell has the property; Otherwise, ``False``.
+        """
+        with self._lock:
+            return self._get_value(cell, name) is not _MISSING
+
+    def set(self, cell: CalcCell, name: str, value: Any) -> None:  # noqa: ANN401
+        """
+        Sets a custom property of a cell if the value differs from the current value.
+
+        Args:
+            cell (CalcCell): Cell.
+            name (str): Property name.
+            value (Any): Property value.
+        """
+        self.set_many(cell, {name: value})
+
+    def set_many(self, cell: CalcCell, props: Mapping[str, Any]) -> None:
+        """
+        Sets the custom properties of a cell whose values differ from the current values.
+
+        Args:
+            cell (CalcCell): Cell.
+            props (Mapping[str, Any]): Property names and values.
+        """
+        with self._lock:
+            changed = {name: value for name, value in props.items() if self._get_value(cell, name) != value}
+            if not changed:
+                return
+            self._values[cell.cell_obj].update(changed)
+            if self._in_recalc:
+                _, pending = self._pending.setdefault(cell.cell_obj, (cell, {}))
+                pending.update(changed)
+                return
+        cell.set_custom_properties(DotDict(**changed))
+
+    def remove(self, cell: CalcCell, name: str) -> None:
+        """
+        Removes a custom property of a cell if the cell has the property.
+
+        Args:
+            cell (CalcCell): Cell.
+            name (str): Property name.
+        """
+        with self._lock:
+            _, pending = self._pending.get(cell.cell_obj, (None, {}))
+            pending.pop(name, None)
+            if self._get_value(cell, name) is _MISSING:
+                return
+            self._values[cell.cell_obj][name] = _MISSING
+        if cell.has_custom_property(name):
+            cell.remove_custom_property(name)
+
+    def invalidate(self, cell: CalcCell) -> None:
+        """
+        Drops the properties of a cell, used when the properties of the cell are changed without the cache.
+
+        Queued writes for the cell are written first.
+
+        Args:
+            cell (CalcCell): Cell.
+        """
+        with self._lock:
+            self._values.pop(cell.cell_obj, None)
+            queued = self._pending.pop(cell.cell_obj, None)
+        if queued is not None:
+            self._write(*queued)
+
+    # region Recalculation
+    def begin_recalc(self) -> None:
+        """Starts keeping the writes of a recalculation in memory. Does nothing if already started."""
+        with self._lock:
+            self._in_recalc = True
+
+    def end_recalc(self) -> None:
+        """Writes the properties set during a recalculation."""
+        with self._lock:
+            if not self._in_recalc:
+                return
+            self._in_recalc = False
+        self.flush()
+
+    def flush(self) -> None:
+        """Writes the properties kept in memory."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        if pending:
+            self._log.debug("flush() Writing properties of %i cells.", len(pending))
+        for cell, props in pending.values():
+            self._write(cell, props)
+
+    def _write(self, cell: CalcCell, props: Dict[str, Any]) -> None:
+        if not props:
+            return
+        try:
+            cell.set_custom_properties(DotDict(**props))
+        except Exception:
+            with self._lock:
+                self._values.pop(cell.cell_obj, None)
+            self._log.exception("_write() Error writing properties of cell %s", cell.cell_obj)
+
+    # endregion Recalculation
+
+    def clear(self) -> None:
+        """Writes the properties kept in memory and drops all properties."""
+        self.flush()
+        with self._lock:
+            self._values.clear()
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{CellPropCache.__name__}"
+    inst = CellPropCache._instances.get(key, None)
+    if inst is not None:
+        # properties of an unfinished recalculation are written, the user is asked to save the document.
+        inst.flush()
+        CellPropCache.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
@@ -0,0 +1,190 @@
+"""
+Cache of compiled cell code.
+
+Cleaning, parsing and compiling a cell is done once per distinct source.
+Rebuilding a module with unchanged cells does no parsing or compiling.
+"""
+
+from __future__ import annotations
+from typing import cast, Optional, TYPE_CHECKING
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import CodeType
+
+from ..utils import str_util
+from .code_names import CodeNames
+
+if TYPE_CHECKING:
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+
+@dataclass(frozen=True)
+class CompiledCode:
+    """
+    Compiled cell code.
+
+    Attributes:
+        code (str): Cleaned source code.
+        tree (ast.Module, None): Full AST of the cleaned code. ``None`` if the code is empty or has a syntax error.
+            The tree is shared and must not be modified.
+        exec_code (CodeType, None): Code object of all statements except the last expression or assignment.
+        eval_code (CodeType, None): Code object of the value of the last expression or assignment if any.
+        assign_name (str): Name assigned by the last statement if it is an assignment; Otherwise, empty string.
+        code_names (CodeNames, None): Names read and written by the code. ``None`` if the code has a syntax error.
+        error (Exception, None): Error raised when parsing or compiling the statements.
+        eval_error (Exception, None): Error raised when compiling the last expression.
+    """
+
+    code: str
+    tree: Optional[ast.Module] = None
+    exec_code: Optional[CodeType] = None
+    eval_code: Optional[CodeType] = None
+    assign_name: str = ""
+    code_names: Optional[CodeNames] = field(default_factory=CodeNames)
+    error: Optional[Exception] = None
+    eval_error: Optional[Exception] = None
+
+
+def _compile(code: str) -> CompiledCode:
+    if not code:
+        return CompiledCode(code=code)
+    try:
+        tree = ast.parse(code, mode="exec")
+    except SyntaxError as e:
+        return CompiledCode(code=code, code_names=None, error=e)
+
+    code_names = CodeNames.from_ast(tree)
+    # the tree is not modified, the last node is split off into a new body list.
+    body = list(tree.body)
+    last_expr = None
+    assign_name = ""
+    last_node = body[-1] if body else None
+    if isinstance(last_node, ast.Expr):
+        last_expr = body.pop()
+    elif isinstance(last_node, ast.Assign):
+        last_expr = body.pop()
+        try:
+            assign_name = last_node.targets[0].id  # type: ignore
+        except Exception:
+            assign_name = ""
+    elif isinstance(last_node, ast.AnnAssign):
+        last_expr = body.pop()
+        try:
+            assign_name = last_node.target.id  # type: ignore
+        except Exception:
+            assign_name = ""
+
+    try:
+        module_body = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+        exec_code = compile(module_body, "<string>", "exec")
+    except Exception as e:
+        return CompiledCode(code=code, tree=tree, code_names=code_names, error=e)
+
+    eval_code = None
+    eval_error = None
+    if last_expr is not None:
+        try:
+            expr = ast.fix_missing_locations(ast.Expression(cast(ast.expr, last_expr.value)))
+            eval_code = compile(expr, "<string>", "eval")
+        except Exception as e:
+            eval_error = e
+
+    return CompiledCode(
+        code=code,
+        tree=tree,
+        exec_code=exec_code,
+        eval_code=eval_code,
+        assign_name=assign_name,
+        code_names=code_names,
+        eval_error=eval_error,
+    )
+
+
+class CodeCache:
+    """
+    Process wide LRU cache of compiled code keyed by a hash of the source code.
+
+    The cache is shared by all documents.
+    """
+
+    _instance: CodeCache | None = None
+    _max_size = 512
+
+    def __new__(cls) -> CodeCache:
+        if cls._instance is None:
+            inst = super().__new__(cls)
+            inst._cache: OrderedDict[str, CompiledCode] = OrderedDict()
+            inst._lock = threading.Lock()
+            inst._hits = 0
+            inst._misses = 0
+            inst._log = OxtLogger(log_name=cls.__name__)
+            cls._instance = inst
+        return cls._instance
+
+    def _get_key(self, source: str, clean: bool) -> str:
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        return f"c_{digest}" if clean else digest
+
+    def get(self, source: str, clean: bool = True) -> CompiledCode:
+        """
+        Gets the compiled code for the source, compiling it if it is not cached.
+
+        Args:
+            source (str): Source code as it is stored for the cell.
+            clean (bool, optional): Remove comments and trailing whitespace before compiling. Defaults to ``True``.
+
+        Raises:
+            Exception: If the source code can not be cleaned.
+
+        Returns:
+            CompiledCode: Compiled code.
+        """
+        key = self._get_key(source, clean)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry
+
+        code = source
+        if clean:
+            code = str_util.remove_comments(code)
+            code = str_util.clean_string(code)
+        entry = _compile(code)
+
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+        if self._log.is_debug:
+            with self._log.indent(True):
+                self._log.debug("get() compiled new entry. Cache size: %i", len(self._cache))
+        return entry
+
+    def clear(self) -> None:
+        """Clears the cache and statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of times a compiled entry was found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of times source code had to be compiled."""
+        return self._misses
@@ -0,0 +1,268 @@
+"""
+Read/Write name analysis of cell source code.
+
+The analysis is used to build a dependency graph between code cells.
+It is intentionally conservative; when a name can not be resolved statically the code is flagged as opaque.
+
+The body of a function or class runs when it is called, not where it is defined.
+The names of a body are kept in ``defs`` by the name of the function or class and given to the cells that use that name,
+see ``CellNode.resolve_calls()``.
+"""
+
+from __future__ import annotations
+from typing import Dict, FrozenSet, Mapping, Set
+import ast
+from dataclasses import dataclass, field
+
+# calls that read or write the module namespace in a way that can not be determined statically.
+_OPAQUE_CALLS = frozenset({"globals", "locals", "vars", "exec", "eval", "__import__"})
+
+# method names that commonly mutate the object they are called on.
+# ``df.method(inplace=True)`` is also treated as a mutation.
+_MUTATING_METHODS = frozenset(
+    {
+        "append",
+        "extend",
+        "insert",
+        "pop",
+        "popitem",
+        "remove",
+        "clear",
+        "update",
+        "setdefault",
+        "sort",
+        "reverse",
+        "add",
+        "discard",
+        "__setitem__",
+        "__delitem__",
+    }
+)
+
+
+@dataclass(frozen=True)
+class CodeNames:
+    """
+    Global names read and written by a block of code.
+
+    Attributes:
+        reads (FrozenSet[str]): Names that are loaded by the code.
+        writes (FrozenSet[str]): Names that are bound, deleted or possibly mutated by the code.
+        is_opaque (bool): ``True`` if the code accesses the namespace dynamically, such as ``globals()`` or ``exec()``.
+        defs (Mapping[str, CodeNames]): Names of the functions and classes defined by the code, by function or class name.
+            ``reads`` are the global names the body reads, ``writes`` the globals it binds with ``global``
+            or mutates.
+    """
+
+    reads: FrozenSet[str] = field(default_factory=frozenset)
+    writes: FrozenSet[str] = field(default_factory=frozenset)
+    is_opaque: bool = False
+    defs: Mapping[str, CodeNames] = field(default_factory=dict, hash=False)
+
+    @property
+    def all_reads(self) -> FrozenSet[str]:
+        """Gets the names read by the code and by the bodies of the functions and classes it defines."""
+        if not self.defs:
+            return self.reads
+        return self.reads.union(*(names.reads for names in self.defs.values()))
+
+    @staticmethod
+    def from_ast(tree: ast.AST) -> CodeNames:
+        """
+        Gets the names from an AST tree.
+
+        Args:
+            tree (ast.AST): AST tree, usually a ``ast.Module``.
+
+        Returns:
+            CodeNames: Names read and written by the tree.
+        """
+        visitor = _NameVisitor()
+        visitor.visit(tree)
+        return CodeNames(
+            reads=frozenset(visitor.reads),
+            writes=frozenset(visitor.binds | visitor.mutations),
+            is_opaque=visitor.is_opaque,
+            defs=visitor.defs,
+        )
+
+    @staticmethod
+    def from_code(code: str) -> CodeNames:
+        """
+        Gets the names from source code.
+
+        Args:
+            code (str): Python source code.
+
+        Returns:
+            CodeNames: Names read and written by the code.
+            If the code can not be parsed then the result is opaque.
+        """
+        if not code:
+            return CodeNames()
+        try:
+            tree = ast.parse(code, mode="exec")
+        except SyntaxError:
+            return CodeNames(is_opaque=True)
+        return CodeNames.from_ast(tree)
+
+
+def _get_scope_names(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda | ast.ClassDef) -> CodeNames:
+    """Gets the global names read and written by the body of a function, lambda or class."""
+    visitor = _NameVisitor()
+    params: Set[str] = set()
+    if isinstance(node, ast.ClassDef):
+        body = node.body
+    else:
+        args = node.args
+        params.update(arg.arg for arg in args.posonlyargs + args.args + args.kwonlyargs)
+        params.update(arg.arg for arg in (args.vararg, args.kwarg) if arg is not None)
+        body = [node.body] if isinstance(node, ast.Lambda) else node.body
+    for stmt in body:
+        visitor.visit(stmt)
+    local = (visitor.binds | params) - visitor.global_names
+    reads = visitor.reads - local
+    writes = (visitor.binds & visitor.global_names) | (visitor.mutations - local)
+    is_opaque = visitor.is_opaque
+    for names in visitor.defs.values():
+        # nested functions may be called by the body.
+        reads.update(names.reads - local)
+        writes.update(names.writes)
+        is_opaque = is_opaque or names.is_opaque
+    return CodeNames(reads=frozenset(reads), writes=frozenset(writes), is_opaque=is_opaque)
+
+
+class _NameVisitor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.reads: Set[str] = set()
+        self.binds: Set[str] = set()
+        self.mutations: Set[str] = set()
+        self.global_names: Set[str] = set()
+        self.defs: Dict[str, CodeNames] = {}
+        self.is_opaque = False
+
+    def _get_base_name(self, node: ast.AST) -> str:
+        """Gets the name at the root of an attribute or subscript chain such as ``df.loc[0]``."""
+        while isinstance(node, (ast.Attribute, ast.Subscript, ast.Starred)):
+            node = node.value
+        if isinstance(node, ast.Name):
+            return node.id
+        return ""
+
+    def _add_mutation(self, node: ast.AST) -> None:
+        name = self._get_base_name(node)
+        if name:
+            self.mutations.add(name)
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        if isinstance(node.ctx, ast.Load):
+            self.reads.add(node.id)
+        else:
+            self.binds.add(node.id)
+            # rebinding a function name to another value.
+            self.defs.pop(node.id, None)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
+        if not isinstance(node.ctx, ast.Load):
+            # obj.attr = value
+            self._add_mutation(node)
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:  # noqa: N802
+        if not isinstance(node.ctx, ast.Load):
+            # obj[key] = value
+            self._add_mutation(node)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:  # noqa: N802
+        # x += 1 reads and writes x, the write is found when the target is visited.
+        name = self._get_base_name(node.target)
+        if name:
+            self.reads.add(name)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:  # noqa: N802
+        self.generic_visit(node)
+        if isinstance(node.value, ast.Lambda) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            # fn = lambda x: x * factor
+            self.defs[node.targets[0].id] = _get_scope_names(node.value)
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:  # noqa: N802
+        # a lambda is usually called where it is written, such as df.apply(lambda row: row * factor).
+        for default in node.args.defaults + [d for d in node.args.kw_defaults if d is not None]:
+            self.visit(default)
+        names = _get_scope_names(node)
+        self.reads.update(names.reads)
+        self.mutations.update(names.writes)
+        self.is_opaque = self.is_opaque or names.is_opaque
+
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in _OPAQUE_CALLS:
+            self.is_opaque = True
+        elif isinstance(func, ast.Attribute):
+            is_mutating = func.attr in _MUTATING_METHODS
+            if not is_mutating:
+                for kw in node.keywords:
+                    if kw.arg == "inplace" and not (isinstance(kw.value, ast.Constant) and kw.value.value is False):
+                        is_mutating = True
+                        break
+            if is_mutating:
+                self._add_mutation(func.value)
+        self.generic_visit(node)
+
+    def _visit_def(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> None:
+        # decorators, defaults, annotations and bases are evaluated where the function or class is defined.
+        for expr in node.decorator_list:
+            self.visit(expr)
+        if isinstance(node, ast.ClassDef):
+            for expr in node.bases:
+                self.visit(expr)
+            for kw in node.keywords:
+                self.visit(kw)
+        else:
+            self.visit(node.args)
+            if node.returns is not None:
+                self.visit(node.returns)
+        names = _get_scope_names(node)
+        if isinstance(node, ast.ClassDef):
+            # the class body runs where the class is defined.
+            self.reads.update(names.reads)
+        self.binds.add(node.name)
+        self.defs[node.name] = names
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        self._visit_def(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # noqa: N802
+        self._visit_def(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        self._visit_def(node)
+
+    def visit_arguments(self, node: ast.arguments) -> None:
+        # only defaults and annotations, the parameters are local to the function.
+        for default in node.defaults + [d for d in node.kw_defaults if d is not None]:
+            self.visit(default)
+        for arg in node.posonlyargs + node.args + node.kwonlyargs + [node.vararg, node.kwarg]:
+            if arg is not None and arg.annotation is not None:
+                self.visit(arg.annotation)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:  # noqa: N802
+        if node.name:
+            self.binds.add(node.name)
+        self.generic_visit(node)
+
+    def visit_Global(self, node: ast.Global) -> None:  # noqa: N802
+        self.global_names.update(node.names)
+
+    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
+        for alias in node.names:
+            self.binds.add(alias.asname or alias.name.split(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
+        for alias in node.names:
+            if alias.name == "*":
+                self.is_opaque = True
+                continue
+            self.binds.add(alias.asname or alias.name)
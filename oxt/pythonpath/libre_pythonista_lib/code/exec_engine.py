@@ -0,0 +1,230 @@
+"""
+Background execution of code cells.
+
+Rebuilding the module can take a long time, such as when a cell fits a model.
+Jobs are run one at a time on a worker thread so Calc stays responsive.
+While a job is running ``pyc()`` returns a pending value.
+When all queued jobs are done, the document is recalculated on the main thread so the formula cells show the new results.
+
+The worker thread binds the document of the engine, see ``utils.thread_doc``,
+so cells keep using their document when the user switches to another document during a job.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Deque, Tuple, TYPE_CHECKING
+import threading
+from collections import deque
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+
+from ..const.event_const import GBL_DOC_CLOSING
+from ..ex.exceptions import ExecCancelledError
+from ..utils.main_thread import post_to_main
+from ..utils.singleton_base import SingletonBase
+from ..utils.thread_doc import bind_doc, unbind_doc
+
+if TYPE_CHECKING:
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+PENDING_RESULT = (("#PENDING",),)
+"""Value returned by ``pyc()`` while a job is running."""
+
+_local = threading.local()
+
+
+def check_cancelled() -> None:
+    """
+    Stops the running job if it has been cancelled.
+
+    Called between cells, so a cancelled job stops before its next cell runs.
+    Does nothing when not called on the worker thread of an engine.
+
+    Raises:
+        ExecCancelledError: If the job of the current worker thread has been cancelled.
+    """
+    engine = getattr(_local, "engine", None)
+    if engine is not None and engine.is_cancelled:
+        raise ExecCancelledError()
+
+
+class ExecEngine(SingletonBase):
+    """
+    Runs module rebuild jobs of a document on a worker thread.
+
+    Jobs run in the order they are submitted.
+    Callers never wait for a job, waiting on the Calc thread could deadlock with UNO calls made by the job.
+    """
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._jobs: Deque[Tuple[str, Callable[[], Any]]] = deque()
+        self._thread: threading.Thread | None = None
+        self._job_name = ""
+        self._in_job = False
+        self._is_cancelled = False
+        # set while the recalculation that shows the results is running.
+        self._is_pushing = False
+        # set when a job of the current batch may have changed results.
+        self._has_changes = False
+        self._is_init = True
+
+    def submit(self, name: str, job: Callable[[], Any]) -> None:
+        """
+        Queues a job to run on the worker thread.
+
+        Args:
+            name (str): Name of the job, used for logging.
+            job (Callable[[], Any]): Job to run. A job that returns ``False`` made no changes
+                and does not need the document to be recalculated.
+        """
+        with self._lock:
+            self._jobs.append((name, job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"ExecEngine_{self.runtime_uid}", daemon=True)
+                self._thread.start()
+        if self._log.is_debug:
+            self._log.debug("submit() Job queued: %s", name)
+
+    def cancel(self) -> bool:
+        """
+        Cancels the running job and removes all queued jobs.
+
+        The running job is stopped by ``check_cancelled()`` before its next cell runs,
+        the cell that is running when the job is cancelled finishes first.
+
+        Returns:
+            bool: ``True`` if a job was running or queued; Otherwise, ``False``.
+        """
+        with self._lock:
+            had_jobs = self._in_job or len(self._jobs) > 0
+            self._jobs.clear()
+            if self._in_job:
+                self._is_cancelled = True
+                self._log.info("cancel() Cancelling job: %s", self._job_name)
+        return had_jobs
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits for all jobs to finish.
+
+        Must not be called on the Calc thread.
+
+        Args:
+            timeout (float, None, optional): Maximum number of seconds to wait. Defaults to ``None``.
+
+        Returns:
+            bool: ``True`` if all jobs are finished; Otherwise, ``False``.
+        """
+        thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def consume_push(self) -> bool:
+        """
+        Gets if the current recalculation was started by the engine to push results and resets the push.
+
+        Used to ignore the recalculation that is done to show the results, otherwise the results
+        of volatile cells would be executed again in an endless loop.
+
+        Returns:
+            bool: ``True`` if the current recalculation is the result of a push; Otherwise, ``False``.
+        """
+        with self._lock:
+            is_pushing = self._is_pushing
+            self._is_pushing = False
+        return is_pushing
+
+    def _run(self) -> None:
+        _local.engine = self
+        bind_doc(self._doc)
+        try:
+            while self._run_next():
+                pass
+        finally:
+            unbind_doc()
+            _local.engine = None
+
+    def _run_next(self) -> bool:
+        with self._lock:
+            if not self._jobs:
+                self._thread = None
+                return False
+            name, job = self._jobs.popleft()
+            self._job_name = name
+            self._is_cancelled = False
+            self._in_job = True
+        try:
+            if self._log.is_debug:
+                self._log.debug("_run_next() Running job: %s", name)
+            has_changes = job() is not False
+        except ExecCancelledError:
+            self._log.info("_run_next() Job cancelled: %s", name)
+            has_changes = True
+        except Exception:
+            self._log.exception("_run_next() Job error: %s", name)
+            has_changes = True
+
+        with self._lock:
+            self._in_job = False
+            self._has_changes = self._has_changes or has_changes
+            is_last = not self._jobs
+            push = is_last and self._has_changes
+            if is_last:
+                self._has_changes = False
+        if push:
+            try:
+                post_to_main(self._push_results)
+            except Exception:
+                self._log.exception("_run_next() Error posting results: %s", name)
+        return True
+
+    def _push_results(self) -> None:
+        # runs on the main thread.
+        with self._lock:
+            self._is_pushing = True
+        try:
+            self._log.debug("_push_results() Recalculating document.")
+            self._doc.component.calculateAll()
+        except Exception:
+            self._log.exception("_push_results() Error recalculating document.")
+        finally:
+            # posted behind the events of the recalculation, a push that raised no event does not hide a later one.
+            post_to_main(self._end_push)
+
+    def _end_push(self) -> None:
+        with self._lock:
+            self._is_pushing = False
+
+    @property
+    def is_busy(self) -> bool:
+        """Gets if a job is running or queued."""
+        with self._lock:
+            return self._in_job or len(self._jobs) > 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Gets if the last job was cancelled."""
+        return self._is_cancelled
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    # stop any running job of the closing document.
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{ExecEngine.__name__}"
+    inst = ExecEngine._instances.get(key, None)
+    if inst is not None:
+        inst.cancel()
+        ExecEngine.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
@@ -0,0 +1,149 @@
+"""
+Rendered matplotlib figures of a document.
+
+A figure is rendered in memory and saved to a file named by the hash of the rendered image.
+A figure that has not changed gets the same file, so it is not saved again and its cell image is not inserted again.
+Files of a cell are deleted when the cell renders a different figure and all files are deleted when the document closes.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Tuple, TYPE_CHECKING
+import hashlib
+import shutil
+import threading
+from io import BytesIO
+from pathlib import Path
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+from ooodev.loader import Lo
+
+from ..const.event_const import GBL_DOC_CLOSING
+from ..doc_props.calc_props import CalcProps
+from ..utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+PLOT_FORMATS = ("svg", "png")
+
+
+class FigureCache(SingletonBase):
+    """Renders matplotlib figures of a document to image files."""
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._dir = Path(Lo.tmp_dir, f"lp_plots_{doc.runtime_uid}")
+        self._cell_files: Dict[Any, Path] = {}
+        self._inserted: Dict[str, str] = {}
+        self._is_init = True
+
+    def _get_settings(self) -> Tuple[str, int]:
+        fmt, dpi = "svg", 100
+        try:
+            props = CalcProps(self._doc)
+            fmt = str(props.plot_format).lower()
+            dpi = int(props.plot_dpi)
+        except Exception:
+            self._log.warning("Unable to read plot settings.", exc_info=True)
+        if fmt not in PLOT_FORMATS:
+            self._log.warning("Unknown plot format %s. Using svg.", fmt)
+            fmt = "svg"
+        return fmt, max(dpi, 10)
+
+    def render(self, fig: Any, cell_key: Any = None) -> Path:  # noqa: ANN401
+        """
+        Renders a figure to an image file.
+
+        Args:
+            fig (Figure): Matplotlib figure.
+            cell_key (Any, optional): Key of the cell the figure belongs to. Defaults to ``None``.
+
+        Returns:
+            Path: Image file. The same file is returned for a figure that renders the same image.
+        """
+        import matplotlib
+
+        fmt, dpi = self._get_settings()
+        buffer = BytesIO()
+        # the default svg ids and date are random, they would change the hash of an unchanged figure.
+        with matplotlib.rc_context({"svg.hashsalt": "librepythonista"}):
+            if fmt == "png":
+                fig.savefig(buffer, format=fmt, dpi=dpi)
+            else:
+                fig.savefig(buffer, format=fmt, metadata={"Date": None})
+        data = buffer.getvalue()
+        pth = self._dir / f"plt_{hashlib.sha1(data).hexdigest()[:24]}.{fmt}"
+        with self._lock:
+            if pth.exists():
+                self._log.debug("render() Figure unchanged: %s", pth.name)
+            else:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                pth.write_bytes(data)
+                self._log.debug("render() Figure saved: %s, %i bytes", pth.name, len(data))
+            if cell_key is not None:
+                self._set_cell_file(cell_key, pth)
+        return pth
+
+    def _set_cell_file(self, cell_key: Any, pth: Path) -> None:  # noqa: ANN401
+        old = self._cell_files.get(cell_key)
+        self._cell_files[cell_key] = pth
+        if old is None or old == pth or old in self._cell_files.values():
+            return
+        try:
+            old.unlink()
+            self._log.debug("_set_cell_file() Removed stale figure: %s", old.name)
+        except OSError:
+            self._log.debug("_set_cell_file() Unable to remove stale figure: %s", old.name)
+
+    def get_inserted(self, shape_name: str) -> str:
+        """
+        Gets the image file that is shown by a cell image shape.
+
+        Args:
+            shape_name (str): Name of the shape.
+
+        Returns:
+            str: Image file or an empty string if the shape is not known.
+        """
+        return self._inserted.get(shape_name, "")
+
+    def set_inserted(self, shape_name: str, img: str) -> None:
+        """
+        Sets the image file that is shown by a cell image shape.
+
+        Args:
+            shape_name (str): Name of the shape.
+            img (str): Image file. An empty string removes the shape.
+        """
+        if img:
+            self._inserted[shape_name] = img
+        else:
+            self._inserted.pop(shape_name, None)
+
+    def clear(self) -> None:
+        """Deletes all rendered files of the document."""
+        with self._lock:
+            self._cell_files.clear()
+            self._inserted.clear()
+            if self._dir.exists():
+                shutil.rmtree(self._dir, ignore_errors=True)
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{FigureCache.__name__}"
+    inst = FigureCache._instances.get(key, None)
+    if inst is not None:
+        inst.clear()
+        FigureCache.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
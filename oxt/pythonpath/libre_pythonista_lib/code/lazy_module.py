@@ -0,0 +1,78 @@
+"""
+Modules that are imported on first use.
+
+The cell module exposes ``pd``, ``np`` and ``plt`` as lazy modules,
+so a document that only uses plain Python does not pay for importing pandas, numpy and matplotlib.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, List
+import importlib
+import threading
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """
+    Stands in for a module until an attribute of the module is first read.
+
+    The lazy module is a ``ModuleType`` with the name of the real module,
+    code that stores module references by name, such as ``ResultStore``, treats it as the real module.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], ModuleType]) -> None:
+        """
+        Constructor
+
+        Args:
+            name (str): Name of the real module such as ``pandas``.
+            loader (Callable[[], ModuleType]): Imports and returns the real module.
+        """
+        super().__init__(name)
+        object.__setattr__(self, "_lazy_loader", loader)
+        object.__setattr__(self, "_lazy_module", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def lazy_load(self) -> ModuleType:
+        """Gets the real module, importing it if it is not yet imported."""
+        mod = self._lazy_module
+        if mod is None:
+            with self._lazy_lock:
+                mod = self._lazy_module
+                if mod is None:
+                    mod = self._lazy_loader()
+                    object.__setattr__(self, "_lazy_module", mod)
+        return mod
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # only called for names that are not set on the lazy module itself.
+        return getattr(self.lazy_load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        setattr(self.lazy_load(), name, value)
+
+    def __dir__(self) -> List[str]:
+        return dir(self.lazy_load())
+
+    def __repr__(self) -> str:
+        if self._lazy_module is None:
+            return f"<lazy module '{self.__name__}' (not loaded)>"
+        return repr(self._lazy_module)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Gets if the real module is imported."""
+        return self._lazy_module is not None
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Gets a lazy module that imports a module by name on first use.
+
+    Args:
+        name (str): Name of the module such as ``pandas``.
+
+    Returns:
+        LazyModule: Lazy module of ``name``.
+    """
+    return LazyModule(name, lambda: importlib.import_module(name))
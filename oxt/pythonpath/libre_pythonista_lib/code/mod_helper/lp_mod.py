@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import Any, cast, TYPE_CHECKING
 import uno
 
-from ooodev.loader import Lo
 from ooodev.calc import CalcDoc, CalcSheet
 from ooodev.utils.helper.dot_dict import DotDict
 from ooodev.utils.data_type.cell_obj import CellObj
@@ -18,9 +17,11 @@ from ooodev.exceptions import ex as mEx  # noqa: N812
 # endregion BreakManager
 
 from ...cell.cell_mgr import CellMgr
-from ...data.pandas_data_obj import PandasDataObj
+from ...data.range_cache import RangeCache
+from ..sheet_input import SheetInput
 from .lp_rules.lp_rules_engine import LpRulesEngine
 from .lp_enum import LpEnum
+from ...utils.thread_doc import get_current_doc
 
 LAST_LP_RESULT = DotDict(data=None)
 
@@ -50,6 +51,26 @@ def _collapse_to_used(sheet: CalcSheet, rng_obj: RangeObj) -> RangeObj:
         return rng_obj
 
 
+def _add_sheet_input(
+    cm: CellMgr,
+    cell_obj: CellObj | None = None,
+    rng_obj: RangeObj | None = None,
+    collapse: bool = False,
+) -> None:
+    # record what the executing cell reads so only cells with changed inputs run on recalculation.
+    try:
+        if cell_obj is not None:
+            if cm.has_cell(cell_obj=cell_obj):
+                cm.py_inst.add_cell_input(cell_obj)
+            else:
+                cm.py_inst.add_sheet_input(SheetInput(sheet_idx=cell_obj.sheet_idx, range_name=str(cell_obj)))
+        elif rng_obj is not None:
+            sheet_input = SheetInput(sheet_idx=rng_obj.sheet_idx, range_name=str(rng_obj), collapse=collapse)
+            cm.py_inst.add_sheet_input(sheet_input)
+    except Exception as e:
+        LogInst().warning("lp - Unable to record sheet input: %s", e)
+
+
 def _set_last_lp_result(result: Any, **kwargs) -> Any:  # noqa: ANN003, ANN401
     global LAST_LP_RESULT
     log = LogInst()
@@ -70,12 +91,13 @@ def _handle_cell_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN003
     log.debug("_handle_cell_only() Entered")
     log.debug("lp - Cell Name: %s", addr)
     gbl_cell = cast(CellObj, CURRENT_CELL_OBJ)
-    doc = cast(CalcDoc, Lo.current_doc)
+    doc = cast(CalcDoc, get_current_doc())
     cm = CellMgr(doc)  # singleton
     cell_obj = CellObj.from_cell(addr)
     cell_obj.set_sheet_index(gbl_cell.sheet_idx)
     sheet = doc.sheets[gbl_cell.sheet_idx]
     cell = sheet[cell_obj]
+    _add_sheet_input(cm, cell_obj=cell.cell_obj)
 
     if cm.has_cell(cell_obj=cell.cell_obj):
         log.debug("lp - Cell found in cache: %s for sheet: %i", cell.cell_obj, cell.cell_obj.sheet_idx)
@@ -89,7 +111,7 @@ def _handle_cell_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN003
 def _handle_sheet_cell(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN003, ANN401
     log.debug("_handle_sheet_cell() Entered")
     log.debug("lp - Cell Name: %s", addr)
-    doc = cast(CalcDoc, Lo.current_doc)
+    doc = cast(CalcDoc, get_current_doc())
     sheet_name, addr_str = addr.split(".")
     calc_sheet = doc.sheets.get_by_name(sheet_name)
 
@@ -98,6 +120,7 @@ def _handle_sheet_cell(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN00
     cell_obj.set_sheet_index(calc_sheet.sheet_index)
     sheet = doc.sheets[cell_obj.sheet_idx]
     cell = sheet[cell_obj]
+    _add_sheet_input(cm, cell_obj=cell.cell_obj)
 
     if cm.has_cell(cell_obj=cell.cell_obj):
         log.debug("lp - Cell found in cache: %s for sheet: %i", cell.cell_obj, cell.cell_obj.sheet_idx)
@@ -127,15 +150,15 @@ def _handle_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN00
     addr_rng.set_sheet_index(gbl_cell.sheet_idx)
     log.debug("lp - addr_rng: %s", addr_rng)
 
-    doc = cast(CalcDoc, Lo.current_doc)
+    doc = cast(CalcDoc, get_current_doc())
     sheet = doc.sheets[addr_rng.sheet_idx]
+    _add_sheet_input(CellMgr(doc), rng_obj=addr_rng, collapse=collapse)
     if collapse:
         addr_rng = _collapse_to_used(sheet, addr_rng)
         log.debug("lp - Collapsed addr_rng: %s", addr_rng)
     cr = sheet.get_range(range_obj=addr_rng)
-    pdo = PandasDataObj(cell_rng=cr, col_types=column_types)
-    df = pdo.get_data_frame()
-    return _set_last_lp_result(df, headers=pdo.has_headers, range_obj=addr_rng)
+    df, has_headers = RangeCache(doc).get_data_frame(cell_rng=cr, col_types=column_types)
+    return _set_last_lp_result(df, headers=has_headers, range_obj=addr_rng)
 
 
 def _handle_sheet_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN003, ANN401
@@ -150,7 +173,7 @@ def _handle_sheet_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa:
 
     column_types = kwargs.get("column_types")
 
-    doc = cast(CalcDoc, Lo.current_doc)
+    doc = cast(CalcDoc, get_current_doc())
     sheet_name, addr_str = addr.split(".")
     sheet = doc.sheets.get_by_name(sheet_name)
 
@@ -162,14 +185,14 @@ def _handle_sheet_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa:
 
     addr_rng.set_sheet_index(sheet.sheet_index)
     log.debug("lp - addr_rng: %s", addr_rng)
+    _add_sheet_input(CellMgr(doc), rng_obj=addr_rng, collapse=collapse)
 
     if collapse:
         addr_rng = _collapse_to_used(sheet, addr_rng)
         log.debug("lp - Collapsed addr_rng: %s", addr_rng)
     cr = sheet.get_range(range_obj=addr_rng)
-    pdo = PandasDataObj(cell_rng=cr, col_types=column_types)
-    df = pdo.get_data_frame()
-    return _set_last_lp_result(df, headers=pdo.has_headers, range_obj=addr_rng)
+    df, has_headers = RangeCache(doc).get_data_frame(cell_rng=cr, col_types=column_types)
+    return _set_last_lp_result(df, headers=has_headers, range_obj=addr_rng)
 
 
 def _handle_named_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN003, ANN401
@@ -177,7 +200,7 @@ def _handle_named_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa:
     global CURRENT_CELL_OBJ
     log.debug("lp - Cell Name: %s", addr)
     gbl_cell = cast(CellObj, CURRENT_CELL_OBJ)
-    doc = cast(CalcDoc, Lo.current_doc)
+    doc = cast(CalcDoc, get_current_doc())
     data_name = addr
     sheet = doc.sheets[gbl_cell.sheet_idx]
 
@@ -215,7 +238,7 @@ def _handle_named_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa:
 def _handle_sheet_named_range_only(addr: str, log: LogInst, **kwargs) -> Any:  # noqa: ANN003, ANN401
     log.debug("_handle_sheet_named_range_only() Entered")
     log.debug("lp - Cell Name: %s", addr)
-    doc = cast(CalcDoc, Lo.current_doc)
+    doc = cast(CalcDoc, get_current_doc())
     sheet_name, data_name = addr.split(".")
     sheet = doc.sheets.get_by_name(sheet_name)
 
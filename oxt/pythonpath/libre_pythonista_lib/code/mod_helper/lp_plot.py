@@ -4,15 +4,19 @@ import functools
 from matplotlib import pyplot as plt
 
 from ooodev.utils.helper.dot_dict import DotDict
-from ooodev.utils.gen_util import Util as OooDevGenUtil
-from ooodev.loader import Lo
 
 LAST_LP_RESULT = DotDict(data=None)
 
 if TYPE_CHECKING:
     from ...log.log_inst import LogInst
+    from ..figure_cache import FigureCache
+    from . import lp_mod
+    from ...utils.thread_doc import get_current_doc
 else:
     from libre_pythonista_lib.log.log_inst import LogInst
+    from libre_pythonista_lib.code.figure_cache import FigureCache
+    from libre_pythonista_lib.code.mod_helper import lp_mod
+    from libre_pythonista_lib.utils.thread_doc import get_current_doc
 
 # _ORIG_PLT_SHOW = plt.show
 
@@ -38,12 +42,10 @@ def _custom_plt_show(*args, **kwargs):
     global LAST_LP_RESULT
     log = LogInst()
     log.debug("Custom Plot Method")
-    s = "plt_" + OooDevGenUtil.generate_random_hex_string(12) + ".svg"
-    pth = Lo.tmp_dir / s
+    # unchanged figures get the same file, the cell image is then not inserted again.
+    pth = FigureCache(get_current_doc()).render(plt.gcf(), lp_mod.CURRENT_CELL_OBJ)
     if log.is_debug:
-        log.debug(f"Saving Plot to {pth}")
-
-    plt.savefig(str(pth), format="svg")
+        log.debug(f"Plot rendered to {pth}")
     try:
         # https://stackoverflow.com/questions/9622163/save-plot-to-image-file-instead-of-displaying-it
         # Is is important to call plt.close() to clear the plot after saving it.
@@ -52,9 +54,7 @@ def _custom_plt_show(*args, **kwargs):
         log.debug("Closed plot")
     except Exception as e:
         log.exception(f"Error in _custom_plt_show with plt.close: {e}")
-    if log.is_debug:
-        log.debug("Plot saved to %s", pth)
-    dd = DotDict(data=str(pth), data_type="file", file_kind="image", file_ext="svg", details="figure")
+    dd = DotDict(data=str(pth), data_type="file", file_kind="image", file_ext=pth.suffix[1:], details="figure")
     LAST_LP_RESULT = dd
 
     log.debug("_custom_plt_show Done")
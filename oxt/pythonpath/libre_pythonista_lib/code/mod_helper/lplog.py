@@ -1,12 +1,12 @@
 from __future__ import annotations
 from typing import Any, cast, TYPE_CHECKING
 from pathlib import Path
-from ooodev.loader import Lo
 from ooodev.events.args.event_args import EventArgs
 from ...log.py_logger import PyLogger
 from ...const.event_const import LOG_OPTIONS_CHANGED, LOG_PY_LOGGER_RESET
 from ...event.shared_event import SharedEvent
 from ...utils.singleton_base import SingletonBase
+from ...utils.thread_doc import get_current_doc
 
 if TYPE_CHECKING:
     from ooodev.proto.office_document_t import OfficeDocumentT
@@ -39,7 +39,7 @@ class LpLog(SingletonBase):
 
     @property
     def log(self) -> PyLogger:
-        return PyLogger(Lo.current_doc)
+        return PyLogger(get_current_doc())
 
     @property
     def log_path(self) -> Path:
@@ -0,0 +1,94 @@
+"""
+Layered snapshots of the module namespace.
+
+Each code cell stores only the names it added, rebound or deleted on top of the snapshot of the cell before it.
+The full namespace at any cell is rebuilt by walking the layers from the root,
+so memory grows with the number of changed names instead of the number of cells times the namespace size.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping
+
+
+class ModSnapshot:
+    """
+    Immutable layer of module names on top of a parent snapshot.
+
+    A snapshot without a parent is a root and its ``writes`` are the full base namespace.
+    """
+
+    __slots__ = ("_parent", "_writes", "_deletes", "_depth")
+
+    def __init__(
+        self,
+        parent: ModSnapshot | None = None,
+        writes: Mapping[str, Any] | None = None,
+        deletes: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            parent (ModSnapshot, None, optional): Parent snapshot. Defaults to ``None``.
+            writes (Mapping[str, Any], None, optional): Names added or rebound by this layer. Defaults to ``None``.
+            deletes (Iterable[str], None, optional): Names removed by this layer. Defaults to ``None``.
+
+        Note:
+            ``writes`` is not copied. It must not be changed after it is passed to the snapshot.
+        """
+        self._parent = parent
+        self._writes: Mapping[str, Any] = {} if writes is None else writes
+        self._deletes: FrozenSet[str] = frozenset() if deletes is None else frozenset(deletes)
+        self._depth = 0 if parent is None else parent._depth + 1
+
+    def _get_layers(self) -> List[ModSnapshot]:
+        layers: List[ModSnapshot] = []
+        node: ModSnapshot | None = self
+        while node is not None:
+            layers.append(node)
+            node = node._parent
+        layers.reverse()
+        return layers
+
+    def apply_to(self, target: Dict[str, Any]) -> None:
+        """
+        Applies all the layers, from the root to this snapshot, to the target dictionary.
+
+        Args:
+            target (Dict[str, Any]): Dictionary to update, usually a cleared module ``__dict__``.
+        """
+        for layer in self._get_layers():
+            target.update(layer._writes)
+            for name in layer._deletes:
+                target.pop(name, None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the full namespace of this snapshot.
+
+        Returns:
+            Dict[str, Any]: New dictionary.
+        """
+        result: Dict[str, Any] = {}
+        self.apply_to(result)
+        return result
+
+    @property
+    def parent(self) -> ModSnapshot | None:
+        """Gets the parent snapshot."""
+        return self._parent
+
+    @property
+    def writes(self) -> Mapping[str, Any]:
+        """Gets the names added or rebound by this layer."""
+        return self._writes
+
+    @property
+    def deletes(self) -> FrozenSet[str]:
+        """Gets the names removed by this layer."""
+        return self._deletes
+
+    @property
+    def depth(self) -> int:
+        """Gets the number of layers below this snapshot. A root has a depth of ``0``."""
+        return self._depth
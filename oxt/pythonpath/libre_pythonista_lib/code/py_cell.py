@@ -9,6 +9,7 @@ from ooodev.calc import CalcCell
 from ooodev.utils import gen_util as gUtil
 from ooodev.utils.helper.dot_dict import DotDict
 from .cell_code_storage import CellCodeStorage
+from .cell_prop_cache import CellPropCache
 
 if TYPE_CHECKING:
     from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
@@ -35,7 +36,7 @@ class PyCell:
     def _set_code_id(self) -> None:
         key = self._cfg.cell_cp_codename
         str_id = "id_" + gUtil.Util.generate_random_alpha_numeric(14)
-        self._cell.set_custom_property(key, str_id)
+        CellPropCache(self._cell.calc_doc).set(self._cell, key, str_id)
         setattr(self._props, key, str_id)
         return None
 
@@ -1,17 +1,25 @@
 from __future__ import annotations
-from typing import Any, cast, TYPE_CHECKING
+from typing import Any, cast, Dict, TYPE_CHECKING
 import ast
-import copy
 import os
+import importlib
+import importlib.abc
 import importlib.util
+import sys
+import threading
 
 # import importlib
 import types
+from types import CodeType, ModuleType
 from ooodev.utils.helper.dot_dict import DotDict
 
 # from ooodev.utils.builder.dynamic_importer import DynamicImporter
 from ..utils import str_util
 from .rules.code_rules import CodeRules
+from .code_names import CodeNames
+from .mod_snapshot import ModSnapshot
+from .code_cache import CodeCache, CompiledCode
+from .lazy_module import LazyModule
 
 from .mod_helper.lplog import LpLog as LibrePythonistaLog
 from ..cell.errors.general_error import GeneralError
@@ -40,16 +48,103 @@ def is_import_available(module_name: str, class_name: str = "", alias: str = "")
     return spec is not None
 
 
-try:
-    if is_import_available("matplotlib"):
-        from .mod_helper import lp_plot
-    else:
-        lp_plot = None
-except ImportError:
-    lp_plot = None
+_INIT_DICT: Dict[str, Any] | None = None
+_INIT_LOCK = threading.Lock()
 
 
-def get_module_init_code() -> str:
+class _PyplotImportHook(importlib.abc.MetaPathFinder):
+    """
+    Sets up matplotlib for the cells when ``matplotlib.pyplot`` is first imported.
+
+    Pyplot may be imported by ``plt``, by pandas plotting or by the code of a cell.
+    In all cases the backend must be set before pyplot is loaded and ``plt.show()`` must be replaced after.
+    """
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:  # noqa: ANN401
+        if fullname != "matplotlib.pyplot":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def _exec_module(module: ModuleType) -> None:
+            # See https://matplotlib.org/stable/users/explain/figure/backends.html
+            # for more information on the matplotlib backend.
+            import matplotlib
+
+            matplotlib.use("svg")
+            exec_module(module)
+            sys.modules[fullname] = module
+            # lp_plot replaces plt.show() with a function that saves the figure.
+            importlib.import_module("libre_pythonista_lib.code.mod_helper.lp_plot")
+
+        spec.loader.exec_module = _exec_module  # type: ignore
+        return spec
+
+
+def _load_plt() -> ModuleType:
+    return importlib.import_module("matplotlib.pyplot")
+
+
+def _load_lp_plot() -> ModuleType:
+    return importlib.import_module("libre_pythonista_lib.code.mod_helper.lp_plot")
+
+
+def _load_pd() -> ModuleType:
+    pd = importlib.import_module("pandas")
+    pd.options.plotting.backend = "matplotlib"
+    return pd
+
+
+def _load_np() -> ModuleType:
+    return importlib.import_module("numpy")
+
+
+def get_module_init_dict() -> Dict[str, Any]:
+    """
+    Gets the namespace of a new cell module.
+
+    The namespace is built once per process, ``pd``, ``np``, ``plt`` and ``lp_plot`` are lazy modules
+    that are imported the first time they are used.
+
+    Returns:
+        Dict[str, Any]: Shared namespace. It must not be changed, copy it into the module.
+    """
+    global _INIT_DICT
+    with _INIT_LOCK:
+        if _INIT_DICT is not None:
+            return _INIT_DICT
+        init_dict = types.ModuleType("PyMod").__dict__.copy()
+        init_dict["_"] = None
+        exec(compile(get_module_init_code(lazy=True), "<string>", "exec"), init_dict)
+        if is_import_available("matplotlib"):
+            if "matplotlib.pyplot" in sys.modules:
+                _load_lp_plot()
+            elif not any(isinstance(finder, _PyplotImportHook) for finder in sys.meta_path):
+                sys.meta_path.insert(0, _PyplotImportHook())
+            init_dict["plt"] = LazyModule("matplotlib.pyplot", _load_plt)
+            init_dict["lp_plot"] = LazyModule("libre_pythonista_lib.code.mod_helper.lp_plot", _load_lp_plot)
+        if is_import_available("pandas"):
+            init_dict["pd"] = LazyModule("pandas", _load_pd)
+        if is_import_available("numpy"):
+            init_dict["np"] = LazyModule("numpy", _load_np)
+        _INIT_DICT = init_dict
+        return _INIT_DICT
+
+
+def get_module_init_code(lazy: bool = False) -> str:
+    """
+    Gets the code that initializes a cell module.
+
+    Args:
+        lazy (bool, optional): Omit the imports that ``get_module_init_dict()`` adds as lazy modules.
+            Defaults to ``False``.
+
+    Returns:
+        str: Python code.
+    """
     # See https://matplotlib.org/stable/users/explain/figure/backends.html
     # for more information on the matplotlib backend.
     pre_lines = [
@@ -57,15 +152,15 @@ def get_module_init_code() -> str:
         "from typing import Any, cast, TYPE_CHECKING",
     ]
     code_lines = []
-    if is_import_available("matplotlib"):
+    if not lazy and is_import_available("matplotlib"):
         code_lines.append("import matplotlib")
         code_lines.append("matplotlib.use('svg')")
         # code_lines.append("matplotlib.use('agg')")
         code_lines.append("from matplotlib import pyplot as plt")
-    if is_import_available("pandas"):
+    if not lazy and is_import_available("pandas"):
         code_lines.append("import pandas as pd")
         code_lines.append("pd.options.plotting.backend = 'matplotlib'")
-    if is_import_available("numpy"):
+    if not lazy and is_import_available("numpy"):
         code_lines.append("import numpy as np")
     post_lines = [
         "from ooodev.loader import Lo",
@@ -80,12 +175,13 @@ def get_module_init_code() -> str:
         "from libre_pythonista_lib.code.mod_helper import lp_mod",
         "from libre_pythonista_lib.code.mod_helper.lp_mod import lp",
         "from libre_pythonista_lib.code.mod_helper.lplog import StaticLpLog as lp_log, LpLog as LibrePythonistaLog",
-        "from libre_pythonista_lib.code.mod_helper import lp_plot",
         "PY_ARGS = None",
         "CURRENT_CELL_OBJ = None",
         "CURRENT_CELL_ID = ''",
         "DUMMY_LAST_VALUE = None",
     ]
+    if not lazy and is_import_available("matplotlib"):
+        post_lines.append("from libre_pythonista_lib.code.mod_helper import lp_plot")
     lines = pre_lines + code_lines + post_lines
     return "\n".join(lines)
 
@@ -106,20 +202,20 @@ class PyModule:
         self._private_enabled = True
 
         self._current_ast_mod = None
+        self._current_code_names: CodeNames | None = None
         self._current_match_rule = None  # used for testing
+        self._code_cache = CodeCache()
         self._init_mod()
         self._is_init = True
 
     def _init_mod(self) -> None:
         self._log.debug("_init_mod()")
-        code = get_module_init_code()
         try:
-            self._execute_init_code(code, self.mod.__dict__)
-            self._init_dict = self.mod.__dict__.copy()
-            if lp_plot is not None:
-                self._init_dict.update(**lp_plot.__dict__.copy())
-            else:
+            self._init_dict = get_module_init_dict()
+            self.mod.__dict__.update(self._init_dict)
+            if "lp_plot" not in self._init_dict:
                 self._log.warning("lp_plot module is not available.")
+            self._init_snapshot = ModSnapshot(writes=self._init_dict)
             self._log.debug("_init_mod() done.")
         except Exception:
             self._log.exception("Error initializing module")
@@ -165,7 +261,12 @@ class PyModule:
         Compiles and executes the given code snippet.
         - If the last statement is an expression, returns its value.
         - Otherwise, returns the value of `result` if it exists in local variables.
+
+        The compiled code is cached, see ``CodeCache``.
         """
+        return self._execute_compiled(self._code_cache.get(code_snippet, clean=False), globals)
+
+    def _execute_compiled(self, compiled: CompiledCode, globals: dict | None = None) -> Any:  # noqa: ANN401
         if self._is_init:
             break_mgr.check_breakpoint("libre_pythonista_lib.code.py_module.execute_code")
 
@@ -173,56 +274,44 @@ class PyModule:
             if globals is None:
                 globals = {}
             globals["_"] = None
-
-            # Parse the code as a full module
-            tree = ast.parse(code_snippet, mode="exec")
-            # Transform AST so underscore-assignments become local assigns
-            # tree = UnderscoreLocalTransformer().visit(tree)
-            # ast.fix_missing_locations(tree)
-            # needs a copy because may pop the last node below.
-            self._current_ast_mod = copy.deepcopy(tree)
-
-            # If the last node is an expression, remove it for separate handling
-            last_expr = None
-            assign_name = ""
-            # print(str(type(tree.body[-1])))
-            last_node = tree.body[-1]
-            if tree.body and isinstance(last_node, ast.Expr):
-                last_expr = cast(ast.Expr, tree.body.pop())
-            elif tree.body and isinstance(last_node, ast.Assign):
-                last_expr = cast(ast.Assign, tree.body.pop())
-                try:
-                    assign_name = last_expr.targets[0].id  # type: ignore
-                except Exception:
-                    assign_name = ""
-            elif tree.body and isinstance(last_node, ast.AnnAssign):
-                last_expr = cast(ast.Assign, tree.body.pop())
-                try:
-                    assign_name = last_expr.target.id  # type: ignore
-                except Exception:
-                    assign_name = ""
-            last_node = None
-
-            # Compile all but the last expression as 'exec'
-            module_body = ast.fix_missing_locations(ast.Module(body=tree.body, type_ignores=[]))
-            exec_code = compile(module_body, "<string>", "exec")
+            self._current_code_names = compiled.code_names
+            # the tree is shared with the cache and the rules, it is never modified.
+            self._current_ast_mod = compiled.tree
+
+            if compiled.error is not None:
+                if isinstance(compiled.error, SyntaxError):
+                    self._log.error("Syntax error executing code: \n%s", compiled.code, exc_info=compiled.error)
+                else:
+                    self._log.error(
+                        "Error executing  error: '%s' code: \n%s",
+                        compiled.error,
+                        compiled.code,
+                        exc_info=compiled.error,
+                    )
+                return None
 
             # Execute statements
             local_dict = {}
-            exec(exec_code, globals, local_dict)
+            exec(cast(CodeType, compiled.exec_code), globals, local_dict)
 
             if self._private_enabled:
                 filtered_dict = {k: v for k, v in local_dict.items() if not k.startswith("_")}
             else:
                 filtered_dict = local_dict
 
-            # If there was a final expression node, evaluate it
+            if compiled.eval_error is not None:
+                self._log.error(
+                    "Error executing  error: '%s' code: \n%s",
+                    compiled.eval_error,
+                    compiled.code,
+                    exc_info=compiled.eval_error,
+                )
+                return None
 
-            if last_expr:
-                expr = ast.Expression(last_expr.value)
-                expr = ast.fix_missing_locations(expr)
-                eval_code = compile(expr, "<string>", "eval")
-                result = eval(eval_code, globals, local_dict)
+            # If there was a final expression node, evaluate it
+            if compiled.eval_code is not None:
+                result = eval(compiled.eval_code, globals, local_dict)
+                assign_name = compiled.assign_name
                 if assign_name:
                     if self._private_enabled:
                         if not assign_name.startswith("_"):
@@ -236,12 +325,8 @@ class PyModule:
             # If there's no final expression, fallback to returning locals["_"], if present
             return globals.get("_")
 
-        except SyntaxError as e:
-            self._log.exception("Syntax error executing code: \n%s", code_snippet)
-            return None
-
         except Exception as e:
-            self._log.exception("Error executing  error: '%s' code: \n%s", e, code_snippet)
+            self._log.exception("Error executing  error: '%s' code: \n%s", e, compiled.code)
             # traceback.print_exc()
             return None
 
@@ -251,6 +336,7 @@ class PyModule:
         self.mod.__dict__.clear()
         self.mod.__dict__.update(self._init_dict)
         self._current_ast_mod = None
+        self._current_code_names = None
         with self._log.indent(True):
             self._log.debug("reset_module() done.")
 
@@ -270,8 +356,9 @@ class PyModule:
         with self._log.indent(True):
             self._log.debug("update_with_result() Entered.")
         try:
-            code = str_util.remove_comments(code)
-            code = str_util.clean_string(code)
+            # cleaned and compiled once per distinct source.
+            compiled = self._code_cache.get(code)
+            code = compiled.code
             # self._log.debug(f"Cleaned code. \n{code}")
         except Exception:
             self._log.exception("Error cleaning code: %s", code)
@@ -279,10 +366,12 @@ class PyModule:
 
         result = None
         self._current_match_rule = None  # used for testing
+        # empty code reads and writes nothing.
+        self._current_code_names = CodeNames()
         try:
             if code:
                 self._log.debug("Executing code.")
-                self.execute_code(code, self.mod.__dict__)
+                self._execute_compiled(compiled, self.mod.__dict__)
                 self._log.debug("Executed code.")
             rule = self._cr.get_matched_rule(self.mod, code, self._current_ast_mod)
             self._log.debug("Got matched rule.")
@@ -340,12 +429,12 @@ class PyModule:
         self.mod.__dict__[var_name] = value
         self.mod.__dict__["_"] = value
 
-    def reset_to_dict(self, mod_dict: dict, code: str = "") -> Any:  # noqa: ANN401
+    def reset_to_dict(self, mod_dict: dict | ModSnapshot, code: str = "") -> Any:  # noqa: ANN401
         """
         Reset the module to the given dictionary and returns the last variable in the module if code is present.
 
         Args:
-            mod_dict (dict): A dictionary of variables to reset the module to.
+            mod_dict (dict, ModSnapshot): A dictionary of variables or a snapshot to reset the module to.
             code (str, optional): Any valid python code
 
         Returns:
@@ -355,8 +444,12 @@ class PyModule:
         with self._log.indent(True):
             self._log.debug("reset_to_dict()")
         self.mod.__dict__.clear()
-        self.mod.__dict__.update(mod_dict)
+        if isinstance(mod_dict, ModSnapshot):
+            mod_dict.apply_to(self.mod.__dict__)
+        else:
+            self.mod.__dict__.update(mod_dict)
         self._current_ast_mod = None
+        self._current_code_names = None
         if not code:
             return None
         code = str_util.remove_comments(code)
@@ -371,3 +464,17 @@ class PyModule:
         with self._log.indent(True):
             self._log.debug("reset_to_dict() done.")
         return result
+
+    @property
+    def init_snapshot(self) -> ModSnapshot:
+        """Gets the snapshot of the module as it is after ``reset_module()``."""
+        return self._init_snapshot
+
+    @property
+    def current_code_names(self) -> CodeNames | None:
+        """
+        Gets the names read and written by the last code run via ``update_with_result()``.
+
+        Value is ``None`` if the code could not be parsed.
+        """
+        return self._current_code_names
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, List, Dict, Tuple, TYPE_CHECKING
+from typing import Any, Callable, List, Dict, Mapping, Set, Tuple, TYPE_CHECKING
+import threading
 
 from sortedcontainers import SortedDict
 
@@ -21,6 +22,15 @@ from ..utils.gen_util import GenUtil
 # from libre_pythonista.oxt_logger.oxt_logger import OxtLogger
 from .py_module import PyModule
 from .cell_cache import CellCache
+from .cell_prop_cache import CellPropCache
+from .cell_dep_graph import CellDepGraph, CellNode
+from .cell_profiler import CellProfiler
+from .code_cache import CodeCache
+from .code_names import CodeNames
+from .exec_engine import check_cancelled
+from .mod_snapshot import ModSnapshot
+from .result_store import ResultStore, StoredResult
+from .sheet_input import SheetInput
 from ..cell.props.key_maker import KeyMaker
 from ..const.event_const import GBL_DOC_CLOSING
 
@@ -36,23 +46,50 @@ else:
 
 # _MOD_DIR = "librepythonista"
 
+_MISSING = object()
+
+# module names set for every execution, see ``_update_item()``.
+_EXEC_NAMES = frozenset({"_", "CURRENT_CELL_ID", "CURRENT_CELL_OBJ"})
+
+# names that give the code direct access to the document.
+# Cells that read them may depend on any sheet value and are executed on every recalculation.
+_VOLATILE_NAMES = frozenset({"Lo", "CalcDoc", "CalcSheet", "XSCRIPTCONTEXT", "uno"})
+
+
+def _get_cell_ref_name(sheet_idx: int, row: int, col: int) -> str:
+    """Gets the dependency graph name for the result of a code cell. It can never clash with a python name."""
+    return f"<cell {sheet_idx},{row},{col}>"
+
 
 class PySource:
-    def __init__(self, uri: str, unique_id: str, cell: CellObj, mgr: PySourceManager) -> None:
+    def __init__(
+        self, uri: str, unique_id: str, cell: CellObj, mgr: PySourceManager, src_code: str | None = None
+    ) -> None:
         if getattr(self, "_is_init", False):
             return
         self._uri = uri
         self._cell_obj = cell
         self._mgr = mgr
-        self._mod_dict = mgr.py_mod.mod.__dict__.copy()
+        # snapshot of the module after the last execution, layered on the snapshot of the previous source.
+        self._snapshot: ModSnapshot | None = None
         # pth = Path(uri)
         # self._name = pth.stem
         self._row = cell.row - 1
         self._col = cell.col_obj.index
         self._sheet_idx = cell.sheet_idx
-        self._src_code = None
+        # source code read by the manager when loading all sources, otherwise read on first access.
+        self._src_code = src_code
         self._dd_data = DotDict(data=None, py_src=self)
         self._unique_id = unique_id
+        self._code_names: CodeNames | None = None
+        # names added or rebound by the last execution. None if the code has not been executed.
+        self._mod_writes: Dict[str, Any] | None = None
+        self._mod_deletes: Set[str] = set()
+        # sheet values and code cell results read through lp() by the last execution.
+        self._sheet_inputs: Dict[SheetInput, Any] = {}
+        self._cell_inputs: Set[Tuple[int, int, int]] = set()
+        # True when the result of the last execution is stored with the document, see ResultStore.
+        self._is_result_stored = False
         self._is_init = True
 
     def __lt__(self, other: Any) -> bool:  # noqa: ANN401
@@ -123,16 +160,157 @@ class PySource:
 
     @property
     def mod_dict(self) -> Dict[str, Any]:
-        return self._mod_dict
-
-    @mod_dict.setter
-    def mod_dict(self, value: Dict[str, Any]) -> None:
-        self._mod_dict = value
+        """Gets a copy of the module dictionary as it was before the source code was executed."""
+        if self._snapshot is None or self._snapshot.parent is None:
+            return {}
+        return self._snapshot.parent.to_dict()
 
     @property
     def unique_id(self) -> str:
         return self._unique_id
 
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    def set_executed(self, code_names: CodeNames | None, writes: Dict[str, Any], deletes: Set[str]) -> None:
+        """
+        Records the result of executing the source code on the module.
+
+        Args:
+            code_names (CodeNames, None): Names read and written by the code. ``None`` if the code could not be parsed.
+            writes (Dict[str, Any]): Module names that were added or rebound by the code.
+            deletes (Set[str]): Module names that were removed by the code.
+        """
+        self._code_names = code_names
+        self._mod_writes = writes
+        self._mod_deletes = deletes
+        self._is_result_stored = False
+
+    def link_snapshot(self, parent: ModSnapshot) -> ModSnapshot:
+        """
+        Layers the changes of the last execution on top of the snapshot of the module before this source.
+
+        Args:
+            parent (ModSnapshot): Snapshot of the module before this source.
+
+        Returns:
+            ModSnapshot: Snapshot of the module after this source.
+        """
+        self._snapshot = ModSnapshot(parent=parent, writes=self.mod_writes, deletes=self._mod_deletes)
+        return self._snapshot
+
+    def clear_executed(self) -> None:
+        """Forgets the last execution so the source is executed again on the next update."""
+        self._code_names = None
+        self._mod_writes = None
+        self._mod_deletes = set()
+        self._snapshot = None
+        self._is_result_stored = False
+
+    @property
+    def snapshot(self) -> ModSnapshot | None:
+        """Gets the snapshot of the module after this source. ``None`` if the source has not been executed."""
+        return self._snapshot
+
+    def get_dep_node(self) -> CellNode | None:
+        """
+        Gets the dependency graph node for this source.
+
+        Returns:
+            CellNode | None: Node or ``None`` if the source has not been executed or names are not known.
+        """
+        if self._code_names is None or self._mod_writes is None or self._code_names.is_opaque:
+            return None
+        reads = self._code_names.reads.union(_get_cell_ref_name(*key) for key in self._cell_inputs)
+        writes = self._code_names.writes | self.written_names
+        return CellNode(
+            reads=reads,
+            writes=writes | {_get_cell_ref_name(self.sheet_idx, self.row, self.col)},
+            defs=self._code_names.defs,
+        )
+
+    def clear_inputs(self) -> None:
+        """Clears the recorded inputs. Called before the source code is executed."""
+        self._sheet_inputs = {}
+        self._cell_inputs = set()
+
+    def add_sheet_input(self, sheet_input: SheetInput, fingerprint: Any) -> None:  # noqa: ANN401
+        """
+        Records a sheet cell or range read by the source code.
+
+        Args:
+            sheet_input (SheetInput): Cell or range that was read.
+            fingerprint (Any): Fingerprint of the values at the time they were read.
+        """
+        self._sheet_inputs[sheet_input] = fingerprint
+
+    def add_cell_input(self, key: Tuple[int, int, int]) -> None:
+        """
+        Records the result of another code cell read by the source code.
+
+        Args:
+            key (Tuple[int, int, int]): Key of the code cell in the format of ``(sheet_idx, row, col)``.
+        """
+        self._cell_inputs.add(key)
+
+    @property
+    def sheet_inputs(self) -> Dict[SheetInput, Any]:
+        """Gets the sheet inputs read by the last execution and their fingerprints."""
+        return self._sheet_inputs
+
+    @property
+    def cell_inputs(self) -> Set[Tuple[int, int, int]]:
+        """Gets the keys of the code cells whose results were read by the last execution."""
+        return self._cell_inputs
+
+    @property
+    def is_result_stored(self) -> bool:
+        """Gets/Sets if the result of the last execution is stored with the document."""
+        return self._is_result_stored
+
+    @is_result_stored.setter
+    def is_result_stored(self, value: bool) -> None:
+        self._is_result_stored = value
+
+    @property
+    def is_volatile(self) -> bool:
+        """Gets if the source code accesses the document directly and must run on every recalculation."""
+        if self._code_names is None:
+            return False
+        # a function that reads them is volatile where it is defined, the cells using it depend on that cell.
+        return not self._code_names.all_reads.isdisjoint(_VOLATILE_NAMES)
+
+    @property
+    def is_executed(self) -> bool:
+        """Gets if the source code has been executed on the module."""
+        return self._mod_writes is not None
+
+    @property
+    def code_names(self) -> CodeNames | None:
+        """Gets the names read and written by the last execution of the code."""
+        return self._code_names
+
+    @property
+    def mod_writes(self) -> Dict[str, Any]:
+        """Gets the module names that were added or rebound by the last execution of the code."""
+        if self._mod_writes is None:
+            return {}
+        return self._mod_writes
+
+    @property
+    def mod_deletes(self) -> Set[str]:
+        """Gets the module names that were removed by the last execution of the code."""
+        return self._mod_deletes
+
+    @property
+    def written_names(self) -> Set[str]:
+        """Gets all names changed on the module by the last execution. ``_`` is always included."""
+        result = set(self.mod_writes.keys())
+        result.update(self._mod_deletes)
+        result.add("_")
+        return result
+
     @property
     def value(self) -> Any:
         return self._dd_data.data
@@ -180,7 +358,17 @@ class PySourceManager(EventsPartial):
         # if not self._sfa.exists(self._root_uri):
         #     self._sfa.inst.create_folder(self._root_uri)
         self._mod = PyModule()
+        # source that is currently being executed. Used to record inputs read through lp().
+        self._exec_src: PySource | None = None
+        # snapshot of the module as it currently is, the parent of the next executed source.
+        self._head = self._mod.init_snapshot
+        # guards changes to the data, updates may run on a worker thread while cells are added or removed.
+        self._data_lock = threading.RLock()
+        # runs module updates, see set_executor().
+        self._executor: Callable[[str, Callable[[], None]], None] | None = None
         self._data = self._get_sources()
+        self._store = ResultStore(self, doc)
+        self._profiler = CellProfiler(doc)
         self._se = SharedEvent(doc)
         self._se.trigger_event("PySourceManagerCreated", EventArgs(self))
         self._is_init = True
@@ -206,33 +394,36 @@ class PySourceManager(EventsPartial):
         log = OxtLogger(log_name=self.__class__.__name__)
         return log
 
+    def _get_source_names(self, sheet_uri: str) -> Set[str]:
+        """Gets the file names in the source folder of a sheet. The folder is listed in a single call."""
+        if not self._sfa.exists(sheet_uri):
+            return set()
+        urls = self._sfa.inst.get_folder_contents(sheet_uri, False)
+        return {url.rsplit("/", 1)[-1] for url in urls}
+
     def _get_sources(self) -> SortedDict[Tuple[int, int, int], PySource]:  # type: ignore
+        # the code names are taken from the cell cache and each sheet folder is listed once,
+        # there are no property or file exists calls per cell.
         cc = CellCache(self._doc)
-        code_prop_name = cc.code_prop
-        result = None
         sources: List[PySource] = []
         for sheet in self._doc.sheets:
-            if sheet.sheet_index not in cc.code_cells:
+            cells = cc.code_cells.get(sheet.sheet_index)
+            if not cells:
                 continue
-
-            cells = cc.code_cells[sheet.sheet_index]
-            for cell in cells.keys():
-                calc_cell = sheet[cell]
-                if not calc_cell.has_custom_property(code_prop_name):
+            sheet_uri = f"{self._root_uri}/{sheet.unique_id}"
+            names = self._get_source_names(sheet_uri)
+            for cell, icp in cells.items():
+                name = f"{icp.code_name}.py"
+                if name not in names:
                     continue
-                code_id = calc_cell.get_custom_property(code_prop_name)
-                uri = f"{self._root_uri}/{sheet.unique_id}/{code_id}.py"
-
-                if not self._sfa.exists(uri):
-                    continue
-                sources.append(PySource(uri, code_id, cell, self))
-
-            sources.sort()
-            result = SortedDict()
-            for src in sources:
-                result[src.sheet_idx, src.row, src.col] = src
-        if result is None:
-            result = SortedDict()
+                uri = f"{sheet_uri}/{name}"
+                code = self._sfa.read_text_file(uri)
+                sources.append(PySource(uri, icp.code_name, cell, self, src_code=code))
+
+        sources.sort()
+        result = SortedDict()
+        for src in sources:
+            result[src.sheet_idx, src.row, src.col] = src
         return result
 
     # endregion Init
@@ -249,7 +440,9 @@ class PySourceManager(EventsPartial):
         """
         sb = StrList(sep="\n")
         sb.append(f"# Source code for doc: vnd.sun.star.tdoc:/{self._doc.runtime_uid}/")
-        for py_src in self._data.values():
+        with self._data_lock:
+            sources = list(self._data.values())
+        for py_src in sources:
             cell_obj = CellObj.from_idx(col_idx=py_src.col, row_idx=py_src.row, sheet_idx=py_src.sheet_idx)
             if max_cell is not None:
                 if include_max:
@@ -593,7 +786,8 @@ class PySourceManager(EventsPartial):
             code_cell = self.convert_cell_obj_to_tuple(key)
         else:
             code_cell = (key[0], key[2], key[1])
-        self._data[code_cell] = value
+        with self._data_lock:
+            self._data[code_cell] = value
 
     def __delitem__(self, key: CellObj | Tuple[int, int, int]) -> None:
         """
@@ -672,7 +866,6 @@ class PySourceManager(EventsPartial):
             Exception: If cell already exists in current data.
         """
         with self._log.indent(True):
-            # when adding source is should update the whole module unless it is the last cell for the module.
             self._log.debug("add_source() - Adding Source")
             km = KeyMaker()  # singleton
             code_cell = self.convert_cell_obj_to_tuple(cell)
@@ -701,10 +894,8 @@ class PySourceManager(EventsPartial):
             calc_cell = sheet[cell]
             str_id = "id_" + gUtil.Util.generate_random_alpha_numeric(14)
             self._log.debug(f"add_source() - Adding Source ID: {str_id}")
-            calc_cell.set_custom_property(cc.code_prop, str_id)
-
             addr = GenUtil.create_cell_addr_query_str(sheet_idx, str(cell))
-            calc_cell.set_custom_property(km.cell_addr_key, addr)
+            CellPropCache(self._doc).set_many(calc_cell, {cc.code_prop: str_id, km.cell_addr_key: addr})
             self._log.debug(f"add_source() - Setting custom property: {km.cell_addr_key} to {addr}")
 
             name = str_id + ".py"
@@ -717,19 +908,20 @@ class PySourceManager(EventsPartial):
             cc.insert(cell=cell, code_name=str_id, props={cc.code_prop}, sheet_idx=sheet_idx)
             self._log.debug(f"add_source() - inserted for cell {cell}: sheet index: {sheet_idx}")
             # CellCache.reset_instance()
-            self._data[code_cell] = py_src
+            with self._data_lock:
+                self._data[code_cell] = py_src
             index = self.get_index(cell)
             if index < 0:
                 self._log.error(f"add_source() - Cell {cell} not found.")
                 raise Exception(f"Cell {cell} not found.")
-            if self._is_last_index(index):
-                self._log.debug(f"add_source() - Last Index, updating from index {index}")
-                self.update_from_index(index)
-            else:
-                self._log.debug(f"add_source() not last index, Updating all")
-                self.update_all()
             eargs = EventArgs.from_args(cargs)
-            self.trigger_event("AfterAddSource", eargs)
+
+            def update() -> None:
+                # only the new cell and the cells that depend on it are executed.
+                if self._update_from_key(code_cell):
+                    self.trigger_event("AfterAddSource", eargs)
+
+            self._execute(f"add_source({cell})", update)
             self._log.debug("Done Adding Source")
         return None
 
@@ -746,7 +938,6 @@ class PySourceManager(EventsPartial):
         """
         with self._log.indent(True):
             self._log.debug("update_source()")
-            # when updating source is should update the whole module unless it is the last cell for the module.
             code_cell = self.convert_cell_obj_to_tuple(cell)
             sheet_idx = code_cell[0]
             row = code_cell[1]
@@ -775,15 +966,14 @@ class PySourceManager(EventsPartial):
                 raise Exception(f"Cell {cell} not found.")
             src.source_code = code  # writes code to file
             # CellCache.reset_instance()
-
-            if self._is_last_index(index):
-                self._log.debug(f"update_source() is last index updating from index {index}")
-                self.update_from_index(index)
-            else:
-                self._log.debug(f"update_source() not last index, Updating all")
-                self.update_all()
             eargs = EventArgs.from_args(cargs)
-            self.trigger_event("AfterUpdateSource", eargs)
+
+            def update() -> None:
+                # only the updated cell and the cells that depend on it are executed.
+                if self._update_from_key(code_cell):
+                    self.trigger_event("AfterUpdateSource", eargs)
+
+            self._execute(f"update_source({cell})", update)
             return None
 
     def remove_source(self, cell: CellObj) -> None:
@@ -820,25 +1010,28 @@ class PySourceManager(EventsPartial):
             self.trigger_event(f"BeforeRemoveSource_{col}_{row}", cargs)
             if cargs.cancel:
                 return
-            self._data[code_cell].del_source()
-            del self._data[code_cell]
+            with self._data_lock:
+                self._store.delete(self._data[code_cell])
+                self._data[code_cell].del_source()
+                del self._data[code_cell]
             sheet = self._doc.sheets[sheet_idx]
             calc_cell = sheet[cell]
             cc = CellCache(self._doc)
             cc.remove_cell(cell=cell, sheet_idx=sheet_idx)
-            if calc_cell.has_custom_property(cc.code_prop):
-                self._log.debug(f"remove_source() Has custom property: {cc.code_prop}. Removing ...")
-                calc_cell.remove_custom_property(cc.code_prop)
-                self._log.debug("remove_source() custom property removed.")
+            CellPropCache(self._doc).remove(calc_cell, cc.code_prop)
+            self._log.debug("remove_source() custom property %s removed.", cc.code_prop)
             # remove the cell from the cache is faster then resetting
             # CellCache.reset_instance()
-            self._log.debug("remove_source() Calling update_all()")
-            self.update_all()
-
             eargs = EventArgs.from_args(cargs)
-            self.trigger_event("AfterRemoveSource", eargs)
-            # triggers are in col row format
-            self.trigger_event(f"AfterRemoveSource_{col}_{row}", eargs)
+
+            def update() -> None:
+                self.update_all()
+                self.trigger_event("AfterRemoveSource", eargs)
+                # triggers are in col row format
+                self.trigger_event(f"AfterRemoveSource_{col}_{row}", eargs)
+
+            self._log.debug("remove_source() Scheduling update_all()")
+            self._execute(f"remove_source({cell})", update)
             self._log.debug("remove_source() Leaving.")
 
     def remove_source_by_calc_cell(self, cell: CalcCell) -> None:
@@ -864,6 +1057,9 @@ class PySourceManager(EventsPartial):
                 self._log.debug(f"remove_source_by_calc_cell() - Deleted file: {uri}")
             else:
                 self._log.debug(f"remove_source_by_calc_cell() - File not found: {uri}")
+            result_uri = f"{self._root_uri}/{cell.calc_sheet.unique_id}/{str_id}{ResultStore.EXT}"
+            if self.sfa.exists(result_uri):
+                self.sfa.delete_file(result_uri)
 
     def set_global_var(self, name: str, value: Any) -> None:
         """
@@ -876,6 +1072,9 @@ class PySourceManager(EventsPartial):
         with self._log.indent(True):
             self._log.debug(f"set_global_var() - Setting Global Variable: {name} = {value}")
             self.py_mod.set_global_var(name, value)
+            if name != "CURRENT_CELL_OBJ":
+                # keep the snapshot chain in step with the module.
+                self._head = ModSnapshot(parent=self._head, writes={name: value, "_": value})
 
     def get_index(self, cell: CellObj) -> int:
         """
@@ -890,11 +1089,59 @@ class PySourceManager(EventsPartial):
         with self._log.indent(True):
             try:
                 code_cell = self.convert_cell_obj_to_tuple(cell)
-                return list(self._data.keys()).index(code_cell)
+                return self._get_keys().index(code_cell)
             except Exception:
                 self._log.warning(f"get_index() - Cell {cell} not found.")
                 return -1
 
+    def _get_keys(self) -> List[Tuple[int, int, int]]:
+        """Gets a copy of the keys of the data in order."""
+        with self._data_lock:
+            return list(self._data.keys())
+
+    def set_executor(self, executor: Callable[[str, Callable[[], None]], None] | None) -> None:
+        """
+        Sets how module updates that follow adding, updating and removing sources are run.
+
+        Args:
+            executor (Callable[[str, Callable[[], None]], None], None): Called with a job name and the job.
+                ``None`` runs updates right away on the calling thread.
+        """
+        self._executor = executor
+
+    def _execute(self, name: str, job: Callable[[], None]) -> None:
+        if self._executor is None:
+            job()
+        else:
+            self._executor(name, job)
+
+    def _update_from_key(self, key: Tuple[int, int, int]) -> bool:
+        """
+        Rebuilds the module from the cell of the key. The index is looked up when the update runs.
+
+        Returns:
+            bool: ``False`` if the cell no longer exists; Otherwise, ``True``.
+        """
+        try:
+            index = self._get_keys().index(key)
+        except ValueError:
+            self._log.debug(f"_update_from_key() Cell {key} no longer exists.")
+            return False
+        self.update_from_index(index)
+        return True
+
+    def reset_executed(self) -> None:
+        """
+        Forgets the execution state of all sources.
+
+        Used when an update has been cancelled and the module is only partly built.
+        The next update rebuilds the module for all cells.
+        """
+        with self._data_lock:
+            sources = list(self._data.values())
+        for py_src in sources:
+            py_src.clear_executed()
+
     # endregion Source Management
 
     def has_code(self) -> bool:
@@ -906,7 +1153,23 @@ class PySourceManager(EventsPartial):
         """
         return len(self) > 0
 
-    def _update_item(self, py_src: PySource) -> bool:
+    def _update_item(self, py_src: PySource, defs: Mapping[str, CodeNames]) -> bool:
+        """
+        Executes the source on the module and records the module names it changed.
+
+        Only the names the code can write are compared, found by name analysis of the code and the functions it uses.
+        For code that accesses the namespace dynamically, such as with ``globals()`` or ``exec()``,
+        the names added or removed are found by comparing the keys of the module as well.
+
+        Args:
+            py_src (PySource): Source to execute.
+            defs (Mapping[str, CodeNames]): Functions and classes defined before the source, see ``_get_defs()``.
+
+        Returns:
+            bool: ``True`` if the source was executed; Otherwise, ``False`` if the update was cancelled by an event.
+        """
+        # a cancelled job stops before the next cell, never inside a cell.
+        check_cancelled()
         with self._log.indent(True):
             cargs = CancelEventArgs(self)
             sheet_idx = py_src.sheet_idx
@@ -933,14 +1196,40 @@ class PySourceManager(EventsPartial):
             code = cargs.event_data.get("code", py_src.source_code)
             if code != py_src.source_code:
                 py_src.source_code = code
-            # update the dictionary to the current state of the module
-            py_src.mod_dict = self.py_mod.mod.__dict__.copy()
+            code_names = CodeCache().get(code).code_names
+            node = None
+            if code_names is not None:
+                node = CellNode(
+                    reads=code_names.reads,
+                    writes=code_names.writes,
+                    is_opaque=code_names.is_opaque,
+                    defs=code_names.defs,
+                ).resolve_calls(defs)
+            mod_dict = self.py_mod.mod.__dict__
+            # only the names the code can write are kept while diffing, the source stores the changes only.
+            names = _EXEC_NAMES if node is None else _EXEC_NAMES.union(node.writes)
+            pre_values = {name: mod_dict.get(name, _MISSING) for name in names}
+            pre_keys = set(mod_dict) if node is None or node.is_opaque else None
             cell_obj = CellObj.from_idx(col_idx=py_src.col, row_idx=py_src.row, sheet_idx=py_src.sheet_idx)
             self.py_mod.set_global_var("CURRENT_CELL_ID", py_src.unique_id)
             self.py_mod.set_global_var("CURRENT_CELL_OBJ", cell_obj)
-            result = self.py_mod.update_with_result(py_src.source_code)
+            py_src.clear_inputs()
+            self._exec_src = py_src
+            start = self._profiler.start()
+            try:
+                result = self.py_mod.update_with_result(py_src.source_code)
+            finally:
+                self._exec_src = None
+            self._profiler.stop(start, py_src, result.get("data", None))
             result.py_src = py_src
             py_src.dd_data = result
+            writes = {k: mod_dict[k] for k, v in pre_values.items() if k in mod_dict and mod_dict[k] is not v}
+            deletes = {k for k, v in pre_values.items() if v is not _MISSING and k not in mod_dict}
+            if pre_keys is not None:
+                writes.update((k, mod_dict[k]) for k in mod_dict.keys() - pre_keys)
+                deletes.update(pre_keys - mod_dict.keys())
+            py_src.set_executed(code_names=self.py_mod.current_code_names, writes=writes, deletes=deletes)
+            self._head = py_src.link_snapshot(self._head)
 
             eargs = EventArgs.from_args(cargs)
             eargs.event_data["result"] = result
@@ -950,6 +1239,95 @@ class PySourceManager(EventsPartial):
             self._log.debug("_update_item() Leaving.")
         return True
 
+    def _restore_item(self, py_src: PySource) -> None:
+        """
+        Applies the changes of the last execution of the source to the module without running the code.
+
+        Used for cells that do not depend on any re-executed cell. The cell keeps its current result.
+        """
+        mod_dict = self.py_mod.mod.__dict__
+        mod_dict.update(py_src.mod_writes)
+        for name in py_src.mod_deletes:
+            mod_dict.pop(name, None)
+        self._head = py_src.link_snapshot(self._head)
+
+    def add_sheet_input(self, sheet_input: SheetInput) -> None:
+        """
+        Records a sheet cell or range read by the source that is currently being executed.
+
+        Does nothing if no source is being executed.
+
+        Args:
+            sheet_input (SheetInput): Cell or range that was read.
+        """
+        if self._exec_src is None:
+            return
+        self._exec_src.add_sheet_input(sheet_input, sheet_input.get_fingerprint(self._doc))
+
+    def add_cell_input(self, cell: CellObj) -> None:
+        """
+        Records the result of a code cell read by the source that is currently being executed.
+
+        Does nothing if no source is being executed.
+
+        Args:
+            cell (CellObj): Code cell that was read.
+        """
+        if self._exec_src is None:
+            return
+        self._exec_src.add_cell_input(self.convert_cell_obj_to_tuple(cell))
+
+    def _is_input_changed(self, py_src: PySource) -> bool:
+        """Gets if any sheet input of the source has changed since the source was executed."""
+        if py_src.is_volatile:
+            return True
+        for sheet_input, fingerprint in py_src.sheet_inputs.items():
+            if sheet_input.get_fingerprint(self._doc) != fingerprint:
+                return True
+        return False
+
+    def _update_affected(self, keys: List[Tuple[int, int, int]], start: int, affected: Set[int]) -> None:
+        """Executes the affected cells from start to the end of the data. All other cells are restored."""
+        defs = self._get_defs(keys, start)
+        for i in range(start, len(keys)):
+            py_src = self._data.get(keys[i])
+            if py_src is None:
+                # removed while updating, a full update has been queued by remove_source().
+                continue
+            if i in affected:
+                self._update_item(py_src, defs)
+            else:
+                self._restore_item(py_src)
+            node = py_src.get_dep_node()
+            if node is not None:
+                node.update_defs(defs)
+
+    def _get_defs(self, keys: List[Tuple[int, int, int]], index: int) -> Dict[str, CodeNames]:
+        """Gets the functions and classes defined by the cells before ``index``, see ``CellNode.update_defs()``."""
+        defs: Dict[str, CodeNames] = {}
+        for key in keys[:index]:
+            node = self._data[key].get_dep_node()
+            if node is not None:
+                node.update_defs(defs)
+        return defs
+
+    def _reset_to_index(self, index: int, keys: List[Tuple[int, int, int]]) -> None:
+        """
+        Resets the module to the state before the cell at index is executed.
+
+        All the cells before index must have been executed.
+        """
+        if index == 0:
+            self.py_mod.reset_module()
+            self._head = self.py_mod.init_snapshot
+            return
+        prev_src = self._data.get(keys[index - 1])
+        snapshot = None if prev_src is None else prev_src.snapshot
+        if snapshot is None:
+            raise ValueError(f"Source before index {index} has not been executed.")
+        self.py_mod.reset_to_dict(snapshot)
+        self._head = snapshot
+
     def update_all(self) -> None:
         """
         Rebuilds the module for all the cells.
@@ -959,12 +1337,117 @@ class PySourceManager(EventsPartial):
         with self._log.indent(True):
             self._log.debug("update_all() Entered.")
             self.py_mod.reset_module()
-            for key in self._data.keys():
-                co = CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0])
-                py_src = self[co]
-                self._update_item(py_src)
+            self._head = self.py_mod.init_snapshot
+            defs: Dict[str, CodeNames] = {}
+            for key in self._get_keys():
+                py_src = self._data.get(key)
+                if py_src is None:
+                    continue
+                self._update_item(py_src, defs)
+                node = py_src.get_dep_node()
+                if node is not None:
+                    node.update_defs(defs)
             self._log.debug("update_all() Leaving.")
 
+    def _apply_stored(self, py_src: PySource, stored: StoredResult, code_names: CodeNames) -> None:
+        """Gives the source the stored result and applies the stored module changes without running the code."""
+        py_src.clear_inputs()
+        for sheet_input in stored.inputs.keys():
+            py_src.add_sheet_input(sheet_input, sheet_input.get_fingerprint(self._doc))
+        for key in stored.cell_inputs:
+            py_src.add_cell_input(key)
+        py_src.dd_data = DotDict(**stored.data, py_src=py_src)
+        py_src.set_executed(code_names=code_names, writes=stored.writes, deletes=stored.deletes)
+        py_src.is_result_stored = True
+        self._restore_item(py_src)
+
+    def update_all_from_store(self) -> None:
+        """
+        Rebuilds the module for all the cells using the results stored with the document.
+
+        A cell is executed if it has no stored result, its source code or sheet inputs changed since it was stored,
+        or it reads a name written by an executed cell. All other cells get their stored result.
+
+        Triggers ``BeforeSourceUpdate`` and ``AfterSourceUpdate`` events for each executed cell.
+        """
+        with self._log.indent(True):
+            self._log.debug("update_all_from_store() Entered.")
+            self.py_mod.reset_module()
+            self._head = self.py_mod.init_snapshot
+            # names written by executed cells, cells reading them must be executed as well.
+            stale: Set[str] = set()
+            # functions and classes defined so far, cells using them read the names of their bodies.
+            defs: Dict[str, CodeNames] = {}
+            all_stale = False
+            count = 0
+            for key in self._get_keys():
+                py_src = self._data.get(key)
+                if py_src is None:
+                    continue
+                stored = None if all_stale else self._store.load(py_src)
+                if stored is not None and stored.is_valid(py_src.source_code, self._doc):
+                    code_names = CodeCache().get(py_src.source_code).code_names
+                    if code_names is not None:
+                        node = CellNode(
+                            reads=code_names.reads.union(_get_cell_ref_name(*k) for k in stored.cell_inputs),
+                            writes=code_names.writes,
+                            is_opaque=code_names.is_opaque,
+                            defs=code_names.defs,
+                        )
+                        resolved = node.resolve_calls(defs)
+                        if not resolved.is_opaque and resolved.reads.isdisjoint(stale):
+                            self._apply_stored(py_src, stored, code_names)
+                            node.update_defs(defs)
+                            count += 1
+                            continue
+                    # names the stored result wrote are stale as well as the names the cell writes now.
+                    stale.update(stored.writes.keys())
+                    stale.update(stored.deletes)
+                self._update_item(py_src, defs)
+                node = py_src.get_dep_node()
+                if node is None:
+                    all_stale = True
+                else:
+                    stale.update(node.resolve_calls(defs).writes)
+                    node.update_defs(defs)
+            self._log.debug(f"update_all_from_store() {count} of {len(self)} cells restored. Leaving.")
+
+    def save_results(self) -> int:
+        """
+        Stores the results of the cells with the document, see ``ResultStore``.
+
+        Only results that changed since they were last stored are written.
+
+        Returns:
+            int: Number of results written.
+        """
+        with self._log.indent(True):
+            count = 0
+            with self._data_lock:
+                sources = list(self._data.values())
+            for py_src in sources:
+                if py_src.is_result_stored:
+                    continue
+                if self._store.save(py_src):
+                    py_src.is_result_stored = True
+                    count += 1
+            self._log.debug(f"save_results() {count} results stored.")
+            return count
+
+    def delete_results(self) -> None:
+        """Deletes the results stored with the document."""
+        with self._data_lock:
+            sources = list(self._data.values())
+        for py_src in sources:
+            self._store.delete(py_src)
+            py_src.is_result_stored = False
+        self._store.has_results = False
+
+    @property
+    def has_stored_results(self) -> bool:
+        """Gets if results have been read from or stored with the document."""
+        return self._store.has_results
+
     def get_calc_cells(self) -> List[CalcCell]:
         """
         Get all the CalcCells that have code.
@@ -977,7 +1460,7 @@ class PySourceManager(EventsPartial):
             cc = CellCache(self._doc)
             cells = []
             sheet_idx = -1
-            for key in self._data.keys():
+            for key in self._get_keys():
                 idx, row, col = key
                 sheet = None
                 if sheet is None or sheet_idx != idx:
@@ -993,6 +1476,9 @@ class PySourceManager(EventsPartial):
         """
         Rebuilds the module from the specified index to the end of the data.
 
+        Only the cell at index and the cells that depend on it, directly or indirectly, are executed.
+        All other cells keep their current result and only have their last changes re-applied to the module.
+
         Args:
             index (int): Index of the cell in the data.
 
@@ -1002,6 +1488,9 @@ class PySourceManager(EventsPartial):
         Note:
             This method will not update the module for the cell before the specified index.
             This means if the current cell or any cell after has modified a previous cells variable, the module will not be updated correctly.
+
+            Dependencies are found by name analysis of each cell, see ``CodeNames``.
+            Cells that use ``globals()``, ``exec()`` and the like are treated as depending on every cell before them.
         """
         with self._log.indent(True):
             self._log.debug(f"update_from_index({index}) Entered.")
@@ -1012,27 +1501,83 @@ class PySourceManager(EventsPartial):
 
             if index < 0:
                 index = 0
-            if index == 0:
-                self.update_all()
-                return
+
+            keys = self._get_keys()
+            for i in range(index):
+                if not self._data[keys[i]].is_executed:
+                    self._log.debug(f"update_from_index({index}). Previous cell not executed. Updating all.")
+                    self.update_all()
+                    return
 
             # reset the module dictionary to before index item changes
-            keys = list(self._data.keys())
-            key = keys[index]  # row, col format
-            co = CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0])
-            py_src = self[co]
+            self._reset_to_index(index, keys)
+
+            py_src = self._data[keys[index]]
+            old_written = py_src.written_names if py_src.is_executed else set()
+            defs = self._get_defs(keys, index)
+            self._update_item(py_src, defs)
             if self._is_last_index(index):
                 self._log.debug(f"update_from_index({index}). Is last index.")
-            else:
-                self._log.debug(f"update_from_index({index}). Is not last index. Resetting module to py_src dict.")
-                self.py_mod.reset_to_dict(py_src.mod_dict)
-            for i in range(index, length):
-                key = keys[i]  # tuple in row, col format
-                cell_obj = CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0])
-                py_src = self[cell_obj]
-                self._update_item(py_src)
+                self._log.debug(f"update_from_index({index}) Leaving.")
+                return
+
+            # names the cell wrote previously are stale as well as the names it writes now.
+            nodes = [self._data[key].get_dep_node() for key in keys[index:]]
+            if nodes[0] is not None:
+                nodes[0] = CellNode(reads=nodes[0].reads, writes=nodes[0].writes | old_written, defs=nodes[0].defs)
+            graph = CellDepGraph(nodes, defs=defs)
+            affected = {i + index for i in graph.get_dependents([0])}
+            if self._log.is_debug:
+                self._log.debug(
+                    f"update_from_index({index}). {len(affected) - 1} of {length - index - 1} following cells depend on the cell."
+                )
+
+            self._update_affected(keys, index + 1, affected)
             self._log.debug(f"update_from_index({index}) Leaving.")
 
+    def update_changed_inputs(self) -> bool:
+        """
+        Executes only the cells whose sheet inputs changed since they were last executed and the cells depending on them.
+
+        Sheet inputs are the cells and ranges read through ``lp()``.
+        Cells that access the document directly, such as with ``Lo`` or ``CalcDoc``, are always executed.
+        If any cell has not been executed yet then the module is rebuilt for all cells, see ``update_all()``.
+
+        Triggers ``BeforeSourceUpdate`` and ``AfterSourceUpdate`` events for each executed cell.
+
+        Returns:
+            bool: ``True`` if any cell was executed; Otherwise, ``False``.
+        """
+        with self._log.indent(True):
+            self._log.debug("update_changed_inputs() Entered.")
+            keys = self._get_keys()
+            for key in keys:
+                if not self._data[key].is_executed:
+                    self._log.debug("update_changed_inputs() Not all cells executed. Updating all.")
+                    self.update_all()
+                    return True
+
+            changed = [i for i, key in enumerate(keys) if self._is_input_changed(self._data[key])]
+            if not changed:
+                self._log.debug("update_changed_inputs() No inputs changed. Leaving.")
+                return False
+
+            start = changed[0]
+            self._reset_to_index(start, keys)
+
+            graph = CellDepGraph(
+                [self._data[key].get_dep_node() for key in keys[start:]], defs=self._get_defs(keys, start)
+            )
+            affected = {i + start for i in graph.get_dependents([i - start for i in changed])}
+            if self._log.is_debug:
+                self._log.debug(
+                    f"update_changed_inputs() {len(changed)} cells have changed inputs. "
+                    f"Executing {len(affected)} of {len(keys)} cells."
+                )
+            self._update_affected(keys, start, affected)
+            self._log.debug("update_changed_inputs() Leaving.")
+            return True
+
     # region Properties
 
     @property
@@ -0,0 +1,199 @@
+"""
+Results of code cells stored with the document.
+
+When the document is saved the result and module changes of each cell are pickled next to the cell source code.
+When the document is opened a cell whose source code and sheet inputs are unchanged gets its stored result
+instead of being executed again.
+
+Stored results are unpickled when the document is opened, unpickling can run any code in the same way
+as the code of the cells does. The hash of the cell source code is stored in clear text before the pickle,
+a result is only unpickled if the hash matches the current source code of its cell.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Set, Tuple, TYPE_CHECKING
+import base64
+import hashlib
+import importlib
+import pickle
+import zlib
+from dataclasses import dataclass, field
+from types import ModuleType
+
+from .sheet_input import SheetInput
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcDoc
+    from .py_source_mgr import PySource, PySourceManager
+
+
+def get_source_hash(source: str) -> str:
+    """Gets the hash of source code that is stored with a result."""
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class _ModuleRef:
+    """Stands in for an imported module, modules can not be pickled."""
+
+    name: str
+
+
+def _to_stored(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _ModuleRef(v.__name__) if isinstance(v, ModuleType) else v for k, v in values.items()}
+
+
+def _from_stored(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: importlib.import_module(v.name) if isinstance(v, _ModuleRef) else v for k, v in values.items()}
+
+
+@dataclass
+class StoredResult:
+    """
+    Stored result of a code cell.
+
+    Attributes:
+        source_hash (str): Hash of the source code that produced the result.
+        inputs (Dict[SheetInput, str]): Sheet inputs read by the code and the digest of their values.
+        cell_inputs (Set[Tuple[int, int, int]]): Keys of the code cells whose results were read by the code.
+        writes (Dict[str, Any]): Module names that were added or rebound by the code.
+        deletes (Set[str]): Module names that were removed by the code.
+        data (Dict[str, Any]): Result of the cell, the content of ``PySource.dd_data``.
+    """
+
+    source_hash: str
+    inputs: Dict[SheetInput, str] = field(default_factory=dict)
+    cell_inputs: Set[Tuple[int, int, int]] = field(default_factory=set)
+    writes: Dict[str, Any] = field(default_factory=dict)
+    deletes: Set[str] = field(default_factory=set)
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def is_valid(self, source: str, doc: CalcDoc) -> bool:
+        """
+        Gets if the result is still valid for the source code and the current sheet values.
+
+        Args:
+            source (str): Current source code of the cell.
+            doc (CalcDoc): Document to read the sheet inputs from.
+        """
+        if self.source_hash != get_source_hash(source):
+            return False
+        return all(sheet_input.get_digest(doc) == digest for sheet_input, digest in self.inputs.items())
+
+
+class ResultStore:
+    """
+    Reads and writes stored results of the code cells of a document.
+
+    Results are written to a text file next to the source code of the cell.
+    The first line is the hash of the source code, the rest is base64 of the zipped pickle.
+    A result that can not be pickled, such as an open file, is not stored and the cell is executed on load.
+    A result that is a file, such as a figure, is only a path to a temporary file of the session
+    and is not stored either.
+    """
+
+    EXT = ".result"
+
+    def __init__(self, mgr: PySourceManager, doc: CalcDoc) -> None:
+        self._mgr = mgr
+        self._doc = doc
+        self._has_results = False
+
+    def _get_uri(self, py_src: PySource) -> str:
+        return py_src.uri[: -len(".py")] + ResultStore.EXT
+
+    def load(self, py_src: PySource) -> StoredResult | None:
+        """
+        Loads the stored result of a cell.
+
+        Args:
+            py_src (PySource): Source of the cell.
+
+        Returns:
+            StoredResult, None: Stored result or ``None`` if there is no result or it can not be read.
+        """
+        uri = self._get_uri(py_src)
+        try:
+            if not self._mgr.sfa.exists(uri):
+                return None
+            text = self._mgr.sfa.read_text_file(uri)
+            source_hash, _, payload = text.partition("\n")
+            if source_hash != get_source_hash(py_src.source_code):
+                # changed source code, or a result written before the hash was stored in clear text.
+                return None
+            result = pickle.loads(zlib.decompress(base64.b64decode(payload)))
+            if isinstance(result, StoredResult):
+                result.writes = _from_stored(result.writes)
+        except Exception:
+            self._mgr.log.warning(f"ResultStore.load() - Unable to read stored result: {uri}", exc_info=True)
+            return None
+        if not isinstance(result, StoredResult):
+            return None
+        self._has_results = True
+        return result
+
+    def save(self, py_src: PySource) -> bool:
+        """
+        Stores the current result of a cell.
+
+        Args:
+            py_src (PySource): Source of the cell. Must have been executed.
+
+        Returns:
+            bool: ``True`` if the result is stored; Otherwise, ``False``.
+        """
+        if (
+            not py_src.is_executed
+            or py_src.is_error
+            or py_src.is_volatile
+            or py_src.dd_data.get("data_type") == "file"
+        ):
+            self.delete(py_src)
+            return False
+        inputs: Dict[SheetInput, str] = {}
+        for sheet_input in py_src.sheet_inputs:
+            digest = sheet_input.get_digest(self._doc)
+            if digest is None:
+                self.delete(py_src)
+                return False
+            inputs[sheet_input] = digest
+        source_hash = get_source_hash(py_src.source_code)
+        entry = StoredResult(
+            source_hash=source_hash,
+            inputs=inputs,
+            cell_inputs=set(py_src.cell_inputs),
+            writes=_to_stored(py_src.mod_writes),
+            deletes=set(py_src.mod_deletes),
+            data={k: v for k, v in py_src.dd_data.items() if k != "py_src"},
+        )
+        uri = self._get_uri(py_src)
+        try:
+            payload = base64.b64encode(zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)))
+        except Exception as e:
+            self._mgr.log.debug(f"ResultStore.save() - Result of {py_src.unique_id} not stored: {e}")
+            self.delete(py_src)
+            return False
+        self._mgr.ensure_src_folder()
+        self._mgr.sfa.write_text_file(uri, f"{source_hash}\n{payload.decode('ascii')}", "w")
+        self._has_results = True
+        return True
+
+    def delete(self, py_src: PySource) -> None:
+        """
+        Deletes the stored result of a cell if any.
+
+        Args:
+            py_src (PySource): Source of the cell.
+        """
+        uri = self._get_uri(py_src)
+        if self._mgr.sfa.exists(uri):
+            self._mgr.sfa.delete_file(uri)
+
+    @property
+    def has_results(self) -> bool:
+        """Gets if any result has been read from or written to the document."""
+        return self._has_results
+
+    @has_results.setter
+    def has_results(self, value: bool) -> None:
+        self._has_results = value
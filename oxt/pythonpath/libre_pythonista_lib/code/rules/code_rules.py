@@ -152,6 +152,7 @@ class CodeRules:
         Args:
             mod (types.ModuleType): Module
             code (str): Code string.
+            ast_mod (ast.Module, None): AST of the code. The tree is shared with ``CodeCache`` and must not be modified.
 
         Returns:
             List[CodeRuleT]: List of matched rules
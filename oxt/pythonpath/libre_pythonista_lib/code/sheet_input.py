@@ -0,0 +1,91 @@
+"""
+Sheet inputs of code cells.
+
+When a code cell reads sheet data through ``lp()`` the address is recorded along with a fingerprint of the values.
+On recalculation only the cells whose inputs have a different fingerprint need to be executed again.
+"""
+
+from __future__ import annotations
+from typing import Any, Tuple, TYPE_CHECKING
+import contextlib
+import hashlib
+from dataclasses import dataclass
+
+from ooodev.utils.data_type.cell_obj import CellObj
+from ooodev.utils.data_type.range_obj import RangeObj
+from ooodev.exceptions import ex as mEx  # noqa: N812
+
+from ..data.range_cache import RangeCache
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcDoc
+
+
+@dataclass(frozen=True)
+class SheetInput:
+    """
+    Cell or range of a sheet that is read by a code cell.
+
+    Attributes:
+        sheet_idx (int): Sheet index.
+        range_name (str): Cell name such as ``A1`` or range name such as ``A1:C10``.
+        collapse (bool): ``True`` if the range is collapsed to the used area when read.
+    """
+
+    sheet_idx: int
+    range_name: str
+    collapse: bool = False
+
+    @property
+    def is_cell(self) -> bool:
+        """Gets if the input is a single cell."""
+        return ":" not in self.range_name
+
+    def _get_values(self, doc: CalcDoc) -> Tuple[str, Any]:
+        sheet = doc.sheets[self.sheet_idx]
+        if self.is_cell:
+            cell_obj = CellObj.from_cell(self.range_name)
+            cell_obj.set_sheet_index(self.sheet_idx)
+            return (self.range_name, sheet[cell_obj].value)
+
+        rng_obj = RangeObj.from_range(self.range_name)
+        rng_obj.set_sheet_index(self.sheet_idx)
+        if self.collapse:
+            # the used area is part of the fingerprint, rows added or removed change the result.
+            with contextlib.suppress(mEx.CellRangeError):
+                rng_obj = sheet.get_range(range_obj=rng_obj).find_used_range().range_obj.copy()
+        # shared with lp() so a changed range is only read once per recalculation.
+        data = RangeCache(doc).get_array(self.sheet_idx, rng_obj)
+        return (str(rng_obj), tuple(tuple(row) for row in data))
+
+    def get_fingerprint(self, doc: CalcDoc) -> Any:  # noqa: ANN401
+        """
+        Gets a fingerprint of the current values of the input.
+
+        Args:
+            doc (CalcDoc): Document to read the values from.
+
+        Returns:
+            Any: Hash of the values. ``None`` if the values can not be read, such as when the sheet has been removed.
+        """
+        try:
+            return hash(self._get_values(doc))
+        except Exception:
+            return None
+
+    def get_digest(self, doc: CalcDoc) -> str | None:
+        """
+        Gets a digest of the current values of the input.
+
+        Unlike ``get_fingerprint()`` the digest is the same in every session and can be stored with the document.
+
+        Args:
+            doc (CalcDoc): Document to read the values from.
+
+        Returns:
+            str, None: Digest of the values. ``None`` if the values can not be read.
+        """
+        try:
+            return hashlib.sha1(repr(self._get_values(doc)).encode("utf-8")).hexdigest()
+        except Exception:
+            return None
@@ -21,7 +21,9 @@ PATH_PIP_PKG_INSTALLED = "libre_pythonista.ext.pkg_pkg_installed"
 PATH_PIP_PKG_LINK = "libre_pythonista.ext.pkg_pkg_link"
 PATH_PIP_PKG_UNINSTALL = "libre_pythonista.ext.pip_pkg_uninstall"
 PATH_PIP_PKG_UNLINK = "libre_pythonista.ext.pkg_pkg_unlink"
+PATH_PY_EXEC_CANCEL = "libre_pythonista.calc.py.exec.cancel"
 PATH_PY_OBJ_STATE = "libre_pythonista.calc.py_obj.state"
+PATH_PY_REBUILD = "libre_pythonista.calc.py.rebuild"
 PATH_PYC_FORMULA = "libre_pythonista.insert_pyc_formula"
 PATH_PYC_FORMULA_DEP = "libre_pythonista.insert_pyc_formula_dep"
 PATH_SEL_RNG = "libre_pythonista.calc.sel.rng"
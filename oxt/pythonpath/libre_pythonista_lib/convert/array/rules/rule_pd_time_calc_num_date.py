@@ -26,4 +26,4 @@ class RulePdTimeCalcNumDate(RuleBase):
 
     @override
     def convert(self, value: Any) -> Any:
-        return ConvertUtil.lo_date_to_pandas_timestamp(value)
+        return ConvertUtil.pandas_timestamp_to_lo_num(value)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 from datetime import datetime, timedelta
-import pandas as pd
 from ooodev.loader import Lo
+from ..code.lazy_module import lazy_import
+
+# imported on first use, loading the extension does not import pandas.
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 
 class ConvertUtil:
@@ -93,3 +97,68 @@ class ConvertUtil:
         libreoffice_number = delta.days + delta.seconds / 86400  # 86400 seconds in a day
 
         return round(libreoffice_number)
+
+    @classmethod
+    def pandas_timestamp_to_lo_num(cls, timestamp: pd.Timestamp | datetime, epoch: datetime | None = None) -> float:
+        """
+        Convert a Pandas Timestamp or datetime object to a LibreOffice Calc numeric date, keeping the time part.
+
+        Args:
+            timestamp (pd.Timestamp | datetime): The Pandas Timestamp or datetime object to convert.
+            epoch (datetime, None, optional): Epoch of the numeric date. Defaults to the LibreOffice Calc epoch.
+
+        Returns:
+            float: The numeric date, days since the epoch with the time as the fractional part.
+        """
+        if epoch is None:
+            epoch = cls.get_lo_epoch()
+        ts = pd.Timestamp(timestamp)
+        if ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        return (ts - pd.Timestamp(epoch)) / pd.Timedelta(days=1)
+
+    @classmethod
+    def lo_dates_to_pandas(cls, values: pd.Series, epoch: datetime | None = None) -> pd.Series:
+        """
+        Convert a Series of LibreOffice Calc numeric dates to a Series of Pandas Timestamps.
+
+        The conversion is done on the whole column at once.
+        Values that are empty or not numeric become ``NaT``.
+
+        Args:
+            values (pd.Series): Numeric dates.
+            epoch (datetime, None, optional): Epoch of the numeric dates. Defaults to the LibreOffice Calc epoch.
+
+        Returns:
+            pd.Series: New ``datetime64`` Series with the same index and name.
+        """
+        if epoch is None:
+            epoch = cls.get_lo_epoch()
+        days = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        # whole microseconds, the same precision as datetime.timedelta(days=...)
+        micro_seconds = np.round(days * 86_400_000_000)
+        deltas = pd.to_timedelta(micro_seconds, unit="us")
+        return pd.Series(pd.Timestamp(epoch) + deltas, index=values.index, name=values.name)
+
+    @classmethod
+    def pandas_dates_to_lo(cls, values: pd.Series, epoch: datetime | None = None) -> pd.Series:
+        """
+        Convert a Series of Pandas Timestamps to a Series of LibreOffice Calc numeric dates.
+
+        The conversion is done on the whole column at once and the time is kept as the fractional part.
+        ``NaT`` values become ``NaN``. Time zone aware values are converted using their local time.
+
+        Args:
+            values (pd.Series): Date values.
+            epoch (datetime, None, optional): Epoch of the numeric dates. Defaults to the LibreOffice Calc epoch.
+
+        Returns:
+            pd.Series: New ``float64`` Series with the same index and name.
+        """
+        if epoch is None:
+            epoch = cls.get_lo_epoch()
+        dates = pd.to_datetime(values)
+        if getattr(dates.dt, "tz", None) is not None:
+            dates = dates.dt.tz_localize(None)
+        days = (dates - pd.Timestamp(epoch)) / pd.Timedelta(days=1)
+        return pd.Series(days, index=values.index, name=values.name, dtype="float64")
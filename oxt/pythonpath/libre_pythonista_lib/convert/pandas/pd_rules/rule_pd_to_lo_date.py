@@ -13,16 +13,17 @@ class RulePdToLoDate(RuleBase):
 
     def _convert_pandas_lo_date_columns(self, df: pd.DataFrame, *columns: str | int) -> pd.DataFrame:
         """
-        Converts date columns to Pandas Timestamp.
+        Converts date columns to LibreOffice Calc numeric dates.
 
         Note:
             Does not make a copy of the DataFrame.
         """
+        epoch = ConvertUtil.get_lo_epoch()
         for col in columns:
             if isinstance(col, int):
                 col_name = df.columns[col]
                 # df.iloc[:, col] = df.iloc[:, col].apply(cls.libreoffice_date_to_pandas)
             else:
                 col_name = col
-            df[col_name] = df[col_name].apply(ConvertUtil.pandas_to_lo_date)
+            df[col_name] = ConvertUtil.pandas_dates_to_lo(df[col_name], epoch)
         return df
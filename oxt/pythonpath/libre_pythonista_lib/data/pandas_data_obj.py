@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, TYPE_CHECKING
+from typing import Any, Dict, Sequence, TYPE_CHECKING
 import pandas as pd
 from typing import List
 import uno
@@ -15,7 +15,12 @@ else:
 
 
 class PandasDataObj:
-    def __init__(self, cell_rng: CalcCellRange, col_types: Dict[str | int, str] | None = None):
+    def __init__(
+        self,
+        cell_rng: CalcCellRange,
+        col_types: Dict[str | int, str] | None = None,
+        data: Sequence[Sequence[Any]] | None = None,
+    ):
         """
         Constructor
 
@@ -23,10 +28,13 @@ class PandasDataObj:
             cell_rng (CalcCellRange): The cell range to get the table information from.
             col_types (Dict[str | int, str] | None): A dictionary of column names or indexes and their types.
                 Currently only "date" column type is supported.
+            data (Sequence[Sequence[Any]] | None): Values of the range if they have already been read.
+                If omitted the values are read from the sheet.
         """
         self._sheet = cell_rng.calc_sheet
         self._doc = cell_rng.calc_doc
         self._cell_rng = cell_rng
+        self._data = data
         self._date_column_names: List[str] = []
         self._date_column_indexes: List[int] = []
         self._log = OxtLogger(log_name=self.__class__.__name__)
@@ -60,6 +68,8 @@ class PandasDataObj:
                     self._date_column_indexes.append(key)
 
     def _get_data(self):
+        if self._data is not None:
+            return self._data
         return self._sheet.get_array(range_obj=self._cell_rng.range_obj)
 
     def _process_df_with_headers(self, df: pd.DataFrame):
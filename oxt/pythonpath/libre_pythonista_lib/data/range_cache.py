@@ -0,0 +1,166 @@
+"""
+Per document cache of sheet range data read by ``lp()``.
+
+Several code cells often read the same source table.
+The range values and the resulting DataFrame are read once and reused until the sheet is modified
+or the document is recalculated.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Tuple, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+
+from ooodev.calc import CalcDoc, CalcCellRange
+from ooodev.events.args.event_args import EventArgs
+from ooodev.utils.data_type.range_obj import RangeObj
+
+from ..const.event_const import SHEET_MODIFIED
+from ..event.shared_event import SharedEvent
+from ..utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from ooodev.utils.type_var import TupleArray
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+
+class RangeCache(SingletonBase):
+    """
+    Range cache for a document.
+
+    Entries are removed for a sheet when the sheet modify listener raises ``SHEET_MODIFIED``.
+    ``CellMgr`` clears the cache when Calc has recalculated formulas, because formula results
+    can change without the sheet being modified.
+    """
+
+    MAX_ENTRIES = 32
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._arrays: OrderedDict[Tuple[int, str], TupleArray] = OrderedDict()
+        self._frames: OrderedDict[Tuple[int, str, str], Tuple[pd.DataFrame, bool]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._se = SharedEvent(doc)
+        self._fn_on_sheet_modified = self._on_sheet_modified
+        self._se.subscribe_event(SHEET_MODIFIED, self._fn_on_sheet_modified)
+        self._is_init = True
+
+    def _on_sheet_modified(self, src: Any, event: EventArgs) -> None:  # noqa: ANN401
+        sheet_idx = -1
+        try:
+            sheet_idx = int(event.event_data.event.Source.getRangeAddress().Sheet)
+        except Exception:
+            sheet_idx = -1
+        if sheet_idx < 0:
+            self.clear()
+        else:
+            self.invalidate(sheet_idx)
+
+    def _get_col_types_key(self, col_types: Dict[str | int, str] | None) -> str:
+        if not col_types:
+            return ""
+        return repr(sorted(col_types.items(), key=lambda item: repr(item[0])))
+
+    def _put(self, cache: OrderedDict, key: Any, value: Any) -> None:  # noqa: ANN401
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > RangeCache.MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    def get_array(self, sheet_idx: int, rng_obj: RangeObj) -> TupleArray:
+        """
+        Gets the values of a range.
+
+        Args:
+            sheet_idx (int): Sheet index.
+            rng_obj (RangeObj): Range to read.
+
+        Returns:
+            TupleArray: Range values. The tuples are shared and are not to be modified.
+        """
+        key = (sheet_idx, str(rng_obj))
+        with self._lock:
+            data = self._arrays.get(key)
+            if data is not None:
+                self._arrays.move_to_end(key)
+                self._hits += 1
+                return data
+        sheet = self._doc.sheets[sheet_idx]
+        data = sheet.get_array(range_obj=rng_obj)
+        with self._lock:
+            self._misses += 1
+            self._put(self._arrays, key, data)
+        return data
+
+    def get_data_frame(
+        self, cell_rng: CalcCellRange, col_types: Dict[str | int, str] | None = None
+    ) -> Tuple[pd.DataFrame, bool]:
+        """
+        Gets the DataFrame for a range.
+
+        Args:
+            cell_rng (CalcCellRange): Range to read.
+            col_types (Dict[str | int, str], None, optional): Column types, see ``PandasDataObj``.
+
+        Returns:
+            Tuple[DataFrame, bool]: A copy of the cached DataFrame and a flag that is ``True`` if the range has headers.
+            A copy is returned because code cells are free to modify the DataFrame in place.
+        """
+        sheet_idx = cell_rng.calc_sheet.sheet_index
+        rng_obj = cell_rng.range_obj
+        key = (sheet_idx, str(rng_obj), self._get_col_types_key(col_types))
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+                self._hits += 1
+        if entry is None:
+            # pandas is imported on first use, it may not be installed when the extension starts.
+            from .pandas_data_obj import PandasDataObj
+
+            data = self.get_array(sheet_idx, rng_obj)
+            pdo = PandasDataObj(cell_rng=cell_rng, col_types=col_types, data=data)
+            entry = (pdo.get_data_frame(), pdo.has_headers)
+            with self._lock:
+                self._put(self._frames, key, entry)
+        elif self._log.is_debug:
+            with self._log.indent(True):
+                self._log.debug("get_data_frame() Cache hit for sheet %i range %s", sheet_idx, rng_obj)
+        df, has_headers = entry
+        return df.copy(), has_headers
+
+    def invalidate(self, sheet_idx: int) -> None:
+        """
+        Removes the cached entries of a sheet.
+
+        Args:
+            sheet_idx (int): Sheet index.
+        """
+        with self._lock:
+            for cache in (self._arrays, self._frames):
+                for key in [k for k in cache if k[0] == sheet_idx]:
+                    del cache[key]
+
+    def clear(self) -> None:
+        """Removes all cached entries."""
+        with self._lock:
+            self._arrays.clear()
+            self._frames.clear()
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of reads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of ranges read from the sheet."""
+        return self._misses
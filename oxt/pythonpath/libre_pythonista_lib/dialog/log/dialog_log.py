@@ -31,6 +31,7 @@ from ooo.dyn.style.vertical_alignment import VerticalAlignment
 
 from ooodev.dialog import BorderKind
 from ooodev.dialog.dl_control import CtlTextEdit
+from ooodev.dialog.input import Input
 from ooodev.dialog.msgbox import MsgBox, MessageBoxResultsEnum, MessageBoxType, MessageBoxButtonsEnum
 from ooodev.events.args.event_args import EventArgs
 from ooodev.events.lo_events import LoEvents
@@ -51,8 +52,10 @@ if TYPE_CHECKING:
     from .....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
     from .....___lo_pip___.lo_util.resource_resolver import ResourceResolver
 
+    from ...code.cell_profiler import CellProfiler
     from ...dialog.options.log_opt import LogOpt
     from ...config.dialog.log_cfg import LogCfg
+    from ...doc_props.calc_props import CalcProps
     from ...const.event_const import GBL_DOC_CLOSING, LOG_PY_LOGGER_RESET
     from ...event.shared_event import SharedEvent
     from ...log.py_logger import PyLogger
@@ -64,8 +67,10 @@ if TYPE_CHECKING:
 else:
     from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
     from ___lo_pip___.lo_util.resource_resolver import ResourceResolver
+    from libre_pythonista_lib.code.cell_profiler import CellProfiler
     from libre_pythonista_lib.dialog.options.log_opt import LogOpt
     from libre_pythonista_lib.config.dialog.log_cfg import LogCfg
+    from libre_pythonista_lib.doc_props.calc_props import CalcProps
     from libre_pythonista_lib.const.event_const import GBL_DOC_CLOSING, LOG_PY_LOGGER_RESET
     from libre_pythonista_lib.event.shared_event import SharedEvent
     from libre_pythonista_lib.log.py_logger import PyLogger
@@ -397,6 +402,26 @@ class DialogLog(TheDictionaryPartial, XTopWindowListener, unohelper.Base):
             elif command == ".uno:lp.log_settings":
                 LogOpt().show()
                 return
+            elif command == ".uno:lp.profile_cells":
+                self._write_profile()
+            elif command == ".uno:lp.clear_profile":
+                CellProfiler(self._doc).clear()
+            elif command == ".uno:lp.profile_memory":
+                profiler = CellProfiler(self._doc)
+                profiler.trace_memory = not profiler.trace_memory
+                self._write_line(f"Cell memory profiling: {'On' if profiler.trace_memory else 'Off'}")
+            elif command == ".uno:lp.store_results":
+                # the results are stored or deleted when the document is next saved.
+                props = CalcProps(self._doc)
+                props.store_results = not props.store_results
+                self._write_line(f"Store cell results with the document: {'On' if props.store_results else 'Off'}")
+            elif command == ".uno:lp.plot_png":
+                # figures that are rendered after the change use the new format.
+                props = CalcProps(self._doc)
+                props.plot_format = "svg" if props.plot_format == "png" else "png"
+                self._write_line(f"Plot format: {props.plot_format}")
+            elif command == ".uno:lp.plot_dpi":
+                self._set_plot_dpi()
         except Exception:
             self._log.exception("Error in _on_menu_select")
         return
@@ -457,6 +482,35 @@ class DialogLog(TheDictionaryPartial, XTopWindowListener, unohelper.Base):
     def _write_line(self, text: str) -> None:
         self._log_txt.write_line(text)
 
+    def _write_profile(self) -> None:
+        """Writes the cell profile to the log, most expensive cell first."""
+        profiler = CellProfiler(self._doc)
+        self._write_line(f"Cell Profile (last {len(profiler.get_entries())} executions):")
+        self._write_line(profiler.get_report())
+
+    def _set_plot_dpi(self) -> None:
+        """Asks for the resolution of figures in ``png`` format."""
+        props = CalcProps(self._doc)
+        value = Input.get_input(
+            title=self._rr.resolve_string("strPlotDpiTitle"),
+            msg=self._rr.resolve_string("strPlotDpi"),
+            input_value=str(props.plot_dpi),
+            ok_lbl=self._rr.resolve_string("dlg01"),
+            cancel_lbl=self._rr.resolve_string("dlg02"),
+        ).strip()
+        if not value:
+            return
+        try:
+            dpi = int(value)
+        except ValueError:
+            self._write_line(f"Invalid plot resolution: {value}")
+            return
+        if dpi < 10:
+            self._write_line(f"Invalid plot resolution: {value}")
+            return
+        props.plot_dpi = dpi
+        self._write_line(f"PNG plot resolution: {dpi} dpi")
+
     def _clear_data(self) -> None:
         self._log.debug("_clear_data")
         try:
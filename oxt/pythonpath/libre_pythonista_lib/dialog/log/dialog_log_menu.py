@@ -49,6 +49,17 @@ class DialogLogMenu:
                 "text": rr("mnuHideWindow"),
                 "command": ".uno:lp.hide_window",
             },
+            {
+                "text": "-",
+            },
+            {
+                "text": rr("mnuProfileCells"),
+                "command": ".uno:lp.profile_cells",
+            },
+            {
+                "text": rr("mnuClearProfile"),
+                "command": ".uno:lp.clear_profile",
+            },
         ]
         return new_menu
 
@@ -66,5 +77,24 @@ class DialogLogMenu:
                 "text": rr("mnuLogSettings"),
                 "command": ".uno:lp.log_settings",
             },
+            {
+                "text": rr("mnuProfileMemory"),
+                "command": ".uno:lp.profile_memory",
+            },
+            {
+                "text": rr("mnuStoreResults"),
+                "command": ".uno:lp.store_results",
+            },
+            {
+                "text": "-",
+            },
+            {
+                "text": rr("mnuPlotPng"),
+                "command": ".uno:lp.plot_png",
+            },
+            {
+                "text": rr("mnuPlotDpi"),
+                "command": ".uno:lp.plot_dpi",
+            },
         ]
         return new_menu
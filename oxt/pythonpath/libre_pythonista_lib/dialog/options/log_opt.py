@@ -350,6 +350,7 @@ class LogOpt:
                     self._log.debug(f"Log Format: {fmt}")
                     self._calc_props.log_format = fmt
                     self._calc_props.include_extra_err_info = self._include_extra_info == TriStateKind.CHECKED
+                    self._calc_props.flush_properties()
                     SharedEvent().trigger_event(LOG_OPTIONS_CHANGED, EventArgs(self))
             except Exception:
                 self._log.exception("Error in _handle_results")
@@ -365,6 +366,7 @@ class LogOpt:
             self._calc_props.log_level = logging.INFO
             self._calc_props.include_extra_err_info = False
             self._calc_props.log_format = self._cfg.lp_default_log_format
+            self._calc_props.flush_properties()
             self._dialog.end_dialog(MessageBoxResultsEnum.CANCEL.value)
             SharedEvent().trigger_event(LOG_OPTIONS_CHANGED, EventArgs(self))
 
@@ -1,13 +1,10 @@
 from __future__ import annotations
-import queue
-import time
 from typing import Any, List, cast, Dict, TYPE_CHECKING
 import struct
 import subprocess
 import threading
 import os
 from pathlib import Path
-import json
 
 from ooodev.calc import CalcDoc, CalcCell
 from ooodev.events.args.event_args import EventArgs
@@ -21,8 +18,10 @@ from ....cell.code_edit.cell_code_edit import CellCodeEdit
 from ....code.py_source_mgr import PyInstance
 from ....const import DISPATCH_SEL_RNG
 from ....multi_process.process_mgr import ProcessMgr
+from ....multi_process.request_tracker import PendingRequest, RequestTracker
 from ....multi_process.socket_manager import SocketManager
 from ....res.res_resolver import ResResolver
+from ....utils.singleton_base import SingletonBase
 from ....code import py_module
 from ....const.event_const import GBL_DOC_CLOSING
 from ....config.dialog.wv_code_cfg import WvCodeCfg
@@ -56,6 +55,10 @@ else:
     STARTUP_INFO = None
 
 _MANAGERS: Dict[str, PyCellEditProcessMgr] = {}
+_ABORTED_RESULT = {"status": "error", "message": "pass", "data": "aborted"}
+_TIMEOUT_RESULT = {"status": "error", "message": "pass", "data": "timeout"}
+# editor processes connect to a socket at a fixed path on unix, only one process is started at a time.
+_START_LOCK = threading.Lock()
 
 
 class PyCellCodeEdit(CellCodeEdit):
@@ -68,7 +71,6 @@ class PyCellCodeEdit(CellCodeEdit):
             self.log.debug(f"Editing code for cell: {self.cell}")
             py_inst = PyInstance(self.cell.calc_doc)  # singleton
             py_inst.update_source(code=self.src_code, cell=self.cell.cell_obj)
-            py_inst.update_all()
             return True
         except Exception:
             self.log.exception(f"Error editing code for cell: {self.cell.cell_obj}")
@@ -82,14 +84,18 @@ class PyCellEditProcessMgr(ProcessMgr):
     """
 
     @override
-    def __init__(self, *, socket_manager: SocketManager, sheet: str, cell: str) -> None:
+    def __init__(
+        self, *, socket_manager: SocketManager, sheet: str = "", cell: str = "", doc: CalcDoc | None = None
+    ) -> None:
         """
         Initializes the Editor instance.
 
         Args:
             socket_manager (SocketManager): Manager for handling socket connections.
-            sheet (str): The name of the sheet to edit.
-            cell (str): The name of the cell to edit.
+            sheet (str, optional): The name of the sheet to edit.
+            cell (str, optional): The name of the cell to edit.
+                When sheet and cell are omitted the editor is idle until ``set_target()`` is called.
+            doc (CalcDoc, optional): Document to edit. Defaults to the current document.
 
         Attributes:
             log (OxtLogger): Logger instance for logging purposes.
@@ -99,23 +105,57 @@ class PyCellEditProcessMgr(ProcessMgr):
             _term_events (TerminateEvents): Instance to handle termination events.
         """
         super().__init__(socket_manager)
-        self.sheet = sheet
-        self.cell = cell
-        self.doc = CalcDoc.from_current_doc()
-        self.cache_key = f"doc_{self.doc.runtime_uid}_sheet_{self.sheet}_cell_{self.cell}"
+        self.doc = CalcDoc.from_current_doc() if doc is None else doc
         self.py_instance = PyInstance(self.doc)
-        self.log.debug(f"Sheet: {self.sheet}, Cell: {self.cell}")
-        calc_sheet = self.doc.sheets[sheet]
-        self.calc_cell = calc_sheet[cell]
+        self.sheet = ""
+        self.cell = ""
+        self.cache_key = ""
+        self.calc_cell = cast(CalcCell, None)
         self._res = ResResolver()
         self._gbl_cache = GTC()
         self._calc_theme = ThemeCalc()
         self._fn_on_menu_insert_lp_fn = self._on_menu_insert_lp_fn
         self._fn_on_menu_range_select_result = self._on_menu_range_select_result
         self._active_process = ""
+        self._process_id = ""
         self._pkg_info = PkgInfo()
         self._config = Config()
-        self._current_client_msg: Any = None
+        # actions such as insert_range that complete when the user has selected a range.
+        self._requests = RequestTracker(self._on_request_done, timeout=30.0)
+        # set when the editor has a cell to edit, an idle editor process waits for it in get_info.
+        self._target_event = threading.Event()
+        if sheet and cell:
+            self.set_target(sheet, cell)
+
+    def set_target(self, sheet: str, cell: str) -> None:
+        """
+        Sets the cell to edit.
+
+        An idle editor process is waiting for its ``get_info`` response,
+        the response is sent as soon as the target is set and the editor window is shown for the cell.
+
+        Args:
+            sheet (str): The name of the sheet to edit.
+            cell (str): The name of the cell to edit.
+        """
+        self.sheet = sheet
+        self.cell = cell
+        self.cache_key = f"doc_{self.doc.runtime_uid}_sheet_{self.sheet}_cell_{self.cell}"
+        self.calc_cell = self.doc.sheets[sheet][cell]
+        self.log.debug(f"Sheet: {self.sheet}, Cell: {self.cell}")
+        self._target_event.set()
+
+    @override
+    def start_subprocess(self) -> str:
+        with _START_LOCK:
+            self._process_id = super().start_subprocess()
+        return self._process_id
+
+    def close_idle(self) -> None:
+        """Terminates the editor process and releases a ``get_info`` request that is waiting for a target."""
+        self.terminate_all_subprocesses()
+        self.terminate_server()
+        self._target_event.set()
 
     @override
     def get_script_path(self) -> str:
@@ -171,16 +211,14 @@ class PyCellEditProcessMgr(ProcessMgr):
 
         try:
             while True:
-                raw_msg_len = self.socket_manager.receive_all(length=4, process_id=process_id)
-                if not raw_msg_len:
+                # the results of pending actions are sent while waiting, they must be sent on this thread.
+                if not self.socket_manager.wait_readable(process_id):
+                    self.log.debug("No socket for process")
                     break
-                msg_len = struct.unpack("!I", raw_msg_len)[0]
-                byte_data = self.socket_manager.receive_all(length=msg_len, process_id=process_id)
-                if not byte_data:
+                json_dict = self.socket_manager.receive_message(process_id=process_id)
+                if json_dict is None:
                     self.log.debug("No data received")
                     break
-                message = byte_data.decode(encoding="utf-8")
-                json_dict = cast(Dict[str, Any], json.loads(message))
                 msg_cmd = json_dict.get("cmd")
                 last_cmd = msg_cmd
 
@@ -248,16 +286,11 @@ class PyCellEditProcessMgr(ProcessMgr):
                     params = json_dict.get("params", {})
                     self.log.debug(f"Received request for action '{action}' with params: {params}")
                     # Perform the requested action
-                    result = self.perform_action(action, params)
-                    msg = result.get("message", "")
-                    if msg == "pass":
-                        self.log.debug(f"Action '{action}' passed")
-                    else:
-                        # Send the result back to the client
-                        self.socket_manager.send_message(
-                            {"cmd": "action_completed", "response_data": result},
-                            process_id,
-                        )
+                    msg_id = str(json_dict.get("msg_id", "") or "")
+                    result = self.perform_action(action, params, msg_id)
+                    # the result of a pending request is sent by _on_request_done() when the request completes.
+                    if not isinstance(result, PendingRequest):
+                        self._send_action_result(process_id, action, result, msg_id)
                 elif msg_cmd == "logs":
                     self.log.debug("Received logs from client")
                     log_data: Dict[str, Dict[str, str]] = json_dict.get("data", {})
@@ -276,25 +309,37 @@ class PyCellEditProcessMgr(ProcessMgr):
             pass
         except Exception as e:
             self.log.exception(f"Error handling client: {e}")
+        # nobody is left to receive the results of pending actions.
+        self._requests.cancel_all(_ABORTED_RESULT)
 
         if last_cmd == "exit":
             PyCellEditProcessMgr.terminate_instance(self.cache_key)
         # finally:
         #     self.socket_manager.close_socket(process_id)
 
-    def perform_action(self, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def perform_action(
+        self, action: str, params: Dict[str, Any], msg_id: str = ""
+    ) -> Dict[str, Any] | PendingRequest:
         """
         Performs the requested action and returns the result.
 
         Args:
             action (str): The action to be performed.
             params (Dict[str, Any]): The parameters for the action.
+            msg_id (str, optional): Id the client sent with the request, returned with the response.
 
         Returns:
-            Any: The result of the action.
+            Dict[str, Any], PendingRequest: The result of the action or a pending request
+            for actions that complete later, such as when the user selects a range.
         """
 
         if action == "get_info":
+            if not self._target_event.is_set():
+                # the client waits for this response without a timeout, see EditorPool.
+                self.log.debug("Editor process is idle. Waiting for a cell to edit.")
+                self._target_event.wait()
+            if not self.cell:
+                return {"status": "error", "message": "Editor closed before a cell was selected"}
 
             def get_log_config() -> Dict[str, str]:
                 log_config = LoggerConfig()
@@ -361,93 +406,41 @@ class PyCellEditProcessMgr(ProcessMgr):
                 return {"status": "success", "message": "validated_code"}
             return {"status": "error", "message": "validated_code"}
         elif action == "insert_lp_function":
-            # It is important to set the current client message to None and then monitor the value in a thread.
-            # If not monitored in a thread and _on_menu_insert_lp_fn called self.socket_manager.send_message instead,
-            # the message will be sent to the client but the client will not be able to send and receive any other messages.
-            # This issue is likely because _on_menu_insert_lp_fn is called from a different thread.
-            # By monitoring the value in a thread, the result is returned on the same thread and the client can continue to send and receive messages.
-            self._current_client_msg = None
+            # completed by _on_menu_insert_lp_fn() when the user has selected a range.
+            request = self._requests.create(action, msg_id=msg_id, timeout_result=_TIMEOUT_RESULT)
             self._write_auto_fn_sel()
-
-            def monitor_client_msg(result_queue: queue.Queue) -> None:
-                timeout = 30
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    if self._current_client_msg:
-                        if self._current_client_msg == "aborted":
-                            result_queue.put(
-                                {
-                                    "status": "error",
-                                    "message": "pass",
-                                    "data": "aborted",
-                                }
-                            )
-                            return
-                        result_queue.put(self._current_client_msg)
-                        return
-                    time.sleep(0.1)
-                result_queue.put({"status": "error", "message": "pass", "data": "timeout"})
-
-            # Create a queue to store the result
-            result_queue = queue.Queue()
-            # Start the monitor_client_msg function in a separate thread
-            monitor_thread = threading.Thread(target=monitor_client_msg, args=(result_queue,), daemon=True)
-            monitor_thread.start()
-
-            # Wait for the thread to complete
-            monitor_thread.join()
-
-            # Retrieve the result from the queue
-            result = result_queue.get()
-            self.log.debug(f"Monitor client message result: {result}")
-
-            return result
+            return request
         elif action == "insert_range":
-            # It is important to set the current client message to None and then monitor the value in a thread.
-            # If not monitored in a thread and _on_menu_insert_lp_fn called self.socket_manager.send_message instead,
-            # the message will be sent to the client but the client will not be able to send and receive any other messages.
-            # This issue is likely because _on_menu_insert_lp_fn is called from a different thread.
-            # By monitoring the value in a thread, the result is returned on the same thread and the client can continue to send and receive messages.
-            self._current_client_msg = None
+            # completed by _on_menu_range_select_result() when the user has selected a range.
+            request = self._requests.create(action, msg_id=msg_id, timeout_result=_TIMEOUT_RESULT)
             self._write_range_sel()
-
-            def monitor_client_msg(result_queue: queue.Queue) -> None:
-                timeout = 30
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    if self._current_client_msg:
-                        if self._current_client_msg == "aborted":
-                            result_queue.put(
-                                {
-                                    "status": "error",
-                                    "message": "pass",
-                                    "data": "aborted",
-                                }
-                            )
-                            return
-                        result_queue.put(self._current_client_msg)
-                        return
-                    time.sleep(0.1)
-                result_queue.put({"status": "error", "message": "pass", "data": "timeout"})
-
-            # Create a queue to store the result
-            result_queue = queue.Queue()
-            # Start the monitor_client_msg function in a separate thread
-            monitor_thread = threading.Thread(target=monitor_client_msg, args=(result_queue,), daemon=True)
-            monitor_thread.start()
-
-            # Wait for the thread to complete
-            monitor_thread.join()
-
-            # Retrieve the result from the queue
-            result = result_queue.get()
-            self.log.debug("Monitor client message result: %s", result)
-
-            return result
+            return request
 
         else:
             return {"status": "error", "message": f"Unknown action '{action}'"}
 
+    def _get_action_message(self, action: str, result: Dict[str, Any], msg_id: str = "") -> Dict[str, Any] | None:
+        """Gets the message for the result of an action, ``None`` for results with the message ``pass``."""
+        if result.get("message", "") == "pass":
+            self.log.debug(f"Action '{action}' passed")
+            return None
+        message: Dict[str, Any] = {"cmd": "action_completed", "response_data": result}
+        if msg_id:
+            message["msg_id"] = msg_id
+        return message
+
+    def _send_action_result(self, process_id: str, action: str, result: Dict[str, Any], msg_id: str = "") -> None:
+        """Sends the result of an action to the client, results with the message ``pass`` are not sent."""
+        message = self._get_action_message(action, result, msg_id)
+        if message is not None:
+            self.socket_manager.send_message(message, process_id)
+
+    def _on_request_done(self, request: PendingRequest) -> None:
+        # called on the thread that completed the request, the message is sent by the client handler thread.
+        message = self._get_action_message(request.action, request.result, request.msg_id)
+        if message is not None:
+            self.socket_manager.post_message(message, self._active_process)
+
     # region Source Code
     def _get_source_code(self) -> str:
         try:
@@ -475,7 +468,7 @@ class PyCellEditProcessMgr(ProcessMgr):
                 exc_info=True,
             )
         if event.event_data.state != "done":
-            self._current_client_msg = "aborted"
+            self._requests.resolve_action("insert_lp_function", _ABORTED_RESULT)
             log.debug("on_sel _on_menu_insert_lp_fn aborted")
             return
         log.debug(f"_on_menu_insert_lp_fn {event.event_data.rng_obj}")
@@ -491,18 +484,22 @@ class PyCellEditProcessMgr(ProcessMgr):
             fn_str = af.generate_fn()
             if not fn_str:
                 self.log.error("_on_menu_insert_lp_fn() Error generating function string")
-                self._current_client_msg = "aborted"
+                self._requests.resolve_action("insert_lp_function", _ABORTED_RESULT)
                 return
 
-            self._current_client_msg = {
-                "status": "success",
-                "message": "lp_fn_inserted",
-                "data": {"function": fn_str},
-            }
+            self._requests.resolve_action(
+                "insert_lp_function",
+                {
+                    "status": "success",
+                    "message": "lp_fn_inserted",
+                    "data": {"function": fn_str},
+                },
+            )
 
             return
         except Exception:
             log.error("_on_menu_insert_lp_fn", exc_info=True)
+            self._requests.resolve_action("insert_lp_function", _ABORTED_RESULT)
 
     def _write_auto_fn_sel(self) -> None:
         self.log.debug("_write_auto_fn_sel() Write Range Selection Popup")
@@ -537,6 +534,7 @@ class PyCellEditProcessMgr(ProcessMgr):
                     exc_info=True,
                 )
             if event.event_data.state != "done":
+                self._requests.resolve_action("insert_range", _ABORTED_RESULT)
                 log.debug("on_sel _on_menu_range_select_result aborted")
                 return
             log.debug(f"_on_menu_range_select_result {event.event_data.rng_obj}")
@@ -546,35 +544,21 @@ class PyCellEditProcessMgr(ProcessMgr):
 
                     self.log.debug(f"_on_menu_range_select_result() Range Selection: {range_obj.to_string(True)}")
 
-                    if range_obj.sheet_idx == self.calc_cell.cell_obj.sheet_idx:
-                        if range_obj.is_single_cell():
-                            self._current_client_msg = {
-                                "status": "success",
-                                "message": "lp_rng_inserted",
-                                "data": {"range": str(range_obj.cell_start)},
-                            }
-                        else:
-                            self._current_client_msg = {
-                                "status": "success",
-                                "message": "lp_rng_inserted",
-                                "data": {"range": str(range_obj)},
-                            }
-                    else:
-                        if range_obj.is_single_cell():
-                            self._current_client_msg = {
-                                "status": "success",
-                                "message": "lp_rng_inserted",
-                                "data": {"range": range_obj.cell_start.to_string(True)},
-                            }
-                        else:
-                            self._current_client_msg = {
-                                "status": "success",
-                                "message": "lp_rng_inserted",
-                                "data": {"range": range_obj.to_string(True)},
-                            }
+                    # a range on another sheet includes the sheet name.
+                    same_sheet = range_obj.sheet_idx == self.calc_cell.cell_obj.sheet_idx
+                    rng_obj = range_obj.cell_start if range_obj.is_single_cell() else range_obj
+                    rng = str(rng_obj) if same_sheet else rng_obj.to_string(True)
+                    self._requests.resolve_action(
+                        "insert_range",
+                        {
+                            "status": "success",
+                            "message": "lp_rng_inserted",
+                            "data": {"range": rng},
+                        },
+                    )
                 except Exception:
                     log.exception("Error writing range selection using default.")
-                    self._current_client_msg = "aborted"
+                    self._requests.resolve_action("insert_range", _ABORTED_RESULT)
 
             except Exception:
                 log.error("_on_menu_range_select_result", exc_info=True)
@@ -604,6 +588,112 @@ class PyCellEditProcessMgr(ProcessMgr):
             inst.terminate_server()
             del _MANAGERS[key]
 
+    # region Properties
+    @property
+    def is_idle(self) -> bool:
+        """Gets if the editor is waiting for a cell to edit."""
+        return not self._target_event.is_set()
+
+    @property
+    def is_alive(self) -> bool:
+        """Gets if the editor process is running."""
+        if not self._process_id:
+            return False
+        process = self.get_process(self._process_id)
+        return process is not None and process.poll() is None
+
+    # endregion Properties
+
+
+class EditorPool(SingletonBase):
+    """
+    Idle editor processes of a document.
+
+    Starting an editor process takes several seconds, most of it is loading the webview.
+    Once the editor has been opened for a document, idle processes are started in the background.
+    An idle process connects and waits for its ``get_info`` response.
+    When the editor is opened an idle process is handed the cell to edit and shows its window right away.
+    If no idle process is ready yet, the editor is started as a new process and nothing waits for the pool.
+
+    The editor client must wait for the ``get_info`` response without a timeout,
+    an idle process may wait for as long as the document is open before it gets a cell to edit.
+    """
+
+    MAX_IDLE = 1
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._idle: List[PyCellEditProcessMgr] = []
+        self._starting = 0
+        self._is_closed = False
+        self._is_init = True
+
+    def acquire(self, sheet: str, cell: str) -> PyCellEditProcessMgr | None:
+        """
+        Gets an idle editor and sets the cell it edits.
+
+        Never waits for an idle process that is still starting.
+
+        Args:
+            sheet (str): The name of the sheet to edit.
+            cell (str): The name of the cell to edit.
+
+        Returns:
+            PyCellEditProcessMgr, None: Editor or ``None`` if there is no idle editor ready.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                mgr = self._idle.pop(0)
+            if mgr.is_alive:
+                mgr.set_target(sheet, cell)
+                return mgr
+            self._log.debug("acquire() Idle editor process has exited. Discarding.")
+            mgr.close_idle()
+
+    def fill(self) -> None:
+        """Starts idle editor processes in the background up to ``MAX_IDLE``."""
+        with self._lock:
+            if self._is_closed:
+                return
+            count = EditorPool.MAX_IDLE - len(self._idle) - self._starting
+            if count <= 0:
+                return
+            self._starting += count
+        for _ in range(count):
+            mgr = PyCellEditProcessMgr(socket_manager=SocketManager(), doc=self._doc)
+            threading.Thread(target=self._start, args=(mgr,), daemon=True).start()
+
+    def _start(self, mgr: PyCellEditProcessMgr) -> None:
+        is_started = False
+        try:
+            is_started = bool(mgr.start_subprocess()) and mgr.is_alive
+        except Exception:
+            self._log.exception("_start() Error starting idle editor process")
+        with self._lock:
+            self._starting -= 1
+            is_added = is_started and not self._is_closed
+            if is_added:
+                self._idle.append(mgr)
+        if is_added:
+            self._log.debug("_start() Idle editor process ready.")
+        else:
+            mgr.close_idle()
+
+    def close(self) -> None:
+        """Terminates all idle editor processes."""
+        with self._lock:
+            self._is_closed = True
+            idle = self._idle
+            self._idle = []
+        for mgr in idle:
+            mgr.close_idle()
+
 
 def main(sheet: str, cell: str) -> None:
     """
@@ -626,6 +716,14 @@ def main(sheet: str, cell: str) -> None:
     """
     global _MANAGERS
     log = OxtLogger(log_name="shell_edit")
+    pool = EditorPool(CalcDoc.from_current_doc())
+    process_manager = pool.acquire(sheet=sheet, cell=cell)
+    if process_manager is not None:
+        log.debug("Using idle editor process.")
+        _MANAGERS[process_manager.cache_key] = process_manager
+        pool.fill()
+        return
+
     socket_manager = SocketManager()
     process_manager = PyCellEditProcessMgr(socket_manager=socket_manager, sheet=sheet, cell=cell)
     _MANAGERS[process_manager.cache_key] = process_manager
@@ -635,6 +733,8 @@ def main(sheet: str, cell: str) -> None:
         log.debug(f"Subprocess ID: {subprocess_id}")
     else:
         log.error("Failed to start subprocess")
+    # the next time the editor is opened an idle process is used.
+    pool.fill()
 
 
 def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
@@ -654,5 +754,11 @@ def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
         if remove_key in _MANAGERS:
             del _MANAGERS[remove_key]
 
+    pool_key = f"{uid}_uid_{EditorPool.__name__}"
+    pool = EditorPool._instances.get(pool_key, None)
+    if pool is not None:
+        pool.close()
+        EditorPool.remove_instance(pool_key)
+
 
 LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
@@ -190,7 +190,6 @@ class DispatchEditPyCell(XDispatch, EventsPartial, unohelper.Base):
                         self._log.debug("Code has changed, updating ...")
                         py_inst.update_source(code=txt, cell=cell_obj)
                         self._log.debug(f"Cell Code updated for {cell_obj}")
-                        py_inst.update_all()
                         self._log.debug("Code updated")
                         result = True
                     except Exception as e:
@@ -219,7 +219,6 @@ def edit_code(
     py_inst = PyInstance(calc_cell.calc_doc)  # singleton
     if src_code:
         py_inst.update_source(code=src_code, cell=cell_obj)
-        py_inst.update_all()
         return True
 
     ctx = Lo.get_context()
@@ -247,7 +246,6 @@ def edit_code(
                     log.debug("Code has changed, updating ...")
                     py_inst.update_source(code=txt, cell=cell_obj)
                     log.debug(f"Cell Code updated for {cell_obj}")
-                    py_inst.update_all()
                     log.debug("Code updated")
                 result = True
             except Exception as e:
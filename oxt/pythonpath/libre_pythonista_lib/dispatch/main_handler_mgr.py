@@ -20,6 +20,8 @@ from ..const import (
     PATH_PIP_PKG_UNLINK,
     PATH_PYC_FORMULA,
     PATH_PYC_FORMULA_DEP,
+    PATH_PY_EXEC_CANCEL,
+    PATH_PY_REBUILD,
 )
 
 from ..const.event_const import LP_DISPATCHED_CMD, LP_DISPATCHING_CMD
@@ -167,6 +169,56 @@ class MainHandlerMgr:
                 log.exception("Dispatch Error: %s", URL.Main)
                 return None
 
+        elif URL.Path == PATH_PY_REBUILD:
+            try:
+                from .dispatch_py_rebuild import DispatchPyRebuild
+            except ImportError:
+                log.exception("DispatchPyRebuild import error")
+                raise
+            try:
+                cargs = CancelEventArgs(self)
+                cargs.event_data = DotDict(cmd=PATH_PY_REBUILD, doc=doc)
+                se.trigger_event(LP_DISPATCHING_CMD, cargs)
+                if cargs.cancel is True and cargs.handled is False:
+                    return None
+
+                with log.indent(True):
+                    log.debug("DispatchProviderInterceptor.queryDispatch: returning DispatchPyRebuild")
+
+                result = DispatchPyRebuild(ctx=self.ctx)
+                eargs = EventArgs.from_args(cargs)
+                eargs.event_data.dispatch = result
+                se.trigger_event(LP_DISPATCHED_CMD, eargs)
+                return result
+            except Exception:
+                log.exception("Dispatch Error: %s", URL.Main)
+                return None
+
+        elif URL.Path == PATH_PY_EXEC_CANCEL:
+            try:
+                from .dispatch_py_exec_cancel import DispatchPyExecCancel
+            except ImportError:
+                log.exception("DispatchPyExecCancel import error")
+                raise
+            try:
+                cargs = CancelEventArgs(self)
+                cargs.event_data = DotDict(cmd=PATH_PY_EXEC_CANCEL, doc=doc)
+                se.trigger_event(LP_DISPATCHING_CMD, cargs)
+                if cargs.cancel is True and cargs.handled is False:
+                    return None
+
+                with log.indent(True):
+                    log.debug("DispatchProviderInterceptor.queryDispatch: returning DispatchPyExecCancel")
+
+                result = DispatchPyExecCancel(ctx=self.ctx)
+                eargs = EventArgs.from_args(cargs)
+                eargs.event_data.dispatch = result
+                se.trigger_event(LP_DISPATCHED_CMD, eargs)
+                return result
+            except Exception:
+                log.exception("Dispatch Error: %s", URL.Main)
+                return None
+
         elif URL.Path == PATH_PIP_PKG_INSTALLED:
             try:
                 from .dispatch_py_pkg_installed import DispatchPyPkgInstalled
@@ -324,7 +324,8 @@ class CalcDocMgr(SingletonBase):
             _ = SheetMgr(self._doc)  # init the singleton
 
             cm = CellMgr(self._doc)
-            cm.reset_py_inst()
+            # unchanged cells get the results stored when the document was saved.
+            cm.reset_py_inst(use_stored=True)
             cm.add_all_listeners()
             self._doc.component.calculateAll()
             eargs = EventArgs(object())
@@ -240,6 +240,54 @@ class CalcProps(CustomPropsBase):
     def include_extra_err_info(self, value: bool) -> None:
         self.set_custom_property("include_extra_err_info", value)
 
+    @property
+    def store_results(self) -> bool:
+        """
+        Gets/Sets if the results of the code cells are stored when the document is saved.
+
+        When the document is opened cells with unchanged code and inputs get their stored result instead of being executed.
+        """
+        return self.get_custom_property("store_results", False)
+
+    @store_results.setter
+    def store_results(self, value: bool) -> None:
+        self.set_custom_property("store_results", value)
+
+    @property
+    def profile_memory(self) -> bool:
+        """
+        Gets/Sets if the peak memory of each code cell execution is recorded by the cell profiler.
+
+        Tracing memory slows down the execution of all Python code.
+        """
+        return self.get_custom_property("profile_memory", False)
+
+    @profile_memory.setter
+    def profile_memory(self, value: bool) -> None:
+        self.set_custom_property("profile_memory", value)
+
+    @property
+    def plot_format(self) -> str:
+        """
+        Gets/Sets the image format of matplotlib figures, ``svg`` or ``png``.
+
+        ``png`` renders dense plots much faster in Calc, ``svg`` scales without loss.
+        """
+        return self.get_custom_property("plot_format", "svg")
+
+    @plot_format.setter
+    def plot_format(self, value: str) -> None:
+        self.set_custom_property("plot_format", value)
+
+    @property
+    def plot_dpi(self) -> int:
+        """Gets/Sets the resolution of matplotlib figures in ``png`` format."""
+        return self.get_custom_property("plot_dpi", 100)
+
+    @plot_dpi.setter
+    def plot_dpi(self, value: int) -> None:
+        self.set_custom_property("plot_dpi", value)
+
     @property
     @override
     def doc(self) -> CalcDoc:
@@ -6,6 +6,8 @@ from ooodev.utils.gen_util import NULL_OBJ
 from ooodev.utils.helper.dot_dict import DotDict
 from ooodev.io.json.doc_json_file import DocJsonFile
 
+from .props_store import PropsStore
+
 
 if TYPE_CHECKING:
     from ooodev.proto.office_document_t import OfficeDocumentT
@@ -23,6 +25,9 @@ class CustomPropsBase:
 
     Allows custom properties to be added to a document.
 
+    The properties are read from and set in a ``PropsStore`` shared by all instances for the document,
+    the json file is written behind, see ``flush_properties()``.
+
     Note:
         Any value that can be serialized to JSON can be stored as a custom property.
         Classes can implement the :py:class:`ooodev.io.json.json_encoder.JsonEncoder` class to provide custom serialization by overriding the ``on_json_encode()`` method.
@@ -61,7 +66,7 @@ class CustomPropsBase:
         if self._is_props_init:
             self.log.debug("_init_props() Properties Already Initialized")
             return
-        self._props = self._get_custom_properties()
+        self._props = self._store.get_data(self._name, self._get_custom_properties)
         # self._ensure_doc_json_file()
         self._is_props_init = True
         self.log.debug("_init_props() Properties Initialized")
@@ -187,10 +192,7 @@ class CustomPropsBase:
         self._init_props()
         with self.log.indent(True):
             try:
-                props = self._props.copy()
-                props[name] = value
-                self._save_properties(props)
-                self._props = props
+                self._store.update(self._name, {name: value}, self._save_properties)
                 self.log.debug(f"Property '{name}' set.")
             except Exception:
                 self.log.error(f"Error setting property '{name}'", exc_info=True)
@@ -224,10 +226,7 @@ class CustomPropsBase:
         """
         self._init_props()
         with contextlib.suppress(Exception):
-            props = self._props.copy()
-            props.update(properties.copy_dict())
-            self._save_properties(props)
-            self._props = props
+            self._store.update(self._name, properties.copy_dict(), self._save_properties)
 
     def remove_custom_property(self, name: str) -> None:
         """
@@ -245,11 +244,8 @@ class CustomPropsBase:
         self._init_props()
         with self.log.indent(True):
             try:
-                props = self._props.copy()
-                if name in props:
-                    del props[name]
-                    self._save_properties(props)
-                    self._props = props
+                if name in self._props:
+                    self._store.remove(self._name, name, self._save_properties)
                     self.log.debug(f"Property '{name}' removed.")
             except Exception:
                 self.log.error(f"Error removing property '{name}'", exc_info=True)
@@ -267,8 +263,20 @@ class CustomPropsBase:
         self._init_props()
         return name in self._props
 
+    def flush_properties(self) -> None:
+        """
+        Writes the properties that have been set to the document.
+
+        Properties are otherwise written when no property has been set for a moment or when the document is saving.
+        """
+        self._store.flush()
+
     # region Properties
 
+    @property
+    def _store(self) -> PropsStore:
+        return PropsStore(self._doc)
+
     @property
     def log(self) -> OxtLogger:
         """Class Logger"""
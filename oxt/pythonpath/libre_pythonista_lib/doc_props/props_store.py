@@ -0,0 +1,186 @@
+"""
+Custom property files of a document, kept in memory and written behind.
+
+``CustomPropsBase`` stores its properties in a JSON file embedded in the document. Each set rewrote the whole file
+and each new instance read and parsed the file again, a settings dialog or a burst of ``CalcProps`` updates wrote the
+document storage once per property.
+
+The store reads a file once per document and serves all instances from memory. A set only marks the file as dirty,
+dirty files are written once when no property has been set for ``FLUSH_DELAY`` seconds,
+when the document is saving or closing, or when ``flush()`` is called. ``write_count`` is the number of files written.
+Files are written on the main thread, the delayed write is posted to it.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Mapping, TYPE_CHECKING
+import threading
+
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.lo_events import LoEvents
+
+from ..const.event_const import DOCUMENT_SAVING, GBL_DOC_CLOSING
+from ..event.shared_event import SharedEvent
+from ..utils.main_thread import post_to_main
+from ..utils.singleton_base import SingletonBase
+
+if TYPE_CHECKING:
+    from ooodev.proto.office_document_t import OfficeDocumentT
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+FLUSH_DELAY = 1.0
+"""Seconds without a set before dirty files are written."""
+
+
+class _PropsFile:
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+        self.writer: Callable[[Dict[str, Any]], None] | None = None
+        self.dirty = False
+
+
+class PropsStore(SingletonBase):
+    """Custom property files of a document, kept in memory and written behind."""
+
+    def __new__(cls, doc: OfficeDocumentT) -> PropsStore:
+        # keyed by the document of the properties, it may not be the current document when it is saving.
+        return super().__new__(cls, single_key=f"{doc.runtime_uid}_uid_{cls.__name__}")
+
+    def __init__(self, doc: OfficeDocumentT) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        self._doc = doc
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.RLock()
+        self._files: Dict[str, _PropsFile] = {}
+        self._timer: threading.Timer | None = None
+        self._write_count = 0
+        self._fn_on_document_saving = self._on_document_saving
+        try:
+            SharedEvent(doc).subscribe_event(DOCUMENT_SAVING, self._fn_on_document_saving)
+        except Exception:
+            self._log.exception("Error subscribing to document saving. Properties are written on idle.")
+        self._is_init = True
+
+    def _on_document_saving(self, src: Any, event: EventArgs) -> None:  # noqa: ANN401
+        self.flush()
+
+    def get_data(self, name: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Gets the properties of a file.
+
+        Args:
+            name (str): File name.
+            loader (Callable[[], Dict[str, Any]]): Reads the properties from the document the first time they are used.
+
+        Returns:
+            Dict[str, Any]: Properties. The dictionary is shared, it must only be changed through the store.
+        """
+        with self._lock:
+            props_file = self._files.get(name, None)
+            if props_file is None:
+                props_file = _PropsFile(loader())
+                self._files[name] = props_file
+                self._log.debug("get_data() Read properties of file %s", name)
+            return props_file.data
+
+    def update(self, name: str, props: Mapping[str, Any], writer: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Sets properties of a file. The file is written later if a value differs from the current value.
+
+        Args:
+            name (str): File name. ``get_data()`` must have been called for the file.
+            props (Mapping[str, Any]): Property names and values.
+            writer (Callable[[Dict[str, Any]], None]): Writes the properties to the document.
+        """
+        with self._lock:
+            props_file = self._files[name]
+            data = props_file.data
+            changed = {key: value for key, value in props.items() if key not in data or data[key] != value}
+            if not changed:
+                return
+            data.update(changed)
+            self._mark_dirty(props_file, writer)
+
+    def remove(self, name: str, key: str, writer: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Removes a property of a file. The file is written later if it has the property.
+
+        Args:
+            name (str): File name. ``get_data()`` must have been called for the file.
+            key (str): Property name.
+            writer (Callable[[Dict[str, Any]], None]): Writes the properties to the document.
+        """
+        with self._lock:
+            props_file = self._files[name]
+            if key not in props_file.data:
+                return
+            del props_file.data[key]
+            self._mark_dirty(props_file, writer)
+
+    def _mark_dirty(self, props_file: _PropsFile, writer: Callable[[Dict[str, Any]], None]) -> None:
+        props_file.writer = writer
+        props_file.dirty = True
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(FLUSH_DELAY, self._post_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _post_flush(self) -> None:
+        # runs on the timer thread, the document is written on the main thread.
+        try:
+            post_to_main(self.flush)
+        except Exception:
+            self._log.exception("_post_flush() Error posting write of properties.")
+
+    def flush(self) -> None:
+        """Writes the files with properties that have been set since they were last written."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dirty = []
+            for name, props_file in self._files.items():
+                if props_file.dirty and props_file.writer is not None:
+                    dirty.append((name, props_file.writer, props_file.data.copy()))
+                    props_file.dirty = False
+        for name, writer, data in dirty:
+            try:
+                writer(data)
+                self._write_count += 1
+                self._log.debug("flush() Wrote properties of file %s", name)
+            except Exception:
+                self._log.exception("flush() Error writing properties of file %s", name)
+
+    def cancel(self) -> None:
+        """Stops the pending write without writing."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    @property
+    def is_dirty(self) -> bool:
+        """Gets if a file has properties that have not been written."""
+        with self._lock:
+            return any(props_file.dirty for props_file in self._files.values())
+
+    @property
+    def write_count(self) -> int:
+        """Gets the number of files written by the store."""
+        return self._write_count
+
+
+def _on_doc_closing(src: Any, event: EventArgs) -> None:  # noqa: ANN401
+    uid = str(event.event_data.uid)
+    key = f"{uid}_uid_{PropsStore.__name__}"
+    inst = PropsStore._instances.get(key, None)
+    if inst is not None:
+        # properties set just before closing are written, the user is asked to save the document.
+        inst.flush()
+        PropsStore.remove_instance(key)
+
+
+LoEvents().on(GBL_DOC_CLOSING, _on_doc_closing)
@@ -2,13 +2,13 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Set, TYPE_CHECKING
 
-from ooodev.loader import Lo
 from ooodev.events.partial.events_partial import EventsPartial
 from ooodev.events.lo_events import LoEvents
 from ooodev.events.args.event_args import EventArgs
 from ooodev.utils.helper.dot_dict import DotDict
 
 from ..ex import RuntimeUidError
+from ..utils.thread_doc import get_current_doc
 
 if TYPE_CHECKING:
     from ooodev.proto.office_document_t import OfficeDocumentT
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
 class DocEventPartial(EventsPartial):
     def __init__(self, doc: OfficeDocumentT | None = None) -> None:
         if doc is None:
-            doc = Lo.current_doc
+            doc = get_current_doc()
         self.__runtime_uid = doc.runtime_uid
         self.__omit_events: Set[str] = set()
         EventsPartial.__init__(self)
@@ -31,7 +31,7 @@ class DocEventPartial(EventsPartial):
         LoEvents().trigger("LibrePythonistaDocEventPartialCheckUid", eargs)
         if eargs.event_data.doc_uid:
             return eargs.event_data.doc_uid == self.__runtime_uid
-        return Lo.current_doc.runtime_uid == self.__runtime_uid
+        return get_current_doc().runtime_uid == self.__runtime_uid
 
     # region EventsPartial Overrides
     def add_event_observers(self, *args: EventObserver) -> None:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from typing import Dict, TYPE_CHECKING
-from ooodev.loader import Lo
 from .callback_holder import CallbackHolder
 from ..utils.singleton_base import SingletonBase
 from ..ex import RuntimeUidError
+from ..utils.thread_doc import get_current_doc
 
 if TYPE_CHECKING:
     # just for design time
@@ -57,11 +57,12 @@ class SharedCb(SingletonBase):
     def _check_runtime_uid(self) -> bool:
         with self._log.indent(True):
             try:
-                if Lo.current_doc.runtime_uid == self.runtime_uid:
+                current_uid = get_current_doc().runtime_uid
+                if current_uid == self.runtime_uid:
                     return True
                 else:
                     self._log.error(
-                        f"Runtime UID mismatch. Current: {Lo.current_doc.runtime_uid}, SharedCb: {self.runtime_uid}"
+                        f"Runtime UID mismatch. Current: {current_uid}, SharedCb: {self.runtime_uid}"
                     )
                     return False
             except Exception:
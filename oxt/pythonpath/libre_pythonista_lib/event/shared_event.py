@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import Any, Dict, TYPE_CHECKING
 
-from ooodev.loader import Lo
 from ooodev.events.lo_events import LoEvents
 from ooodev.events.args.event_args import EventArgs
 from ooodev.events.lo_events import LoEvents
@@ -10,6 +9,7 @@ from ooodev.utils.helper.dot_dict import DotDict
 
 from ..const.event_const import GBL_DOC_CLOSING
 from ..ex.exceptions import SingletonKeyError
+from ..utils.thread_doc import get_current_doc
 from .doc_event_partial import DocEventPartial
 
 if TYPE_CHECKING:
@@ -28,7 +28,7 @@ class SharedEvent(DocEventPartial):
                 doc = eargs.event_data.doc
             if doc is None:
                 try:
-                    doc = Lo.current_doc
+                    doc = get_current_doc()
                 except Exception as e:
                     raise SingletonKeyError(
                         f"Error getting single key for class name: {cls.__name__}"
@@ -58,3 +58,14 @@ class SingletonKeyError(Exception):
     """Singleton Key Error."""
 
     pass
+
+
+class ExecCancelledError(BaseException):
+    """
+    Execution Cancelled Error.
+
+    Raised in the execution thread when a running execution is cancelled.
+    Derived from ``BaseException`` so it is not caught as an error of the cell code.
+    """
+
+    pass
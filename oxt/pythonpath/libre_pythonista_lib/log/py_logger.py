@@ -13,6 +13,7 @@ from ooodev.utils.helper.dot_dict import DotDict
 
 from ..const.event_const import LOG_PY_LOGGER_RESET, GBL_DOC_CLOSING
 from ..event.shared_event import SharedEvent
+from ..utils.thread_doc import get_current_doc
 
 
 from .event_log_handler import EventLogHandler
@@ -167,7 +168,7 @@ class PyLogger(Logger):
 
     def _is_doc_match(self) -> bool:
         try:
-            return self._uid == Lo.current_doc.runtime_uid
+            return self._uid == get_current_doc().runtime_uid
         except Exception as e:
             self._otx_log.error(f"_is_doc_match() Doc not available: {e}")
             return False
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+import threading
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+
+class PendingRequest:
+    """
+    A request from a client process that is completed later, such as when the user has selected a range.
+
+    Attributes:
+        request_id (str): Unique id of the request.
+        action (str): Action that was requested.
+        msg_id (str): Id the client sent with the request, if any.
+    """
+
+    def __init__(self, tracker: RequestTracker, action: str, msg_id: str = "") -> None:
+        self.request_id = str(uuid4())
+        self.action = action
+        self.msg_id = msg_id
+        self._tracker = tracker
+        self._is_done = False
+        self._result: Any = None
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def is_done(self) -> bool:
+        """Gets if the request is completed."""
+        return self._is_done
+
+    @property
+    def result(self) -> Any:  # noqa: ANN401
+        """Gets the result of the request. ``None`` until the request is completed."""
+        return self._result
+
+
+class RequestTracker:
+    """
+    Correlates requests from a client process with their results.
+
+    A request is created when the client asks for something that completes later.
+    The code that produces the result completes the request by id or by action, the tracker then calls ``on_done``.
+    Requests that are not completed within the timeout are completed with the timeout result.
+    Any number of requests can be in flight at once and no thread waits for them.
+    """
+
+    def __init__(self, on_done: Callable[[PendingRequest], None], timeout: float = 30.0) -> None:
+        """
+        Initializes the tracker.
+
+        Args:
+            on_done (Callable[[PendingRequest], None]): Called with each request when it is completed.
+                Called on the thread that completed the request, such as a UI thread or a timer thread,
+                so it must not block.
+            timeout (float, optional): Seconds before a request is completed with the timeout result. Defaults to ``30.0``.
+        """
+        self.log = OxtLogger(log_name=self.__class__.__name__)
+        self.lock = threading.Lock()
+        self.timeout = timeout
+        self._on_done = on_done
+        self._pending: Dict[str, PendingRequest] = {}
+
+    def create(self, action: str, msg_id: str = "", timeout_result: Any = None) -> PendingRequest:  # noqa: ANN401
+        """
+        Creates a pending request.
+
+        Args:
+            action (str): Action that was requested.
+            msg_id (str, optional): Id the client sent with the request. Defaults to ``""``.
+            timeout_result (Any, optional): Result of the request if it times out. Defaults to ``None``.
+
+        Returns:
+            PendingRequest: The request.
+        """
+        request = PendingRequest(self, action, msg_id)
+        if self.timeout > 0:
+            timer = threading.Timer(self.timeout, self.resolve, args=(request.request_id, timeout_result))
+            timer.daemon = True
+            request._timer = timer
+        with self.lock:
+            self._pending[request.request_id] = request
+        if request._timer is not None:
+            request._timer.start()
+        return request
+
+    def resolve(self, request_id: str, result: Any) -> bool:  # noqa: ANN401
+        """
+        Completes a request.
+
+        Args:
+            request_id (str): Id of the request.
+            result (Any): Result of the request.
+
+        Returns:
+            bool: ``True`` if the request was pending; Otherwise, ``False``.
+        """
+        with self.lock:
+            request = self._pending.pop(request_id, None)
+            if request is None:
+                return False
+            request._result = result
+            request._is_done = True
+        if request._timer is not None:
+            request._timer.cancel()
+        try:
+            self._on_done(request)
+        except Exception:
+            self.log.exception("resolve() Error completing request for action: %s", request.action)
+        return True
+
+    def resolve_action(self, action: str, result: Any) -> bool:  # noqa: ANN401
+        """
+        Completes the oldest pending request for an action.
+
+        Args:
+            action (str): Action of the request.
+            result (Any): Result of the request.
+
+        Returns:
+            bool: ``True`` if a request was pending; Otherwise, ``False``.
+        """
+        with self.lock:
+            request_id = next((r.request_id for r in self._pending.values() if r.action == action), "")
+        if not request_id:
+            self.log.debug("resolve_action() No pending request for action: %s", action)
+            return False
+        return self.resolve(request_id, result)
+
+    def cancel_all(self, result: Any = None) -> None:  # noqa: ANN401
+        """Completes all pending requests with the result."""
+        with self.lock:
+            request_ids = list(self._pending.keys())
+        for request_id in request_ids:
+            self.resolve(request_id, result)
+
+    @property
+    def pending_count(self) -> int:
+        """Gets the number of requests that are not completed."""
+        with self.lock:
+            return len(self._pending)
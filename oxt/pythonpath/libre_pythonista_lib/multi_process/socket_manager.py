@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Any, Dict, Tuple, TYPE_CHECKING
+from typing import Any, Deque, Dict, Optional, Tuple, TYPE_CHECKING
+from collections import deque
+import select
 import socket
 import struct
 import threading
@@ -28,10 +30,16 @@ class SocketManager:
         create_server_socket() -> Tuple[socket.socket, str, int, str]:
         accept_client(server_socket: socket.socket, process_id: str) -> socket.socket:
         send_message(message: Dict[str, Any], process_id: str) -> None:
-        receive_all(length: int, process_id: str) -> bytes:
+        post_message(message: Dict[str, Any], process_id: str) -> None:
+        wait_readable(process_id: str) -> bool:
+        receive_all(length: int, process_id: str) -> bytearray:
+        receive_message(process_id: str) -> Optional[Dict[str, Any]]:
         close_socket(process_id: str) -> None:
     """
 
+    # longest message text written to the debug log.
+    MAX_LOG_CHARS = 500
+
     def __init__(self):
         """
         Initializes the editor with a logger, a socket pool, and a lock.
@@ -46,6 +54,10 @@ class SocketManager:
         config = Config()
         self.socket_timeout_sec = config.lp_py_cell_edit_sock_timeout
         self._socket_pool: Dict[str, socket.socket] = {}
+        # messages posted from other threads, sent by the thread that receives from the process.
+        self._outbox: Dict[str, Deque[Dict[str, Any]]] = {}
+        # socket pairs that wake up a thread waiting in wait_readable() when a message is posted.
+        self._wake_pool: Dict[str, Tuple[socket.socket, socket.socket]] = {}
         self._socket_file = ""
         self.log = OxtLogger(log_name=self.__class__.__name__)
         self.lock = threading.Lock()
@@ -116,6 +128,8 @@ class SocketManager:
             client_socket, _ = server_socket.accept()
             with self.lock:
                 self._socket_pool[process_id] = client_socket
+                self._outbox[process_id] = deque()
+                self._wake_pool[process_id] = socket.socketpair()
             self.log.debug("Client connected to subprocess %s", process_id)
             return client_socket
         except socket.timeout:
@@ -146,6 +160,13 @@ class SocketManager:
             Logs an exception if an error occurs while sending the message.
         """
 
+        # compact separators and utf-8 instead of escapes keep large payloads such as source code small.
+        try:
+            message_bytes = json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode(encoding="utf-8")
+        except Exception:
+            self.log.exception("Error encoding message")
+            return
+        frame = struct.pack("!I", len(message_bytes)) + message_bytes
         with self.lock:
             try:
                 if process_id not in self._socket_pool:
@@ -155,45 +176,131 @@ class SocketManager:
                     )
                     return
                 sock = self._socket_pool[process_id]
-                json_message = json.dumps(message)
-                message_bytes = json_message.encode(encoding="utf-8")
-                message_length = struct.pack("!I", len(message_bytes))
-                self.log.debug(
-                    "Sending message to client: %s to process %s",
-                    json_message,
-                    process_id,
-                )
-                sock.sendall(message_length + message_bytes)
+                if self.log.is_debug:
+                    self.log.debug(
+                        "Sending message to client: %s to process %s",
+                        self._get_log_text(message_bytes),
+                        process_id,
+                    )
+                sock.sendall(frame)
             except Exception:
                 self.log.exception("Error sending message")
 
-    def receive_all(self, length: int, process_id: str) -> bytes:
+    def post_message(self, message: Dict[str, Any], process_id: str) -> None:
+        """
+        Queues a message for a client process, the message is sent by the thread that is waiting in ``wait_readable()``.
+
+        A message sent from a thread other than the thread that receives from the process reaches the client,
+        but the client can then no longer send or receive other messages.
+        This method can be called from any thread and does not wait for the message to be sent.
+
+        Args:
+            message (Dict[str, Any]): The message to be sent, represented as a dictionary.
+            process_id (str): The identifier of the client process to which the message will be sent.
+        """
+        with self.lock:
+            if process_id not in self._outbox:
+                self.log.error("post_message() Process %s not found in socket pool", process_id)
+                return
+            self._outbox[process_id].append(message)
+            _, wake_sock = self._wake_pool[process_id]
+            try:
+                wake_sock.send(b"\0")
+            except OSError:
+                self.log.exception("post_message() Error waking process %s", process_id)
+
+    def wait_readable(self, process_id: str) -> bool:
+        """
+        Waits until a message from a client process can be received.
+
+        Messages posted with ``post_message()`` while waiting are sent on the calling thread.
+
+        Args:
+            process_id (str): The ID of the process to wait for.
+
+        Returns:
+            bool: ``True`` if a message can be received; Otherwise, ``False`` if the process has no socket.
+        """
+        while True:
+            with self.lock:
+                if process_id not in self._socket_pool:
+                    return False
+                sock = self._socket_pool[process_id]
+                wake_sock, _ = self._wake_pool[process_id]
+                outbox = self._outbox[process_id]
+                messages = list(outbox)
+                outbox.clear()
+            for message in messages:
+                self.send_message(message, process_id)
+            readable, _, _ = select.select([sock, wake_sock], [], [])
+            if wake_sock in readable:
+                wake_sock.recv(4096)
+            if sock in readable:
+                return True
+
+    def _get_log_text(self, data: bytes | bytearray) -> str:
+        """Gets the start of a message for the log, long messages are cut off."""
+        max_chars = SocketManager.MAX_LOG_CHARS
+        if len(data) <= max_chars:
+            return bytes(data).decode(encoding="utf-8", errors="replace")
+        text = bytes(data[:max_chars]).decode(encoding="utf-8", errors="replace")
+        return f"{text}... ({len(data)} bytes)"
+
+    def receive_all(self, length: int, process_id: str) -> bytearray:
         """
         Receives a specified number of bytes from a socket associated with a given process ID.
 
+        The bytes are received directly into a buffer of the full length.
+
         Args:
             length (int): The number of bytes to receive.
             process_id (str): The ID of the process whose socket will be used to receive data.
 
         Returns:
-            bytes: The received data.
+            bytearray: The received data. Empty if the process has no socket.
 
         Raises:
             ConnectionResetError: If the connection is closed prematurely.
         """
 
-        data = b""
         with self.lock:
             if process_id not in self._socket_pool:
-                return data
+                return bytearray()
             sock = self._socket_pool[process_id]
-        while len(data) < length:
-            more = sock.recv(length - len(data))
-            if not more:
+        data = bytearray(length)
+        view = memoryview(data)
+        received = 0
+        while received < length:
+            count = sock.recv_into(view[received:], length - received)
+            if not count:
                 raise ConnectionResetError("Connection closed prematurely")
-            data += more
+            received += count
         return data
 
+    def receive_message(self, process_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Receives a length prefixed JSON message from a client process.
+
+        Args:
+            process_id (str): The ID of the process whose socket will be used to receive data.
+
+        Returns:
+            Dict[str, Any], None: The message or ``None`` if the process has no socket or sent an empty message.
+
+        Raises:
+            ConnectionResetError: If the connection is closed prematurely.
+        """
+        raw_msg_len = self.receive_all(length=4, process_id=process_id)
+        if not raw_msg_len:
+            return None
+        msg_len = struct.unpack("!I", raw_msg_len)[0]
+        byte_data = self.receive_all(length=msg_len, process_id=process_id)
+        if not byte_data:
+            return None
+        if self.log.is_debug:
+            self.log.debug("Received message from process %s: %s", process_id, self._get_log_text(byte_data))
+        return json.loads(byte_data)
+
     def close_socket(self, process_id: str) -> None:
         """
         Closes and removes the socket associated with the given process ID.
@@ -208,6 +315,9 @@ class SocketManager:
             if process_id in self._socket_pool:
                 self._socket_pool[process_id].close()
                 del self._socket_pool[process_id]
+            self._outbox.pop(process_id, None)
+            for sock in self._wake_pool.pop(process_id, ()):
+                sock.close()
 
     @property
     def socket_file(self):
@@ -0,0 +1,47 @@
+"""
+Runs callables on the main thread of LibreOffice.
+
+Most UNO calls that change a document, such as recalculating it, must not be made from a worker thread.
+``post_to_main()`` posts a callable to the main thread using ``com.sun.star.awt.AsyncCallback`` and returns at once.
+Posted callables run in the order they are posted, after the events already queued on the main thread.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, TYPE_CHECKING
+import uno
+import unohelper
+from com.sun.star.awt import XCallback
+from com.sun.star.awt import XRequestCallback
+
+from ooodev.loader import Lo
+
+if TYPE_CHECKING:
+    from ....___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+else:
+    from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+
+
+class _Callback(XCallback, unohelper.Base):
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        XCallback.__init__(self)
+        unohelper.Base.__init__(self)
+        self._fn = fn
+
+    def notify(self, aData: Any) -> None:  # noqa: ANN401, N803
+        try:
+            self._fn()
+        except Exception:
+            OxtLogger(log_name="post_to_main").exception("Error running callback on main thread.")
+
+
+def post_to_main(fn: Callable[[], Any]) -> None:
+    """
+    Posts a callable to run later on the main thread.
+
+    The callable is posted even when called on the main thread. Errors raised by the callable are logged.
+
+    Args:
+        fn (Callable[[], Any]): Callable to run.
+    """
+    async_cb = Lo.create_instance_mcf(XRequestCallback, "com.sun.star.awt.AsyncCallback", raise_err=True)
+    async_cb.addCallback(_Callback(fn), None)
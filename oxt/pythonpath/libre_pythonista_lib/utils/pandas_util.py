@@ -2,11 +2,12 @@ from __future__ import annotations
 import contextlib
 from typing import Any, Tuple, List
 from datetime import datetime, timedelta
-import pandas as pd
-from ..convert import array as convert_array
-from ..convert.array import rules as array_rules
-from ..convert import pandas as convert_pandas
-from ..convert.pandas import pd_rules as pandas_rules
+from ..code.lazy_module import lazy_import
+from ..convert.convert_util import ConvertUtil
+
+# imported on first use, loading the extension does not import pandas.
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 
 class PandasUtil:
@@ -17,6 +18,11 @@ class PandasUtil:
         """Determines if the data is a pandas DataFrame."""
         return isinstance(data, pd.DataFrame)
 
+    @staticmethod
+    def is_series(data: Any) -> bool:  # noqa: ANN401
+        """Determines if the data is a pandas Series."""
+        return isinstance(data, pd.Series)
+
     @staticmethod
     def has_headers(df: pd.DataFrame) -> bool:
         """Detects if a DataFrame has a header."""
@@ -95,6 +101,9 @@ class PandasUtil:
             headers = [df.columns.tolist()]
         # Append the DataFrame values to the list
         if convert:
+            from ..convert import pandas as convert_pandas
+            from ..convert.pandas import pd_rules as pandas_rules
+
             converter = convert_pandas.PandasDfConverter()
             converter.add_rule(pandas_rules.RulePdToLoDate)
             # converter.add_rule(pandas_rules.RulePdToIsoDate)
@@ -238,7 +247,7 @@ class PandasUtil:
     @staticmethod
     def lo_date_to_pandas(numeric_date) -> pd.Timestamp:
         # LibreOffice Calc's epoch
-        epoch = datetime(1899, 12, 30)
+        epoch = ConvertUtil.get_lo_epoch()
         # Convert numeric date to datetime
         date_time = epoch + timedelta(days=numeric_date)
         # Convert datetime to Pandas Timestamp
@@ -248,7 +257,7 @@ class PandasUtil:
     @staticmethod
     def pandas_to_lo_date(timestamp: pd.Timestamp | datetime) -> int:
         # Base date for LibreOffice Calc
-        base_date = datetime(1899, 12, 30)
+        base_date = ConvertUtil.get_lo_epoch()
 
         # Ensure the timestamp is a datetime object
         if isinstance(timestamp, pd.Timestamp):
@@ -271,22 +280,14 @@ class PandasUtil:
         Returns:
             pd.Series: Series containing LibreOffice Calc date values.
         """
-        # Define the base date for LibreOffice Calc
-        base_date = datetime(1899, 12, 30)
-
-        # Convert each Timestamp to the number of days since the base date
-        libreoffice_values = series.apply(
-            lambda x: (x - pd.Timestamp(base_date)).days + (x - pd.Timestamp(base_date)).seconds / 86400
-        )
-
-        return libreoffice_values
+        return ConvertUtil.pandas_dates_to_lo(series)
 
     @classmethod
     def convert_float64_to_dates(cls, df: pd.DataFrame) -> pd.DataFrame:
         """Converts date columns to Pandas Timestamp."""
         for col in df.columns:
             if df[col].dtype == "float64":
-                df[col] = df[col].apply(cls.lo_date_to_pandas)
+                df[col] = ConvertUtil.lo_dates_to_pandas(df[col])
         return df
 
     @classmethod
@@ -311,7 +312,7 @@ class PandasUtil:
                     raise ValueError("Column name must be a string if DataFrame has no headers.")
                 col_name = col
             if col_name in df.columns and not cls.pandas_is_date_col(df, col_name):
-                df[col_name] = df[col_name].apply(cls.lo_date_to_pandas)
+                df[col_name] = ConvertUtil.lo_dates_to_pandas(df[col_name])
         return df
 
     @classmethod
@@ -336,7 +337,7 @@ class PandasUtil:
                     raise ValueError("Column name must be a string if DataFrame has no headers.")
                 col_name = col
             if cls.pandas_is_date_col(df, col_name):
-                df[col_name] = df[col_name].apply(cls.pandas_to_lo_date)
+                df[col_name] = ConvertUtil.pandas_dates_to_lo(df[col_name])
             # df[col] = df[col].apply(cls.pandas_to_lo_date)
         return df
 
@@ -467,6 +468,9 @@ class PandasUtil:
         Note:
             This is best for small arrays such as those from a ``DataFrame.describe()`` method or a card view.
         """
+        from ..convert import array as convert_array
+        from ..convert.array import rules as array_rules
+
         arr = convert_array.ArrayRules()
         if date_str:
             arr.add_rule(array_rules.RulePdTimeStampIso)
@@ -482,6 +486,144 @@ class PandasUtil:
                     row[i] = rule.convert(cell)
         return None
 
+    @staticmethod
+    def _get_calc_value(value: Any, epoch: datetime | None) -> Any:  # noqa: ANN401
+        # single value of a column that has mixed types such as the output of DataFrame.describe()
+        if isinstance(value, (pd.Timestamp, datetime)):
+            if epoch is None:
+                return value.strftime("%Y-%m-%dT%H:%M:%S")
+            return ConvertUtil.pandas_timestamp_to_lo_num(value, epoch)
+        if isinstance(value, (float, int, str, bool)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        return str(value)
+
+    @staticmethod
+    def _get_index_column(index: pd.Index) -> pd.Series:
+        # a MultiIndex, such as the result of a groupby on several keys, is one column of tuples as strings.
+        if isinstance(index, pd.MultiIndex):
+            return pd.Series([str(value) for value in index.to_flat_index()], dtype=object)
+        return pd.Series(index)
+
+    @classmethod
+    def _get_calc_column(cls, values: pd.Series, epoch: datetime | None) -> list:
+        """
+        Gets the values of a column as a list of LibreOffice Calc values.
+
+        Args:
+            values (pd.Series): Column values.
+            epoch (datetime, None): Epoch to convert dates to numeric dates. If ``None`` dates are converted to strings.
+
+        Returns:
+            list: Column values. Missing values are empty strings.
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            if epoch is None:
+                converted = values.dt.strftime("%Y-%m-%dT%H:%M:%S")
+            else:
+                converted = ConvertUtil.pandas_dates_to_lo(values, epoch)
+        elif pd.api.types.is_timedelta64_dtype(values):
+            converted = values.astype(str)
+        elif pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+            converted = values
+        else:
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind in ("string", "empty", "boolean"):
+                converted = values
+            elif kind in ("integer", "floating", "mixed-integer-float", "decimal"):
+                converted = pd.to_numeric(values)
+            elif kind in ("datetime", "datetime64"):
+                return cls._get_calc_column(pd.to_datetime(values), epoch)
+            else:
+                converted = values.map(lambda value: cls._get_calc_value(value, epoch))
+
+        arr = converted.to_numpy(dtype=object)
+        missing = pd.isna(values).to_numpy()
+        if missing.any():
+            # object columns give a view of the DataFrame data
+            arr = arr.copy()
+            arr[missing] = ""
+        return arr.tolist()
+
+    @classmethod
+    def pandas_to_calc_array(
+        cls, df: pd.DataFrame, *, header_opt: int = 0, index_opt: int = 0, date_str: bool = False
+    ) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Converts a pandas DataFrame into the tuple of tuples that is returned to LibreOffice Calc.
+
+        The values are converted a column at a time.
+        Missing values become empty strings, dates become LibreOffice Calc numeric dates
+        and values that Calc does not support become strings.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to convert.
+            header_opt (int): If ``0``, then headers are included if they exist.
+                If ``1``, then header names are included.
+                If ``2``, then header names are not included.
+                Default is ``0``.
+            index_opt(int): If ``0``, then index names are included if they exist.
+                If ``1``, then index names are included.
+                If ``2``, then index names are not included.
+                Default is ``0``.
+            date_str (bool, optional): If True, converts dates to strings; Otherwise, converts dates to
+                LibreOffice Calc numeric dates. Default is False.
+
+        Returns:
+            Tuple[Tuple[Any, ...], ...]: The 2D tuple.
+        """
+        if header_opt == 1:
+            has_headers = True
+        elif header_opt == 2:
+            has_headers = False
+        else:
+            has_headers = cls.has_headers(df)
+
+        if index_opt == 1:
+            has_index_names = True
+        elif index_opt == 2:
+            has_index_names = False
+        else:
+            has_index_names = cls.has_index_names(df)
+
+        epoch = None if date_str else ConvertUtil.get_lo_epoch()
+        columns = [cls._get_calc_column(df.iloc[:, i], epoch) for i in range(df.shape[1])]
+        if has_index_names:
+            columns.insert(0, cls._get_calc_column(cls._get_index_column(df.index), epoch))
+
+        rows = tuple(zip(*columns)) if len(df) > 0 else ()
+        if not has_headers:
+            return rows if rows else (("",),)
+
+        # header names are always strings or numbers
+        headers = cls._get_calc_column(pd.Series(df.columns, dtype=object), None)
+        if has_index_names:
+            headers.insert(0, "")
+        return (tuple(headers),) + rows
+
+    @classmethod
+    def pandas_series_to_calc_array(cls, ds: pd.Series) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Converts a pandas Series into the tuple of tuples that is returned to LibreOffice Calc.
+
+        The first column is the index and the second column is the values.
+        If the series has a name then the first row is the header.
+
+        Args:
+            ds (pd.Series): The Series to convert.
+
+        Returns:
+            Tuple[Tuple[Any, ...], ...]: The 2D tuple.
+        """
+        epoch = ConvertUtil.get_lo_epoch()
+        index = cls._get_calc_column(cls._get_index_column(ds.index), epoch)
+        values = cls._get_calc_column(ds, epoch)
+        rows = tuple(zip(index, values))
+        if ds.name:
+            return (("", cls._get_calc_value(ds.name, None)),) + rows
+        return rows if rows else (("",),)
+
     @classmethod
     def pandas_is_date_col(cls, df: pd.DataFrame, col: str | int) -> bool:
         """
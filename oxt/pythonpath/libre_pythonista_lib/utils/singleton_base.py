@@ -5,11 +5,11 @@ When a new document is created, the singleton must be reinitialized.
 
 from __future__ import annotations
 from typing import Any, cast
-from ooodev.loader import Lo
 from ooodev.events.lo_events import LoEvents
 from ooodev.events.args.event_args import EventArgs
 from ooodev.utils.helper.dot_dict import DotDict
 from ..ex.exceptions import SingletonKeyError
+from .thread_doc import get_current_doc
 
 
 class SingletonBase(object):
@@ -27,9 +27,10 @@ class SingletonBase(object):
         if not key:
             raise ValueError("Unable to get single_key")
         if key not in cls._instances:
-            cls.singleton_doc = Lo.current_doc
+            doc = get_current_doc()
+            cls.singleton_doc = doc
             inst = cast(Any, super().__new__(cls))
-            inst.singleton_doc = Lo.current_doc
+            inst.singleton_doc = doc
             inst.singleton_key = key
             inst.runtime_uid = (
                 inst.singleton_doc.runtime_uid
@@ -45,7 +46,7 @@ class SingletonBase(object):
         if eargs.event_data.key:
             return eargs.event_data.key
         try:
-            return f"{Lo.current_doc.runtime_uid}_uid_{cls.__name__}"
+            return f"{get_current_doc().runtime_uid}_uid_{cls.__name__}"
         except Exception as e:
             raise SingletonKeyError(
                 f"Error getting single key for class name: {cls.__name__}"
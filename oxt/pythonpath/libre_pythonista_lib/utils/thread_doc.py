@@ -0,0 +1,57 @@
+"""
+Document of the current thread.
+
+Code cells are run on a worker thread while the user keeps working in Calc.
+The user may switch to another document while a job runs, ``Lo.current_doc`` then returns the other document.
+The worker thread binds the document of its job, lookups that use ``get_current_doc()`` resolve
+to that document on the worker thread and to ``Lo.current_doc`` on any other thread.
+"""
+
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+import threading
+
+from ooodev.loader import Lo
+
+if TYPE_CHECKING:
+    from ooodev.proto.office_document_t import OfficeDocumentT
+
+_local = threading.local()
+
+
+def bind_doc(doc: OfficeDocumentT) -> None:
+    """
+    Binds a document to the current thread.
+
+    Args:
+        doc (OfficeDocumentT): Document of the job run by the thread.
+    """
+    _local.doc = doc
+
+
+def unbind_doc() -> None:
+    """Removes the document bound to the current thread."""
+    _local.doc = None
+
+
+def get_thread_doc() -> Any:  # noqa: ANN401
+    """
+    Gets the document bound to the current thread.
+
+    Returns:
+        OfficeDocumentT | None: Bound document or ``None`` if no document is bound.
+    """
+    return getattr(_local, "doc", None)
+
+
+def get_current_doc() -> Any:  # noqa: ANN401
+    """
+    Gets the document bound to the current thread, or ``Lo.current_doc`` if no document is bound.
+
+    Returns:
+        OfficeDocumentT: Document.
+    """
+    doc = getattr(_local, "doc", None)
+    if doc is None:
+        return Lo.current_doc
+    return doc
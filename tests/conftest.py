@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 import os
 import sys
 import importlib.util
@@ -73,6 +73,35 @@ def build_setup(root_dir, build_code) -> bool:  # noqa: ANN001
     return True
 
 
+@pytest.fixture
+def singleton_doc(build_setup, mocker):  # noqa: ANN001, ANN201
+    """
+    Gets a function that creates a document singleton, such as ``CellPropCache``, for a stand-in document.
+
+    The function takes the callable that creates the singleton from the document, a name for the document uid
+    and optionally the document to use instead of a mock.
+    The document is made the current document, see ``utils.thread_doc``.
+    The singletons are removed after the test.
+    """
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.utils import thread_doc
+
+    lo = mocker.patch.object(thread_doc, "Lo")
+    instances: List[Any] = []
+
+    def factory(create: Callable[[Any], Any], name: str = "singleton", doc: Any = None) -> Any:  # noqa: ANN401
+        if doc is None:
+            doc = mocker.Mock(runtime_uid=f"{name}_test")
+        lo.current_doc = doc
+        inst = create(doc)
+        instances.append(inst)
+        return inst
+
+    yield factory
+    for inst in instances:
+        type(inst).remove_this_instance(inst)
+
+
 # region Soffice
 
 
@@ -0,0 +1,154 @@
+"""
+In memory stand-ins for the office objects used by the benchmarks.
+
+The benchmarks time the cell execution pipeline without a running office.
+Run with ``pytest tests/test_bench --benchmark-only``, see pytest-benchmark for comparing runs.
+Set the environment variable ``LP_BENCH_FULL=1`` to include the largest sizes.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Sequence, Tuple, TYPE_CHECKING
+import os
+
+import pytest
+
+# largest sizes take minutes, they only run when asked for.
+BENCH_FULL = bool(os.environ.get("LP_BENCH_FULL", ""))
+
+
+def full_only(value: Any) -> Any:  # noqa: ANN401
+    """Marks a parameter value to only run when ``LP_BENCH_FULL`` is set."""
+    return pytest.param(value, marks=pytest.mark.skipif(not BENCH_FULL, reason="LP_BENCH_FULL not set"))
+
+
+class FakeSfa:
+    """Stand-in for ``ooodev.io.sfa.Sfa``, files are kept in a dictionary keyed by uri."""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, str] = {}
+        self.inst = self
+
+    def exists(self, uri: str) -> bool:
+        if uri in self.files:
+            return True
+        prefix = uri + "/"
+        return any(key.startswith(prefix) for key in self.files)
+
+    def read_text_file(self, uri: str) -> str:
+        return self.files[uri]
+
+    def write_text_file(self, uri: str, text: str, mode: str = "w") -> None:
+        if mode == "a":
+            text = self.files.get(uri, "") + text
+        self.files[uri] = text
+
+    def delete_file(self, uri: str) -> None:
+        self.files.pop(uri, None)
+
+    def create_folder(self, uri: str) -> None:
+        pass
+
+    def get_folder_contents(self, uri: str, include_folders: bool) -> Tuple[str, ...]:  # noqa: ARG002
+        prefix = uri + "/"
+        return tuple(key for key in self.files if key.startswith(prefix) and "/" not in key[len(prefix) :])
+
+
+class FakeSheet:
+    """Stand-in for ``CalcSheet``."""
+
+    def __init__(self, sheet_index: int) -> None:
+        self.sheet_index = sheet_index
+        self.unique_id = f"sheet_{sheet_index}"
+        self.name = f"Sheet{sheet_index + 1}"
+
+
+class FakeDoc:
+    """Stand-in for ``CalcDoc``."""
+
+    _count = 0
+
+    def __init__(self, sheet_count: int = 1) -> None:
+        # each document gets its own uid, singletons are keyed by it.
+        FakeDoc._count += 1
+        self.runtime_uid = f"bench_doc_{FakeDoc._count}"
+        self.sheets: List[FakeSheet] = [FakeSheet(i) for i in range(sheet_count)]
+
+
+class FakeCellCache:
+    """Stand-in for ``CellCache``, holds the code name custom property of each code cell."""
+
+    def __init__(self, code_cells: Dict[int, Dict[Any, Any]]) -> None:
+        self.code_cells = code_cells
+        self.code_prop = "libre_pythonista_codename"
+
+
+class FakeTblDataObj:
+    """Stand-in for ``TblDataObj`` that takes the table information from the values instead of the sheet."""
+
+    def __init__(self, data: Sequence[Sequence[Any]], date_columns: List[int] | None = None) -> None:
+        first = data[0] if data else ()
+        self.headers = list(first) if len(data) > 1 and all(isinstance(v, str) for v in first) else []
+        self.has_headers = len(self.headers) > 0
+        self.date_columns = date_columns or []
+        self.has_date_columns = len(self.date_columns) > 0
+        self.col_count = len(first)
+
+    def get_date_column_names(self) -> List[str]:
+        return [self.headers[i] for i in self.date_columns]
+
+
+def make_cell_code(count: int) -> List[str]:
+    """
+    Gets the code of a workbook with ``count`` code cells.
+
+    Most cells are independent, every tenth cell reads the result of the cell before it.
+    """
+    result = []
+    for i in range(count):
+        if i > 0 and i % 10 == 0:
+            result.append(f"v{i} = v{i - 1} + 1\nv{i}")
+        else:
+            result.append(f"v{i} = sum(range({i % 50}))\nv{i}")
+    return result
+
+
+def make_table(rows: int, cols: int = 10) -> Tuple[Tuple[Any, ...], ...]:
+    """Gets the values of a range with a header row, text, number and date serial columns."""
+    header = tuple(f"col_{c}" for c in range(cols))
+    body = tuple(
+        tuple(f"r{r}" if c == 0 else 45000.0 + r if c == 1 else float(r * c) for c in range(cols)) for r in range(rows)
+    )
+    return (header,) + body
+
+
+@pytest.fixture
+def src_mgr_factory(singleton_doc, mocker):  # noqa: ANN001, ANN201
+    """
+    Gets a function that creates a ``PySourceManager`` for a workbook with the code of the cells.
+
+    The document, file access, cell cache and shared events are stand-ins.
+    """
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import py_source_mgr
+        from libre_pythonista_lib.code.cell_cache import IndexCellProps
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    code_dir = "librepythonista"
+    mocker.patch.object(py_source_mgr, "Config", return_value=mocker.Mock(lp_code_dir=code_dir))
+    mocker.patch.object(py_source_mgr, "SharedEvent")
+
+    def factory(codes: List[str]) -> Any:  # noqa: ANN401
+        doc = FakeDoc()
+        sfa = FakeSfa()
+        cells = {}
+        sheet_uri = f"vnd.sun.star.tdoc:/{doc.runtime_uid}/{code_dir}/{doc.sheets[0].unique_id}"
+        for i, code in enumerate(codes):
+            code_name = f"id_{i:014d}"
+            cell_obj = CellObj.from_idx(col_idx=0, row_idx=i, sheet_idx=0)
+            cells[cell_obj] = IndexCellProps(code_name, {"libre_pythonista_codename"}, i)
+            sfa.files[f"{sheet_uri}/{code_name}.py"] = code
+        mocker.patch.object(py_source_mgr, "Sfa", return_value=sfa)
+        mocker.patch.object(py_source_mgr, "CellCache", return_value=FakeCellCache({0: cells}))
+        return singleton_doc(py_source_mgr.PySourceManager, doc=doc)
+
+    return factory
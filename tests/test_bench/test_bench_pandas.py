@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("pandas")
+
+from .conftest import FakeTblDataObj, full_only, make_table  # noqa: E402
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.utils.pandas_util import PandasUtil
+    from ...oxt.pythonpath.libre_pythonista_lib.data import pandas_data_obj
+
+COLS = 10
+# number of cells in the range, the range is always 10 columns wide.
+SIZES = [1_000, 100_000, full_only(1_000_000)]
+
+
+@pytest.mark.parametrize("cells", SIZES)
+def test_bench_pandas_to_array(benchmark, build_setup, cells: int) -> None:  # noqa: ANN001
+    import pandas as pd
+
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.utils.pandas_util import PandasUtil
+
+    data = make_table(cells // COLS, COLS)
+    df = pd.DataFrame(data[1:], columns=data[0])
+    result = benchmark(PandasUtil.pandas_to_array, df)
+    assert len(result) >= cells // COLS
+
+
+@pytest.mark.parametrize("cells", SIZES)
+def test_bench_get_data_frame(benchmark, build_setup, mocker, cells: int) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.data import pandas_data_obj
+
+    data = make_table(cells // COLS, COLS)
+    mocker.patch.object(pandas_data_obj, "TblDataObj", return_value=FakeTblDataObj(data, date_columns=[1]))
+    cell_rng = mocker.Mock()
+
+    def run():  # noqa: ANN202
+        pdo = pandas_data_obj.PandasDataObj(cell_rng=cell_rng, data=data)
+        return pdo.get_data_frame()
+
+    df = benchmark(run)
+    assert df.shape == (cells // COLS, COLS)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code.py_module import PyModule
+    from ...oxt.pythonpath.libre_pythonista_lib.code.code_cache import CodeCache
+    from ...oxt.pythonpath.libre_pythonista_lib.code.rules.code_rules import CodeRules
+
+CODES = {
+    "assign": "x = 1\ny = x + 1",
+    "expr": "sum(i * i for i in range(100))",
+    "func": "def f(a):\n    return a * 2\n\nf(21)",
+    "none": "z = None\nz",
+}
+
+
+@pytest.fixture(scope="module")
+def py_module(build_setup):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.py_module import PyModule
+    return PyModule()
+
+
+@pytest.mark.parametrize("name", list(CODES))
+def test_bench_update_with_result(benchmark, py_module, name: str) -> None:  # noqa: ANN001
+    code = CODES[name]
+
+    def run() -> None:
+        py_module.reset_module()
+        py_module.update_with_result(code)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("name", list(CODES))
+def test_bench_get_matched_rule(benchmark, py_module, name: str) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.code_cache import CodeCache
+        from libre_pythonista_lib.code.rules.code_rules import CodeRules
+
+    code = CODES[name]
+    py_module.reset_module()
+    py_module.update_with_result(code)
+    rules = CodeRules()
+    ast_mod = CodeCache().get(code).tree
+    rule = benchmark(rules.get_matched_rule, py_module.mod, code, ast_mod)
+    assert rule is not None
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pytest.importorskip("pytest_benchmark")
+
+from .conftest import make_cell_code  # noqa: E402
+
+SIZES = [10, 100, 1000]
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_bench_src_mgr_load(benchmark, src_mgr_factory, count: int) -> None:  # noqa: ANN001
+    codes = make_cell_code(count)
+    mgr = benchmark(src_mgr_factory, codes)
+    assert len(mgr) == count
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_bench_update_all(benchmark, src_mgr_factory, count: int) -> None:  # noqa: ANN001
+    mgr = src_mgr_factory(make_cell_code(count))
+    benchmark(mgr.update_all)
+    assert mgr.py_mod.mod.__dict__[f"v{count - 1}"] is not None
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_bench_update_from_index(benchmark, src_mgr_factory, count: int) -> None:  # noqa: ANN001
+    # a change half way down the sheet, only the cells after it that depend on it are executed again.
+    mgr = src_mgr_factory(make_cell_code(count))
+    mgr.update_all()
+    benchmark(mgr.update_from_index, count // 2)
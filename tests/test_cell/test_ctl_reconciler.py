@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.cell.ctl import ctl_reconciler
+
+
+@pytest.fixture
+def reconciler(singleton_doc, mocker):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.cell.ctl import ctl_reconciler
+
+    mocker.patch.object(ctl_reconciler, "CtlState")
+    index = mocker.patch.object(ctl_reconciler, "ShapeIndex")
+    index.return_value.has_shape.return_value = True
+    inst = singleton_doc(ctl_reconciler.CtlReconciler, "ctl_reconciler")
+    inst.clear()
+    return inst
+
+
+def _make_ctl(mocker, row: int, height: int = 500) -> Any:  # noqa: ANN001, ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.cell.ctl.simple_ctl import SimpleCtl
+
+    ctl = mocker.Mock(spec=SimpleCtl)
+    ctl.is_deleted_cell = False
+    ctl.calc_cell = mocker.Mock(cell_obj=("A", row))
+    ctl.namer = mocker.Mock(ctl_shape_name=f"ctl_{row}")
+    ctl.get_rule_name.return_value = "cell_data_type_pd_df"
+    ctl.get_label.return_value = "<> DataFrame"
+    ctl.get_cell_pos_size.return_value = (0, row * 500, 2000, height)
+    return ctl
+
+
+def test_unchanged_ctl_skipped(reconciler: Any, mocker) -> None:  # noqa: ANN001, ANN401
+    first = _make_ctl(mocker, 1)
+    reconciler.add_ctl(first)
+    first.add_ctl.assert_called_once()
+
+    again = _make_ctl(mocker, 1)
+    reconciler.add_ctl(again)
+    again.add_ctl.assert_not_called()
+    again.update_ctl.assert_not_called()
+
+    resized = _make_ctl(mocker, 1, height=900)
+    reconciler.add_ctl(resized)
+    resized.add_ctl.assert_not_called()
+    resized.update_ctl.assert_called_once()
+
+
+def test_recalc_changes_applied_together(reconciler: Any, mocker) -> None:  # noqa: ANN001, ANN401
+    reconciler.begin_recalc()
+    ctls = [_make_ctl(mocker, row) for row in range(3)]
+    for ctl in ctls:
+        reconciler.add_ctl(ctl)
+    assert all(not ctl.add_ctl.called for ctl in ctls)
+
+    reconciler.end_recalc()
+    assert all(ctl.add_ctl.call_count == 1 for ctl in ctls)
+    reconciler._doc.lock_controllers.assert_called_once()
+    reconciler._doc.unlock_controllers.assert_called_once()
+
+
+def test_forget_drops_queued_ctl(reconciler: Any, mocker) -> None:  # noqa: ANN001, ANN401
+    reconciler.begin_recalc()
+    ctl = _make_ctl(mocker, 1)
+    reconciler.add_ctl(ctl)
+    reconciler.forget(ctl.calc_cell)
+    reconciler.end_recalc()
+    ctl.add_ctl.assert_not_called()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.cell.ctl import mat_plot_figure_ctl
+
+
+@pytest.fixture
+def figure_ctl(build_setup, mocker, tmp_path):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.cell.ctl import mat_plot_figure_ctl
+
+    for name in ("KeyMaker", "LogInst", "PyInstance", "ShapeNamer", "FigureCache", "CellPropCache", "ShapeIndex", "SharedEvent"):
+        mocker.patch.object(mat_plot_figure_ctl, name)
+    cell_img = mocker.patch.object(mat_plot_figure_ctl, "CellImg")
+    img = tmp_path / "plt_1.svg"
+    img.write_text("<svg/>")
+    ctl = mat_plot_figure_ctl.MatPlotFigureCtl(mocker.Mock(extra_data={}))
+    ctl.namer.shape_name = "shape_1"
+    ctl._py_src.__getitem__.return_value = mocker.Mock(dd_data=mocker.Mock(data=str(img)))
+    mocker.patch.object(ctl, "remove_ctl")
+    return ctl, cell_img, str(img)
+
+
+def test_unchanged_figure_skipped(figure_ctl: Any) -> None:  # noqa: ANN401
+    ctl, cell_img, img = figure_ctl
+    ctl._figures.get_inserted.return_value = img
+    ctl._shapes.has_shape.return_value = True
+    ctl.add_ctl()
+    ctl.remove_ctl.assert_not_called()
+    cell_img.assert_not_called()
+    ctl._figures.set_inserted.assert_not_called()
+
+
+def test_changed_figure_inserted(figure_ctl: Any) -> None:  # noqa: ANN401
+    ctl, cell_img, img = figure_ctl
+    ctl._figures.get_inserted.return_value = "/tmp/plt_0.svg"
+    ctl._shapes.has_shape.return_value = True
+    ctl.add_ctl()
+    ctl.remove_ctl.assert_called_once()
+    cell_img.return_value.insert_cell_image_linked.assert_called_once()
+    ctl._figures.set_inserted.assert_called_once_with("shape_1", img)
+
+
+def test_missing_shape_inserted(figure_ctl: Any) -> None:  # noqa: ANN401
+    ctl, cell_img, img = figure_ctl
+    # the image is unchanged but the user deleted the shape.
+    ctl._figures.get_inserted.return_value = img
+    ctl._shapes.has_shape.return_value = False
+    ctl.add_ctl()
+    cell_img.return_value.insert_cell_image_linked.assert_called_once()
+    ctl._figures.set_inserted.assert_called_once_with("shape_1", img)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.cell.result_action.pyc.rules import pyc_rules
+
+
+@pytest.fixture
+def rules(singleton_doc):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.cell.result_action.pyc.rules import pyc_rules
+
+    # the rules are a singleton of the current document, they do not take it.
+    return singleton_doc(lambda doc: pyc_rules.PycRules(), "pyc_rules")
+
+
+def _names(rules: Any, data_type: type) -> list:  # noqa: ANN401
+    return [rule.__name__ for rule in rules._get_type_rules(data_type)]
+
+
+def test_type_rules(rules: Any) -> None:  # noqa: ANN401
+    import pandas as pd
+
+    assert _names(rules, int) == ["RuleEmpty", "RuleInt"]
+    assert _names(rules, bool) == ["RuleEmpty", "RuleInt"]
+    assert _names(rules, float) == ["RuleEmpty", "RuleFloat"]
+    assert _names(rules, str) == ["RuleEmpty", "RuleMatPlotFigure", "RuleInt", "RuleFloat", "RuleStr"]
+    assert _names(rules, pd.DataFrame) == ["RuleEmpty", "RulePdDfHeaders", "RulePdDf"]
+    assert _names(rules, pd.Series) == ["RuleEmpty", "RulePdDs"]
+    assert _names(rules, type(None)) == ["RuleEmpty", "RuleNone"]
+    assert _names(rules, dict) == ["RuleEmpty"]
+
+
+def test_type_rules_cleared(rules: Any) -> None:  # noqa: ANN401
+    class RuleDict:
+        def __init__(self, cell: Any, data: Any) -> None:  # noqa: ANN401
+            pass
+
+    assert _names(rules, dict) == ["RuleEmpty"]
+    rules.add_rule(RuleDict)
+    try:
+        assert _names(rules, dict) == ["RuleEmpty", "RuleDict"]
+    finally:
+        rules.remove_rule(RuleDict)
+    assert _names(rules, dict) == ["RuleEmpty"]
+
+
+def test_type_rules_by_name(rules: Any) -> None:  # noqa: ANN401
+    from collections import OrderedDict
+
+    class Child(OrderedDict):
+        pass
+
+    class RuleOrderedDict:
+        match_types = ("collections.OrderedDict", "not_imported_module.Type")
+
+        def __init__(self, cell: Any, data: Any) -> None:  # noqa: ANN401
+            pass
+
+    rules.add_rule(RuleOrderedDict)
+    try:
+        # a name matches the subclasses of the named type, a type of a module that is not imported never matches.
+        assert _names(rules, Child) == ["RuleEmpty", "RuleOrderedDict"]
+        assert _names(rules, dict) == ["RuleEmpty"]
+    finally:
+        rules.remove_rule(RuleOrderedDict)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Any, List, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.cell.ctl import shape_index
+
+
+class _Shape:
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+
+class _DrawPage:
+    def __init__(self, *names: str) -> None:
+        self.shapes: List[_Shape] = [_Shape(name) for name in names]
+        self.reads = 0
+
+    def getCount(self) -> int:  # noqa: N802
+        return len(self.shapes)
+
+    def getByIndex(self, idx: int) -> _Shape:  # noqa: N802
+        self.reads += 1
+        return self.shapes[idx]
+
+
+class _Sheet:
+    unique_id = "sheet_1"
+
+
+@pytest.fixture
+def index(singleton_doc):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.cell.ctl import shape_index
+
+    inst = singleton_doc(shape_index.ShapeIndex, "shape_index")
+    inst.invalidate()
+    return inst
+
+
+def test_shape_index_reads_once(index: Any) -> None:  # noqa: ANN401
+    dp = _DrawPage("a", "B", "c")
+    assert index.get_x_shape("sheet_1", dp, "A") is dp.shapes[0]
+    assert index.get_x_shape("sheet_1", dp, "b") is dp.shapes[1]
+    assert index.get_x_shape("sheet_1", dp, "c") is dp.shapes[2]
+    assert dp.reads == 3
+
+
+def test_shape_index_missing(index: Any) -> None:  # noqa: ANN401
+    dp = _DrawPage("a")
+    with pytest.raises(Exception, match="No shape named"):
+        index.get_x_shape("sheet_1", dp, "b")
+    assert dp.reads == 1
+
+    # a shape inserted without being added to the index changes the shape count.
+    dp.shapes.append(_Shape("b"))
+    assert index.get_x_shape("sheet_1", dp, "b") is dp.shapes[1]
+
+
+def test_shape_index_add_remove(index: Any) -> None:  # noqa: ANN401
+    dp = _DrawPage("a")
+    sheet = _Sheet()
+    index.get_x_shape("sheet_1", dp, "a")
+
+    dp.shapes.append(_Shape("b"))
+    index.add(sheet, dp.shapes[1])
+    assert index.get_x_shape("sheet_1", dp, "b") is dp.shapes[1]
+
+    dp.shapes.pop(0)
+    index.remove(sheet, "a")
+    with pytest.raises(Exception, match="No shape named"):
+        index.get_x_shape("sheet_1", dp, "a")
+    assert dp.reads == 1
+
+    # a renamed shape is found by reading the shapes again.
+    dp.shapes[0].Name = "c"
+    with pytest.raises(Exception, match="No shape named"):
+        index.get_x_shape("sheet_1", dp, "b")
+    assert dp.reads == 2
+    assert index.get_x_shape("sheet_1", dp, "c") is dp.shapes[0]
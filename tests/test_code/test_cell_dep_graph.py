@@ -0,0 +1,155 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code.code_names import CodeNames
+    from ...oxt.pythonpath.libre_pythonista_lib.code.cell_dep_graph import CellDepGraph, CellNode
+
+
+@pytest.fixture(scope="module")
+def deps(build_setup):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.code_names import CodeNames
+        from libre_pythonista_lib.code.cell_dep_graph import CellDepGraph, CellNode
+    return CodeNames, CellDepGraph, CellNode
+
+
+def test_code_names_assign(deps) -> None:  # noqa: ANN001
+    code_names_cls, _, _ = deps
+    names = code_names_cls.from_code("x = 10\ny = x + z\n")
+    assert names.writes == {"x", "y"}
+    assert names.reads == {"x", "z"}
+    assert not names.is_opaque
+
+
+def test_code_names_defs_imports(deps) -> None:  # noqa: ANN001
+    code_names_cls, _, _ = deps
+    code = """
+import os.path
+from math import sqrt as root
+
+def fn(a):
+    return a * factor
+
+class Foo:
+    pass
+"""
+    names = code_names_cls.from_code(code)
+    assert {"os", "root", "fn", "Foo"} <= names.writes
+    # the body runs where fn is called.
+    assert "factor" not in names.reads
+    assert names.defs["fn"].reads == {"factor"}
+    assert "factor" in names.all_reads
+
+
+def test_code_names_function_body(deps) -> None:  # noqa: ANN001
+    code_names_cls, _, _ = deps
+    code = """
+def fn(a, b=default):
+    global total
+    total = a + offset
+    items.append(b)
+    local = []
+    local.append(a)
+    exec("pass")
+"""
+    names = code_names_cls.from_code(code)
+    assert names.reads == {"default"}
+    assert names.writes == {"fn"}
+    assert not names.is_opaque
+    body = names.defs["fn"]
+    assert body.reads == {"offset", "items", "exec"}
+    assert body.writes == {"total", "items"}
+    assert body.is_opaque
+
+
+def test_code_names_mutation(deps) -> None:  # noqa: ANN001
+    code_names_cls, _, _ = deps
+    names = code_names_cls.from_code("df['a'] = 1\nlst.append(2)\nobj.attr = 3\ndf2.dropna(inplace=True)")
+    assert {"df", "lst", "obj", "df2"} <= names.writes
+    names = code_names_cls.from_code("total = df['a'].sum()")
+    assert "df" not in names.writes
+
+
+def test_code_names_opaque(deps) -> None:  # noqa: ANN001
+    code_names_cls, _, _ = deps
+    assert code_names_cls.from_code("globals()['x'] = 1").is_opaque
+    assert code_names_cls.from_code("from math import *").is_opaque
+    assert code_names_cls.from_code("x = (").is_opaque
+    assert not code_names_cls.from_code("").is_opaque
+
+
+def test_dep_graph_dependents(deps) -> None:  # noqa: ANN001
+    _, graph_cls, node_cls = deps
+    nodes = [
+        node_cls(reads=frozenset(), writes=frozenset({"a"})),
+        node_cls(reads=frozenset(), writes=frozenset({"b"})),
+        node_cls(reads=frozenset({"a"}), writes=frozenset({"c"})),
+        node_cls(reads=frozenset({"b"}), writes=frozenset({"d"})),
+        node_cls(reads=frozenset({"c"}), writes=frozenset({"e"})),
+    ]
+    graph = graph_cls(nodes)
+    assert graph.get_dependencies(2) == {0}
+    assert graph.get_dependencies(4) == {2}
+    assert graph.get_dependents([0]) == [0, 2, 4]
+    assert graph.get_dependents([1]) == [1, 3]
+
+
+def test_dep_graph_overwrite(deps) -> None:  # noqa: ANN001
+    _, graph_cls, node_cls = deps
+    # cell 1 rebinds "a" so cell 2 no longer depends on cell 0.
+    nodes = [
+        node_cls(reads=frozenset(), writes=frozenset({"a"})),
+        node_cls(reads=frozenset(), writes=frozenset({"a"})),
+        node_cls(reads=frozenset({"a"}), writes=frozenset({"b"})),
+    ]
+    graph = graph_cls(nodes)
+    assert graph.get_dependents([0]) == [0]
+    assert graph.get_dependents([1]) == [1, 2]
+
+
+def test_dep_graph_opaque(deps) -> None:  # noqa: ANN001
+    _, graph_cls, node_cls = deps
+    nodes = [
+        node_cls(reads=frozenset(), writes=frozenset({"a"})),
+        None,
+        node_cls(reads=frozenset({"z"}), writes=frozenset({"b"})),
+        node_cls(reads=frozenset(), writes=frozenset({"c"})),
+    ]
+    graph = graph_cls(nodes)
+    # unknown node depends on everything before it and may write any name.
+    assert graph.get_dependents([0]) == [0, 1, 2]
+
+
+def test_dep_graph_function_call(deps) -> None:  # noqa: ANN001
+    code_names_cls, graph_cls, node_cls = deps
+
+    def node(code: str):  # noqa: ANN202
+        names = code_names_cls.from_code(code)
+        return node_cls(reads=names.reads, writes=names.writes, is_opaque=names.is_opaque, defs=names.defs)
+
+    nodes = [
+        node("def f():\n    return x\n"),
+        node("x = 1"),
+        node("y = f()"),
+        node("def g():\n    global z\n    z = 2\n"),
+        node("g()"),
+        node("w = z"),
+    ]
+    graph = graph_cls(nodes)
+    # the cell calling f reads x through f.
+    assert graph.get_dependents([1]) == [1, 2]
+    assert graph.get_dependents([0]) == [0, 2]
+    # the cell calling g writes z.
+    assert graph.get_dependencies(5) == {4}
+
+    # functions defined before the first node are passed in.
+    defs = {}
+    nodes[0].update_defs(defs)
+    graph = graph_cls(nodes[1:3], defs=defs)
+    assert graph.get_dependents([0]) == [0, 1]
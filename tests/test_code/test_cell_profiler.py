@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code import cell_profiler
+
+
+class _Src:
+    def __init__(self, row: int) -> None:
+        self.sheet_idx = 0
+        self.row = row
+        self.col = 0
+        self.unique_id = f"id_{row}"
+
+
+@pytest.fixture
+def profiler(singleton_doc, mocker):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import cell_profiler
+
+    mocker.patch.object(cell_profiler, "CalcProps", return_value=mocker.Mock(profile_memory=False))
+    inst = singleton_doc(cell_profiler.CellProfiler, "profiler")
+    inst.clear()
+    return inst
+
+
+def _record(profiler: Any, row: int, result: Any = None) -> None:  # noqa: ANN401
+    start = profiler.start()
+    if row == 1:
+        sum(range(200_000))
+    profiler.stop(start, _Src(row), result)
+
+
+def test_cell_profiler_summary(profiler: Any) -> None:  # noqa: ANN401
+    _record(profiler, 0)
+    _record(profiler, 1, "x" * 100)
+    _record(profiler, 0)
+
+    summary = profiler.get_summary()
+    assert [s.cell_name for s in summary] == ["A2", "A1"]
+    assert summary[0].result_size >= 100
+    assert summary[0].peak_memory == -1
+    assert summary[1].runs == 2
+    assert "A2" in profiler.get_report()
+
+
+def test_cell_profiler_ring_buffer(profiler: Any, mocker) -> None:  # noqa: ANN001, ANN401
+    mocker.patch.object(type(profiler), "MAX_ENTRIES", 3)
+    profiler._entries = type(profiler._entries)(maxlen=3)
+    for row in range(5):
+        _record(profiler, row + 2)
+    assert [e.key[1] for e in profiler.get_entries()] == [4, 5, 6]
+
+
+def test_get_result_size(build_setup) -> None:  # noqa: ANN001
+    pd = pytest.importorskip("pandas")
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.cell_profiler import get_result_size
+
+    assert get_result_size(None) == 0
+    df = pd.DataFrame({"a": range(1000)})
+    assert get_result_size(df) >= 8000
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Any, Dict, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code import cell_prop_cache
+
+
+class _Cell:
+    def __init__(self, **props: Any) -> None:  # noqa: ANN401
+        self.cell_obj = "A1"
+        self.props: Dict[str, Any] = dict(props)
+        self.reads = 0
+        self.writes = 0
+
+    def has_custom_property(self, name: str) -> bool:
+        self.reads += 1
+        return name in self.props
+
+    def get_custom_property(self, name: str, default: Any = None) -> Any:  # noqa: ANN401
+        return self.props.get(name, default)
+
+    def set_custom_properties(self, props: Dict[str, Any]) -> None:
+        self.writes += 1
+        self.props.update(props)
+
+    def remove_custom_property(self, name: str) -> None:
+        del self.props[name]
+
+
+@pytest.fixture
+def cache(singleton_doc):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import cell_prop_cache
+
+    inst = singleton_doc(cell_prop_cache.CellPropCache, "cell_prop_cache")
+    inst.clear()
+    return inst
+
+
+def test_unchanged_values_not_written(cache: Any) -> None:  # noqa: ANN401
+    cell = _Cell(rule="str", state=1)
+    cache.set_many(cell, {"rule": "str", "state": 1})
+    assert cell.writes == 0
+
+    cache.set_many(cell, {"rule": "float", "state": 1})
+    assert cell.writes == 1
+    assert cell.props == {"rule": "float", "state": 1}
+
+    reads = cell.reads
+    assert cache.get(cell, "rule") == "float"
+    assert cache.has(cell, "state")
+    assert cell.reads == reads
+
+
+def test_recalc_writes_deferred(cache: Any) -> None:  # noqa: ANN401
+    cell = _Cell()
+    cache.begin_recalc()
+    cache.set(cell, "rule", "str")
+    cache.set(cell, "state", 2)
+    assert cell.writes == 0
+    assert cache.get(cell, "state") == 2
+
+    cache.end_recalc()
+    assert cell.writes == 1
+    assert cell.props == {"rule": "str", "state": 2}
+
+
+def test_remove(cache: Any) -> None:  # noqa: ANN401
+    cell = _Cell(rule="str")
+    cache.remove(cell, "rule")
+    assert cell.props == {}
+    assert not cache.has(cell, "rule")
+    cache.set(cell, "rule", "str")
+    assert cell.props == {"rule": "str"}
+
+
+def test_flush_on_doc_closing(cache: Any, mocker: Any) -> None:  # noqa: ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import cell_prop_cache
+
+    cell = _Cell()
+    cache.begin_recalc()
+    cache.set(cell, "rule", "str")
+    event = mocker.Mock()
+    event.event_data.uid = "cell_prop_cache_test"
+    cell_prop_cache._on_doc_closing(None, event)
+    # the document closes before the recalculation ends.
+    assert cell.props == {"rule": "str"}
+    assert cell_prop_cache.CellPropCache._instances.get("cell_prop_cache_test_uid_CellPropCache") is None
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code.code_cache import CodeCache
+
+
+@pytest.fixture(scope="module")
+def cache(build_setup):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.code_cache import CodeCache
+    inst = CodeCache()
+    inst.clear()
+    return inst
+
+
+def test_code_cache_hit(cache: CodeCache) -> None:
+    code = "x = 1  # comment\ny = x + 2\ny\n"
+    entry = cache.get(code)
+    assert entry.code == "x = 1\ny = x + 2\ny"
+    assert entry.eval_code is not None
+    assert entry.assign_name == ""
+    misses = cache.misses
+    assert cache.get(code) is entry
+    assert cache.misses == misses
+
+    glb = {}
+    exec(entry.exec_code, glb)  # type: ignore
+    assert eval(entry.eval_code, glb) == 3  # type: ignore
+
+
+def test_code_cache_assign(cache: CodeCache) -> None:
+    entry = cache.get("a = 1\nb: int = a + 1")
+    assert entry.assign_name == "b"
+    assert entry.code_names is not None
+    assert {"a", "b"} <= entry.code_names.writes
+    # the shared tree keeps the last statement.
+    assert entry.tree is not None
+    assert len(entry.tree.body) == 2
+
+
+def test_code_cache_errors(cache: CodeCache) -> None:
+    entry = cache.get("x = 1 +* 2")
+    assert isinstance(entry.error, SyntaxError)
+    assert entry.code_names is None
+    entry = cache.get("return 5")
+    assert entry.error is not None
+    assert entry.tree is not None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from typing import Any, List, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code import exec_engine
+
+
+@pytest.fixture
+def engine(singleton_doc, mocker):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import exec_engine
+
+    posted = mocker.patch.object(exec_engine, "post_to_main")
+    inst = singleton_doc(exec_engine.ExecEngine, "exec_engine")
+    yield inst, posted
+    inst.wait(5.0)
+
+
+def test_job_keeps_document(engine: Any, mocker) -> None:  # noqa: ANN001, ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.utils import thread_doc
+
+    inst, _ = engine
+    doc = inst._doc
+    other = mocker.Mock(runtime_uid="exec_engine_other")
+    seen: List[Any] = []
+
+    def job() -> None:
+        seen.append(thread_doc.get_current_doc())
+
+    # the user switches to another document before the job runs, Lo is the stand-in of singleton_doc.
+    thread_doc.Lo.current_doc = other
+    inst.submit("job", job)
+    assert inst.wait(5.0)
+    assert seen == [doc]
+    assert thread_doc.get_current_doc() is other
+
+
+def test_cancel_between_cells(engine: Any) -> None:  # noqa: ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.exec_engine import check_cancelled
+        from libre_pythonista_lib.ex.exceptions import ExecCancelledError
+
+    inst, _ = engine
+    ran: List[int] = []
+    cancelled: List[bool] = []
+
+    def job() -> None:
+        try:
+            for i in range(3):
+                check_cancelled()
+                ran.append(i)
+                if i == 0:
+                    inst.cancel()
+        except ExecCancelledError:
+            cancelled.append(True)
+            raise
+
+    inst.submit("job", job)
+    assert inst.wait(5.0)
+    # the cell that was running finishes, the next one does not start.
+    assert ran == [0]
+    assert cancelled == [True]
+    assert inst.is_cancelled
+
+
+def test_check_cancelled_outside_engine(engine: Any) -> None:  # noqa: ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.exec_engine import check_cancelled
+
+    inst, _ = engine
+    inst._is_cancelled = True
+    # not a worker thread, nothing is raised.
+    check_cancelled()
+
+
+def test_push_flag(engine: Any) -> None:  # noqa: ANN401
+    inst, posted = engine
+    inst.submit("job", lambda: None)
+    assert inst.wait(5.0)
+    # the recalculation is posted to the main thread, not run on the worker.
+    posted.assert_called_once_with(inst._push_results)
+    inst._doc.component.calculateAll.assert_not_called()
+    assert inst.consume_push() is False
+
+    # only the recalculation of the push is ignored, a later one is not.
+    inst._push_results()
+    inst._doc.component.calculateAll.assert_called_once()
+    assert inst.consume_push() is True
+    assert inst.consume_push() is False
+
+    # a push that raised no recalculation event does not hide the next one.
+    inst._push_results()
+    inst._end_push()
+    assert inst.consume_push() is False
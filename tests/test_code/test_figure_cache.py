@@ -0,0 +1,86 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code import figure_cache
+
+
+@pytest.fixture
+def figures(singleton_doc, mocker, tmp_path):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import figure_cache
+
+    mocker.patch.object(figure_cache, "Lo").tmp_dir = str(tmp_path)
+    props = mocker.patch.object(figure_cache, "CalcProps").return_value
+    props.plot_format = "svg"
+    props.plot_dpi = 100
+    inst = singleton_doc(figure_cache.FigureCache, "figure_cache")
+    yield inst, props
+    inst.clear()
+
+
+def _plot(values: list) -> Any:  # noqa: ANN401
+    plt = pytest.importorskip("matplotlib.pyplot")
+    fig = plt.figure()
+    fig.gca().plot(values)
+    return fig
+
+
+def test_render_hash_stable(figures: Any) -> None:  # noqa: ANN401
+    inst, _ = figures
+    first = inst.render(_plot([1, 2, 3]))
+    # a new figure that draws the same plot gets the same file.
+    again = inst.render(_plot([1, 2, 3]))
+    other = inst.render(_plot([3, 2, 1]))
+    assert first == again
+    assert first != other
+    assert first.suffix == ".svg"
+    assert sorted(p.name for p in first.parent.iterdir()) == sorted({first.name, other.name})
+
+
+def test_render_png(figures: Any) -> None:  # noqa: ANN401
+    inst, props = figures
+    props.plot_format = "png"
+    props.plot_dpi = 50
+    pth = inst.render(_plot([1, 2, 3]))
+    assert pth.suffix == ".png"
+    assert pth.read_bytes().startswith(b"\x89PNG")
+
+
+def test_settings_fallback(figures: Any) -> None:  # noqa: ANN401
+    inst, props = figures
+    props.plot_format = "gif"
+    props.plot_dpi = 1
+    assert inst._get_settings() == ("svg", 10)
+
+
+def test_stale_cell_file_deleted(figures: Any, tmp_path) -> None:  # noqa: ANN001, ANN401
+    inst, _ = figures
+    old, new, shared = (tmp_path / name for name in ("old.svg", "new.svg", "shared.svg"))
+    for pth in (old, new, shared):
+        pth.write_text("<svg/>")
+
+    inst._set_cell_file("A1", old)
+    inst._set_cell_file("A1", new)
+    assert not old.exists()
+    assert new.exists()
+
+    # a file that another cell still shows is kept.
+    inst._set_cell_file("A1", shared)
+    inst._set_cell_file("B1", shared)
+    inst._set_cell_file("A1", new)
+    assert shared.exists()
+
+
+def test_inserted(figures: Any) -> None:  # noqa: ANN401
+    inst, _ = figures
+    assert inst.get_inserted("shape_1") == ""
+    inst.set_inserted("shape_1", "/tmp/plt_1.svg")
+    assert inst.get_inserted("shape_1") == "/tmp/plt_1.svg"
+    inst.set_inserted("shape_1", "")
+    assert inst.get_inserted("shape_1") == ""
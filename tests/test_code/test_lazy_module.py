@@ -0,0 +1,73 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import importlib
+import os
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code.lazy_module import LazyModule
+
+
+def test_lazy_module_loads_on_first_use(build_setup) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.lazy_module import LazyModule
+
+    calls = []
+
+    def loader() -> ModuleType:
+        calls.append(1)
+        return importlib.import_module("json")
+
+    mod = LazyModule("json", loader)
+    assert isinstance(mod, ModuleType)
+    assert mod.__name__ == "json"
+    assert mod.is_loaded is False
+    assert "not loaded" in repr(mod)
+    assert calls == []
+
+    assert mod.dumps([1]) == "[1]"
+    assert mod.is_loaded
+    assert mod.loads("2") == 2
+    assert calls == [1]
+    assert "dumps" in dir(mod)
+
+
+def test_lazy_module_set_attr(build_setup) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.lazy_module import LazyModule
+
+    real = ModuleType("real_mod")
+    mod = LazyModule("real_mod", lambda: real)
+    mod.value = 10
+    assert real.value == 10  # type: ignore
+    assert mod.value == 10
+
+
+def test_lazy_import(build_setup) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.lazy_module import lazy_import
+
+    mod = lazy_import("json")
+    assert mod.is_loaded is False
+    assert mod.dumps(1) == "1"
+    assert mod.lazy_load() is importlib.import_module("json")
+
+
+def test_rules_do_not_import_pandas(build_setup) -> None:  # noqa: ANN001
+    # a new interpreter, pandas may already be imported by other tests.
+    code = (
+        "import sys\n"
+        "from libre_pythonista_lib.cell.result_action.pyc.rules.pyc_rules import PycRules\n"
+        "from libre_pythonista_lib.utils.pandas_util import PandasUtil\n"
+        "print(','.join(m for m in ('pandas', 'numpy', 'matplotlib') if m in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code.mod_snapshot import ModSnapshot
+
+
+@pytest.fixture(scope="module")
+def snapshot_cls(build_setup):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code.mod_snapshot import ModSnapshot
+    return ModSnapshot
+
+
+def test_snapshot_layers(snapshot_cls) -> None:  # noqa: ANN001
+    root = snapshot_cls(writes={"a": 1, "b": 2})
+    s1 = snapshot_cls(parent=root, writes={"c": 3})
+    s2 = snapshot_cls(parent=s1, writes={"a": 10}, deletes={"b"})
+    assert root.depth == 0
+    assert s2.depth == 2
+    assert root.to_dict() == {"a": 1, "b": 2}
+    assert s1.to_dict() == {"a": 1, "b": 2, "c": 3}
+    assert s2.to_dict() == {"a": 10, "c": 3}
+
+
+def test_snapshot_apply_to(snapshot_cls) -> None:  # noqa: ANN001
+    obj = object()
+    root = snapshot_cls(writes={"obj": obj})
+    s1 = snapshot_cls(parent=root, writes={"x": 1})
+    target = {}
+    s1.apply_to(target)
+    assert target == {"obj": obj, "x": 1}
+    # values are shared, not copied.
+    assert target["obj"] is obj
+
+
+def test_snapshot_branch(snapshot_cls) -> None:  # noqa: ANN001
+    root = snapshot_cls(writes={"a": 1})
+    s1 = snapshot_cls(parent=root, writes={"b": 2})
+    # re-executing a cell creates a new branch, the old layer is unchanged.
+    s1_new = snapshot_cls(parent=root, writes={"b": 3})
+    assert s1.to_dict() == {"a": 1, "b": 2}
+    assert s1_new.to_dict() == {"a": 1, "b": 3}
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Any, Dict, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.code import result_store
+
+
+class _Sfa:
+    def __init__(self) -> None:
+        self.files: Dict[str, str] = {}
+
+    def exists(self, uri: str) -> bool:
+        return uri in self.files
+
+    def read_text_file(self, uri: str) -> str:
+        return self.files[uri]
+
+    def write_text_file(self, uri: str, text: str, mode: str) -> None:
+        self.files[uri] = text
+
+    def delete_file(self, uri: str) -> None:
+        del self.files[uri]
+
+
+class _Src:
+    def __init__(self, source_code: str, data: Dict[str, Any]) -> None:
+        self.uri = "vnd.sun.star.tdoc:/1/Scripts/python/0/1/2.py"
+        self.unique_id = "id_1"
+        self.source_code = source_code
+        self.is_executed = True
+        self.is_error = False
+        self.is_volatile = False
+        self.sheet_inputs: Dict[Any, Any] = {}
+        self.cell_inputs: set = set()
+        self.mod_writes = {"x": 1}
+        self.mod_deletes: set = set()
+        self.dd_data = data
+
+
+@pytest.fixture
+def store(build_setup, mocker):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import result_store
+
+    mgr = mocker.Mock(sfa=_Sfa())
+    return result_store.ResultStore(mgr, mocker.Mock()), mgr.sfa
+
+
+def test_save_load(store: Any) -> None:  # noqa: ANN401
+    inst, sfa = store
+    py_src = _Src("x = 1", {"data": 1, "data_type": "int"})
+    assert inst.save(py_src)
+    stored = inst.load(py_src)
+    assert stored is not None
+    assert stored.writes == {"x": 1}
+    assert stored.data["data"] == 1
+
+
+def test_file_result_not_stored(store: Any) -> None:  # noqa: ANN401
+    inst, sfa = store
+    py_src = _Src("lp_plot()", {"data": "/tmp/fig.svg", "data_type": "file"})
+    # a figure is a temp file of the session, the cell is executed again on load.
+    assert inst.save(py_src) is False
+    assert not sfa.files
+    assert inst.load(py_src) is None
+
+
+def test_changed_source_not_unpickled(store: Any, mocker: Any) -> None:  # noqa: ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.code import result_store
+
+    inst, sfa = store
+    py_src = _Src("x = 1", {"data": 1, "data_type": "int"})
+    assert inst.save(py_src)
+    loads = mocker.spy(result_store.pickle, "loads")
+    py_src.source_code = "x = 2"
+    assert inst.load(py_src) is None
+    loads.assert_not_called()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from datetime import datetime, timedelta
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.convert.convert_util import ConvertUtil
+
+EPOCH = datetime(1899, 12, 30)
+
+
+@pytest.fixture(scope="module")
+def convert_util(build_setup):  # noqa: ANN001, ANN201
+    pytest.importorskip("pandas")
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.convert.convert_util import ConvertUtil
+    return ConvertUtil
+
+
+def test_lo_dates_to_pandas(convert_util) -> None:  # noqa: ANN001
+    import numpy as np
+    import pandas as pd
+
+    values = [45000.5, np.nan, "", 1.0 / 3.0, 0.0]
+    result = convert_util.lo_dates_to_pandas(pd.Series(values, name="dt"), EPOCH)
+    assert result.name == "dt"
+    assert pd.api.types.is_datetime64_any_dtype(result)
+    assert result[0] == pd.Timestamp(EPOCH + timedelta(days=45000.5))
+    assert result[3] == pd.Timestamp(EPOCH + timedelta(days=1.0 / 3.0))
+    assert result[4] == pd.Timestamp(EPOCH)
+    assert pd.isna(result[1])
+    assert pd.isna(result[2])
+
+
+def test_pandas_dates_to_lo(convert_util) -> None:  # noqa: ANN001
+    import pandas as pd
+
+    dates = pd.Series(pd.to_datetime(["2023-03-15 12:00", None, "1899-12-30 00:00"]))
+    result = convert_util.pandas_dates_to_lo(dates, EPOCH)
+    assert result[0] == 45000.5
+    assert pd.isna(result[1])
+    assert result[2] == 0.0
+    assert convert_util.pandas_timestamp_to_lo_num(pd.Timestamp("2023-03-15 18:00"), EPOCH) == 45000.75
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.utils.pandas_util import PandasUtil
+
+
+@pytest.fixture(scope="module")
+def pandas_util(build_setup):  # noqa: ANN001, ANN201
+    pytest.importorskip("pandas")
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.utils.pandas_util import PandasUtil
+    return PandasUtil
+
+
+def test_df_to_calc_array(pandas_util) -> None:  # noqa: ANN001
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "b": [1.5, np.nan],
+            "c": ["x", None],
+            "d": pd.to_datetime(["2023-03-15 12:00", None]),
+        }
+    )
+    result = pandas_util.pandas_to_calc_array(df)
+    assert result == (("a", "b", "c", "d"), (1, 1.5, "x", 45000.5), (2, "", "", ""))
+    assert isinstance(result[1][0], int)
+
+    result = pandas_util.pandas_to_calc_array(df.set_index("c"))
+    assert result == (("", "a", "b", "d"), ("x", 1, 1.5, 45000.5), ("", 2, "", ""))
+
+
+def test_df_to_calc_array_no_headers(pandas_util) -> None:  # noqa: ANN001
+    import pandas as pd
+
+    assert pandas_util.pandas_to_calc_array(pd.DataFrame([[1, 2], [3, 4]])) == ((1, 2), (3, 4))
+    assert pandas_util.pandas_to_calc_array(pd.DataFrame({"a": []})) == (("a",),)
+
+
+def test_series_to_calc_array(pandas_util) -> None:  # noqa: ANN001
+    import pandas as pd
+
+    ds = pd.Series([1.5, None], index=pd.to_datetime(["2023-03-15 12:00", "2023-01-01 00:00"]), name="val")
+    assert pandas_util.pandas_series_to_calc_array(ds) == (("", "val"), (45000.5, 1.5), (44927.0, ""))
+
+
+def test_multi_index_to_calc_array(pandas_util) -> None:  # noqa: ANN001
+    import pandas as pd
+
+    df = pd.DataFrame({"k1": ["a", "a", "b"], "k2": [1, 2, 1], "v": [1.0, 2.0, 3.0]})
+    grouped = df.groupby(["k1", "k2"]).sum()
+    assert pandas_util.pandas_to_calc_array(grouped) == (
+        ("", "v"),
+        ("('a', 1)", 1.0),
+        ("('a', 2)", 2.0),
+        ("('b', 1)", 3.0),
+    )
+    assert pandas_util.pandas_series_to_calc_array(grouped["v"]) == (
+        ("", "v"),
+        ("('a', 1)", 1.0),
+        ("('a', 2)", 2.0),
+        ("('b', 1)", 3.0),
+    )
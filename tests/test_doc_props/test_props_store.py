@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Any, Dict, List, TYPE_CHECKING
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.doc_props import props_store
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.writes: List[Dict[str, Any]] = []
+
+    def __call__(self, data: Dict[str, Any]) -> None:
+        self.writes.append(data)
+
+
+@pytest.fixture
+def store(singleton_doc, mocker):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.doc_props import props_store
+
+    mocker.patch.object(props_store, "FLUSH_DELAY", 60.0)
+    inst = singleton_doc(props_store.PropsStore, "props_store")
+    yield inst
+    inst.cancel()
+
+
+def test_read_once(store: Any) -> None:  # noqa: ANN401
+    reads = []
+
+    def loader() -> Dict[str, Any]:
+        reads.append(1)
+        return {"log_level": 20}
+
+    assert store.get_data("props.json", loader) == {"log_level": 20}
+    assert store.get_data("props.json", loader) is store.get_data("props.json", loader)
+    assert len(reads) == 1
+
+
+def test_sets_written_once(store: Any) -> None:  # noqa: ANN401
+    writer = _Writer()
+    store.get_data("props.json", lambda: {"log_level": 20})
+    store.update("props.json", {"log_level": 20}, writer)
+    assert not store.is_dirty
+
+    store.update("props.json", {"log_level": 10}, writer)
+    store.update("props.json", {"log_format": "%(message)s"}, writer)
+    store.remove("props.json", "missing", writer)
+    assert store.is_dirty
+    assert writer.writes == []
+
+    count = store.write_count
+    store.flush()
+    assert writer.writes == [{"log_level": 10, "log_format": "%(message)s"}]
+    assert store.write_count == count + 1
+
+    store.flush()
+    assert store.write_count == count + 1
+
+
+def test_remove(store: Any) -> None:  # noqa: ANN401
+    writer = _Writer()
+    store.get_data("props.json", lambda: {"log_level": 20})
+    store.remove("props.json", "log_level", writer)
+    store.flush()
+    assert writer.writes == [{}]
+
+
+def test_flush_on_doc_closing(store: Any, mocker: Any) -> None:  # noqa: ANN401
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.doc_props import props_store
+
+    writer = _Writer()
+    store.get_data("props.json", lambda: {"log_level": 20})
+    store.update("props.json", {"log_level": 10}, writer)
+    event = mocker.Mock()
+    event.event_data.uid = "props_store_test"
+    props_store._on_doc_closing(None, event)
+    assert writer.writes == [{"log_level": 10}]
+    assert not store.is_dirty
@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import Any, List, TYPE_CHECKING
+import threading
+
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.pythonpath.libre_pythonista_lib.multi_process import request_tracker
+
+
+@pytest.fixture
+def tracker(build_setup):  # noqa: ANN001, ANN201
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.multi_process import request_tracker
+
+    done: List[Any] = []
+    inst = request_tracker.RequestTracker(done.append, timeout=0)
+    return inst, done
+
+
+def test_resolve(tracker: Any) -> None:  # noqa: ANN401
+    inst, done = tracker
+    request = inst.create("insert_range", msg_id="m1")
+    assert inst.pending_count == 1
+    assert request.is_done is False
+    assert done == []
+
+    assert inst.resolve(request.request_id, {"status": "success"})
+    assert done == [request]
+    assert request.is_done
+    assert request.result == {"status": "success"}
+    assert request.msg_id == "m1"
+    assert inst.pending_count == 0
+    # a request is completed only once.
+    assert inst.resolve(request.request_id, {"status": "error"}) is False
+    assert done == [request]
+    assert request.result == {"status": "success"}
+
+
+def test_timeout(build_setup) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.multi_process import request_tracker
+
+    event = threading.Event()
+    done: List[Any] = []
+
+    def on_done(request: Any) -> None:  # noqa: ANN401
+        done.append(request)
+        event.set()
+
+    inst = request_tracker.RequestTracker(on_done, timeout=0.05)
+    request = inst.create("insert_range", timeout_result="timeout")
+    assert event.wait(5.0)
+    assert done == [request]
+    assert request.result == "timeout"
+    assert inst.pending_count == 0
+
+
+def test_resolve_action_order(tracker: Any) -> None:  # noqa: ANN401
+    inst, done = tracker
+    first = inst.create("insert_range")
+    other = inst.create("insert_lp_function")
+    second = inst.create("insert_range")
+
+    # the oldest request of the action is completed first.
+    assert inst.resolve_action("insert_range", 1)
+    assert done == [first]
+    assert inst.resolve_action("insert_range", 2)
+    assert done == [first, second]
+    assert inst.resolve_action("insert_range", 3) is False
+    assert other.is_done is False
+    assert (first.result, second.result) == (1, 2)
+
+
+def test_cancel_all(tracker: Any) -> None:  # noqa: ANN401
+    inst, done = tracker
+    requests = [inst.create("insert_range"), inst.create("insert_lp_function")]
+    inst.cancel_all("aborted")
+    assert done == requests
+    assert all(request.result == "aborted" for request in requests)
+    assert inst.pending_count == 0
+
+
+def test_on_done_error(build_setup) -> None:  # noqa: ANN001
+    if not TYPE_CHECKING:
+        from libre_pythonista_lib.multi_process import request_tracker
+
+    def on_done(request: Any) -> None:  # noqa: ANN401
+        raise RuntimeError("send failed")
+
+    inst = request_tracker.RequestTracker(on_done, timeout=0)
+    request = inst.create("insert_range")
+    # an error in on_done does not leave the request pending.
+    assert inst.resolve(request.request_id, 1)
+    assert request.is_done
+    assert inst.pending_count == 0